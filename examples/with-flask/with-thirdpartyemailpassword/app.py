@@ -35,7 +35,11 @@ def get_website_domain():
 
 
 init(
-    supertokens_config=SupertokensConfig(connection_uri="https://try.supertokens.io"),
+    supertokens_config=SupertokensConfig(
+        connection_uri=os.environ.get(
+            "SUPERTOKENS_CONNECTION_URI", "https://try.supertokens.io"
+        )
+    ),
     app_info=InputAppInfo(
         app_name="Supertokens",
         api_domain="http://localhost:" + get_api_port(),
@@ -59,6 +59,8 @@ extras_require = {
             "tzdata==2021.5",
         ]
     ),
+    "opentelemetry": (["opentelemetry-api>=1.12.0"]),
+    "orjson": (["orjson>=3.6.0"]),
 }
 
 exclude_list = [
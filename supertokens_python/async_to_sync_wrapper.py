@@ -13,7 +13,9 @@
 # under the License.
 
 import asyncio
-from typing import Any, Coroutine, TypeVar
+import threading
+from contextvars import ContextVar
+from typing import Any, Coroutine, Optional, TypeVar
 from os import getenv
 
 _T = TypeVar("_T")
@@ -23,6 +25,36 @@ def nest_asyncio_enabled():
     return getenv("SUPERTOKENS_NEST_ASYNCIO", "") == "1"
 
 
+def background_event_loop_enabled():
+    return getenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "") == "1"
+
+
+def sync_http_client_enabled():
+    return getenv("SUPERTOKENS_SYNC_HTTP_CLIENT", "") == "1"
+
+
+background_event_loop: Optional[asyncio.AbstractEventLoop] = None
+background_event_loop_lock = threading.Lock()
+
+
+def get_background_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop running in a long lived daemon thread, starting it if
+    needed. When SUPERTOKENS_BACKGROUND_EVENT_LOOP=1, all sync calls run on this loop,
+    so state bound to a loop (like refreshes being coalesced) is shared by all the
+    threads of the app instead of each thread using its own loop.
+    """
+    global background_event_loop
+    with background_event_loop_lock:
+        if background_event_loop is None or background_event_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="supertokens-event-loop", daemon=True
+            ).start()
+            background_event_loop = loop
+        return background_event_loop
+
+
 def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
     try:
         return asyncio.get_event_loop()
@@ -40,6 +72,57 @@ def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
         raise ex
 
 
+sync_http_client_task: ContextVar[Optional["asyncio.Task[Any]"]] = ContextVar(
+    "sync_http_client_task", default=None
+)
+
+
+def is_using_sync_http_client() -> bool:
+    """
+    Returns True if the calling code is the coroutine passed to `sync` with
+    SUPERTOKENS_SYNC_HTTP_CLIENT=1 (and not a task started by it), in which case the
+    querier makes core requests using the pooled sync HTTP client. Tasks started by the
+    coroutine keep using the async client, so that they can still run concurrently.
+
+    Only the HTTP client changes: the coroutine is still run on the thread's event loop,
+    so recipe functions and overrides can keep using asyncio.
+    """
+    task = sync_http_client_task.get()
+    return task is not None and task is asyncio.current_task()
+
+
+async def run_with_sync_http_client(co: Coroutine[Any, Any, _T]) -> _T:
+    token = sync_http_client_task.set(asyncio.current_task())
+    try:
+        return await co
+    finally:
+        sync_http_client_task.reset(token)
+
+
 def sync(co: Coroutine[Any, Any, _T]) -> _T:
+    if sync_http_client_enabled() and background_event_loop_enabled():
+        co.close()
+        raise Exception(
+            "SUPERTOKENS_SYNC_HTTP_CLIENT and SUPERTOKENS_BACKGROUND_EVENT_LOOP cannot both be set. Please set only one of them."
+        )
+    if sync_http_client_enabled():
+        # Runs on the thread's event loop, since the core requests block the loop
+        # running the coroutine, which must not be shared with other threads.
+        co = run_with_sync_http_client(co)
+    elif background_event_loop_enabled():
+        loop = get_background_event_loop()
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            co.close()
+            raise Exception(
+                "Cannot call a syncio function from code running on the SuperTokens event loop. Please use the asyncio functions instead."
+            )
+        # The coroutine runs in a copy of the calling thread's context, so context
+        # locals (like flask.g) are still available to it.
+        return asyncio.run_coroutine_threadsafe(co, loop).result()
+
     loop = create_or_get_event_loop()
     return loop.run_until_complete(co)
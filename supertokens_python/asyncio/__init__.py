@@ -11,7 +11,9 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Dict, List, Optional, Union, Any
+from typing import AsyncIterator, Dict, List, Optional, Union, Any
+
+from typing_extensions import Literal
 
 from supertokens_python import Supertokens
 from supertokens_python.interfaces import (
@@ -24,7 +26,7 @@ from supertokens_python.interfaces import (
     UserIdMappingAlreadyExistsError,
     UserIDTypes,
 )
-from supertokens_python.types import UsersResponse
+from supertokens_python.types import User, UsersResponse
 
 
 async def get_users_oldest_first(
@@ -65,6 +67,28 @@ async def get_users_newest_first(
     )
 
 
+def iterate_users(
+    tenant_id: str,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: int = 100,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[User]:
+    """
+    Iterates over all the users of the tenant (`async for user in iterate_users(...)`),
+    fetching them `page_size` at a time and prefetching the next page.
+    """
+    return Supertokens.get_instance().iterate_users(
+        tenant_id,
+        time_joined_order,
+        page_size,
+        include_recipe_ids,
+        query,
+        user_context,
+    )
+
+
 async def get_user_count(
     include_recipe_ids: Union[None, List[str]] = None,
     tenant_id: Optional[str] = None,
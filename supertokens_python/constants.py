@@ -30,3 +30,4 @@ API_VERSION_HEADER = "cdi-version"
 DASHBOARD_VERSION = "0.7"
 ONE_YEAR_IN_MS = 31536000000
 RATE_LIMIT_STATUS_CODE = 429
+DEFAULT_MAX_REQUEST_BODY_SIZE = 1024 * 1024  # 1 MiB
@@ -30,6 +30,12 @@ def raise_bad_input_exception(msg: str) -> NoReturn:
     raise BadInputError(msg)
 
 
+def raise_request_body_too_large_exception(max_size: int) -> NoReturn:
+    raise RequestBodyTooLargeError(
+        f"Request body is larger than the allowed {max_size} bytes"
+    )
+
+
 class SuperTokensError(Exception):
     pass
 
@@ -40,3 +46,7 @@ class GeneralError(SuperTokensError):
 
 class BadInputError(SuperTokensError):
     pass
+
+
+class RequestBodyTooLargeError(BadInputError):
+    pass
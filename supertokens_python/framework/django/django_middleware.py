@@ -18,6 +18,15 @@ from typing import Any, Union
 
 from asgiref.sync import async_to_sync
 
+from supertokens_python.async_to_sync_wrapper import sync, sync_http_client_enabled
+
+
+def run_sync(func: Any, *args: Any) -> Any:
+    if sync_http_client_enabled():
+        # Runs on the calling thread's loop, with the sync HTTP client (see sync)
+        return sync(func(*args))
+    return async_to_sync(func)(*args)
+
 
 def middleware(get_response: Any):
     from supertokens_python import Supertokens
@@ -74,8 +83,8 @@ def middleware(get_response: Any):
         user_context = default_user_context(custom_request)
 
         try:
-            result: Union[DjangoResponse, None] = async_to_sync(st.middleware)(
-                custom_request, response, user_context
+            result: Union[DjangoResponse, None] = run_sync(
+                st.middleware, custom_request, response, user_context
             )
 
             if result is None:
@@ -91,9 +100,13 @@ def middleware(get_response: Any):
 
         except SuperTokensError as e:
             response = DjangoResponse(HttpResponse())
-            result: Union[DjangoResponse, None] = async_to_sync(
-                st.handle_supertokens_error
-            )(DjangoRequest(request), e, response, user_context)
+            result: Union[DjangoResponse, None] = run_sync(
+                st.handle_supertokens_error,
+                DjangoRequest(request),
+                e,
+                response,
+                user_context,
+            )
             if result is not None:
                 return result.response
         raise Exception("Should never come here")
@@ -13,11 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, Dict, Union
 from urllib.parse import parse_qsl
 
 from supertokens_python.framework.request import BaseRequest
+from supertokens_python.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
@@ -40,12 +40,23 @@ class DjangoRequest(BaseRequest):
     def get_query_params(self) -> Dict[str, Any]:
         return self.request.GET.dict()
 
+    def get_body(self) -> bytes:
+        content_length = self.request.META.get("CONTENT_LENGTH")
+        if isinstance(content_length, str) and content_length.isdigit():
+            self.check_body_size(int(content_length))
+        body = self.request.body
+        self.check_body_size(len(body))
+        return body
+
     async def json(self) -> Union[Any, None]:
-        try:
-            body = json.loads(self.request.body)
-            return body
-        except Exception:
-            return {}
+        if not self.is_json_parsed:
+            body = self.get_body()
+            try:
+                self.parsed_json = get_json_codec().loads(body)
+            except Exception:
+                self.parsed_json = {}
+            self.is_json_parsed = True
+        return self.parsed_json
 
     def method(self) -> str:
         if self.request.method is None:
@@ -89,4 +100,6 @@ class DjangoRequest(BaseRequest):
         return self.request.path
 
     async def form_data(self):
-        return dict(parse_qsl(self.request.body.decode("utf-8")))
+        if self.parsed_form_data is None:
+            self.parsed_form_data = dict(parse_qsl(self.get_body().decode("utf-8")))
+        return self.parsed_form_data
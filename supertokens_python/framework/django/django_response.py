@@ -11,12 +11,12 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import json
 from datetime import datetime
 from math import ceil
 from typing import Any, Dict, Optional
 
 from supertokens_python.framework.response import BaseResponse
+from supertokens_python.json_codec import get_json_codec
 
 
 class DjangoResponse(BaseResponse):
@@ -78,13 +78,11 @@ class DjangoResponse(BaseResponse):
         del self.response[key]
 
     def set_json_content(self, content: Dict[str, Any]):
+        if not self.response_sent:
+            self.set_raw_json_content(get_json_codec().dumps(content))
+
+    def set_raw_json_content(self, content: bytes):
         if not self.response_sent:
             self.set_header("Content-Type", "application/json; charset=utf-8")
-            self.response.content = json.dumps(
-                content,
-                ensure_ascii=False,
-                allow_nan=False,
-                indent=None,
-                separators=(",", ":"),
-            ).encode("utf-8")
+            self.response.content = content
             self.response_sent = True
@@ -13,10 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from urllib.parse import parse_qsl
 
 from supertokens_python.framework.request import BaseRequest
+from supertokens_python.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
@@ -27,6 +28,7 @@ class FastApiRequest(BaseRequest):
     def __init__(self, request: Request):
         super().__init__()
         self.request = request
+        self.body: Optional[bytes] = None
 
     def get_original_url(self) -> str:
         return self.request.url.components.geturl()
@@ -39,11 +41,40 @@ class FastApiRequest(BaseRequest):
     def get_query_params(self) -> Dict[str, Any]:
         return dict(self.request.query_params.items())  # type: ignore
 
+    async def get_body(self) -> bytes:
+        if self.body is not None:
+            return self.body
+
+        content_length = self.request.headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            self.check_body_size(int(content_length))
+            # The server doesn't pass on more than content-length bytes, so the body
+            # can be read (and kept for the app by starlette) in one go
+            body = await self.request.body()
+        else:
+            # Chunked bodies have no content-length, so we stop reading as soon as the
+            # body goes over the limit
+            chunks: List[bytes] = []
+            size = 0
+            async for chunk in self.request.stream():
+                size += len(chunk)
+                self.check_body_size(size)
+                chunks.append(chunk)
+            body = b"".join(chunks)
+        self.check_body_size(len(body))
+
+        self.body = body
+        return body
+
     async def json(self) -> Union[Any, None]:
-        try:
-            return await self.request.json()
-        except Exception:
-            return {}
+        if not self.is_json_parsed:
+            body = await self.get_body()
+            try:
+                self.parsed_json = get_json_codec().loads(body)
+            except Exception:
+                self.parsed_json = {}
+            self.is_json_parsed = True
+        return self.parsed_json
 
     def method(self) -> str:
         return self.request.method
@@ -73,4 +104,7 @@ class FastApiRequest(BaseRequest):
         return url[url.startswith(root_path) and len(root_path) :]
 
     async def form_data(self):
-        return dict(parse_qsl((await self.request.body()).decode("utf-8")))
+        if self.parsed_form_data is None:
+            body = await self.get_body()
+            self.parsed_form_data = dict(parse_qsl(body.decode("utf-8")))
+        return self.parsed_form_data
@@ -13,9 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from supertokens_python.framework.request import BaseRequest
+from supertokens_python.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
@@ -26,6 +28,7 @@ class FlaskRequest(BaseRequest):
     def __init__(self, req: Request):
         super().__init__()
         self.request = req
+        self.body: Optional[bytes] = None
 
     def get_original_url(self) -> str:
         return self.request.url
@@ -36,11 +39,35 @@ class FlaskRequest(BaseRequest):
     def get_query_params(self) -> Dict[str, Any]:
         return self.request.args.to_dict()
 
+    def get_body(self) -> bytes:
+        if self.body is not None:
+            return self.body
+
+        content_length = self.request.content_length
+        if content_length is not None:
+            # Checking the content-length first means we don't read oversized bodies at
+            # all. The stream doesn't return more than content-length bytes, so the body
+            # can be read (and kept for the app by werkzeug) in one go.
+            self.check_body_size(content_length)
+            body = self.request.get_data(cache=True)
+        else:
+            # Chunked bodies have no content-length, so we read at most one byte more
+            # than the limit
+            body = self.request.stream.read(self.get_max_body_size() + 1)
+        self.check_body_size(len(body))
+
+        self.body = body
+        return body
+
     async def json(self) -> Union[Any, None]:
-        try:
-            return self.request.get_json()
-        except Exception:
-            return {}
+        if not self.is_json_parsed:
+            body = self.get_body()
+            try:
+                self.parsed_json = get_json_codec().loads(body)
+            except Exception:
+                self.parsed_json = {}
+            self.is_json_parsed = True
+        return self.parsed_json
 
     def method(self) -> str:
         if isinstance(self.request, dict):
@@ -80,4 +107,21 @@ class FlaskRequest(BaseRequest):
         return self.request.base_url
 
     async def form_data(self) -> Dict[str, Any]:
-        return self.request.form.to_dict()
+        if self.parsed_form_data is None:
+            body = self.get_body()
+            if self.request.content_length is not None:
+                # werkzeug parses the form from the body cached by get_data
+                self.parsed_form_data = self.request.form.to_dict()
+            else:
+                # Chunked bodies were read from the stream, so werkzeug can't read them
+                # again
+                from werkzeug.formparser import FormDataParser
+
+                _, form, _ = FormDataParser().parse(
+                    BytesIO(body),
+                    self.request.mimetype,
+                    len(body),
+                    self.request.mimetype_params,
+                )
+                self.parsed_form_data = form.to_dict()
+        return self.parsed_form_data
@@ -11,10 +11,10 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import json
 from typing import Any, Dict, List, Optional
 
 from supertokens_python.framework.response import BaseResponse
+from supertokens_python.json_codec import get_json_codec
 
 
 class FlaskResponse(BaseResponse):
@@ -75,13 +75,11 @@ class FlaskResponse(BaseResponse):
         return self.response.headers
 
     def set_json_content(self, content: Dict[str, Any]):
+        if not self.response_sent:
+            self.set_raw_json_content(get_json_codec().dumps(content))
+
+    def set_raw_json_content(self, content: bytes):
         if not self.response_sent:
             self.set_header("Content-Type", "application/json; charset=utf-8")
-            self.response.data = json.dumps(
-                content,
-                ensure_ascii=False,
-                allow_nan=False,
-                indent=None,
-                separators=(",", ":"),
-            ).encode("utf-8")
+            self.response.data = content
             self.response_sent = True
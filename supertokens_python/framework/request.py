@@ -14,16 +14,71 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from urllib.parse import unquote
+
+from supertokens_python.exceptions import raise_request_body_too_large_exception
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
 
 
+def parse_cookie_string_allow_duplicates(cookie_string: str) -> Dict[str, List[str]]:
+    cookies: Dict[str, List[str]] = {}
+    cookie_pairs = cookie_string.split(";")
+    for cookie_pair in cookie_pairs:
+        name_value = cookie_pair.split("=")
+        if len(name_value) != 2:
+            continue
+        name, value = unquote(name_value[0].strip()), unquote(name_value[1].strip())
+        if name in cookies:
+            cookies[name].append(value)
+        else:
+            cookies[name] = [value]
+    return cookies
+
+
 class BaseRequest(ABC):
     def __init__(self):
         self.wrapper_used = True
         self.request = None
+        self.parsed_cookies: Optional[Dict[str, List[str]]] = None
+        self.parsed_json: Optional[Any] = None
+        # Separate from parsed_json, since a body of `null` is parsed as None
+        self.is_json_parsed = False
+        self.parsed_form_data: Optional[Dict[str, Any]] = None
+
+    def get_max_body_size(self) -> int:  # pylint: disable=no-self-use
+        from supertokens_python.supertokens import Supertokens
+
+        return Supertokens.get_max_request_body_size()
+
+    def check_body_size(self, size: Optional[int]):
+        """
+        Raises a RequestBodyTooLargeError (sent as a 413 response) if size is above the
+        max_request_body_size passed to supertokens.init. Framework request wrappers call
+        this with the content-length header before reading the body and with the size
+        read so far while reading it, so oversized bodies are never fully read or parsed.
+        """
+        if size is None:
+            return
+        max_size = self.get_max_body_size()
+        if size > max_size:
+            raise_request_body_too_large_exception(max_size)
+
+    def get_cookies_allow_duplicates(self) -> Dict[str, List[str]]:
+        """
+        Returns all the cookies from the cookie header of the request, keeping every value
+        if a cookie name is repeated. The header is parsed only once per request.
+        """
+        if self.parsed_cookies is None:
+            cookie_string = self.get_header("cookie")
+            self.parsed_cookies = (
+                parse_cookie_string_allow_duplicates(cookie_string)
+                if cookie_string is not None
+                else {}
+            )
+        return self.parsed_cookies
 
     @abstractmethod
     def get_original_url(self) -> str:
@@ -41,11 +96,17 @@ class BaseRequest(ABC):
 
     @abstractmethod
     async def json(self) -> Union[Any, None]:
-        pass
+        """
+        Returns the parsed JSON body, or {} if it is not valid JSON. The body is parsed
+        once and the same object is returned on every call.
+        """
 
     @abstractmethod
     async def form_data(self) -> Dict[str, Any]:
-        pass
+        """
+        Returns the parsed form body. The body is parsed once and the same object is
+        returned on every call.
+        """
 
     @abstractmethod
     def method(self) -> str:
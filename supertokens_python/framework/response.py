@@ -15,6 +15,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+from supertokens_python.json_codec import get_json_codec
+
 
 class BaseResponse(ABC):
     @abstractmethod
@@ -58,6 +60,14 @@ class BaseResponse(ABC):
     def set_json_content(self, content: Dict[str, Any]):
         pass
 
+    def set_raw_json_content(self, content: bytes):
+        """
+        Sets an already serialised JSON body on the response. This lets callers
+        that serve the same payload repeatedly skip re-serialising it. Responses which
+        don't override it parse the body and use `set_json_content`.
+        """
+        self.set_json_content(get_json_codec().loads(content))
+
     @abstractmethod
     def set_html_content(self, content: str):
         pass
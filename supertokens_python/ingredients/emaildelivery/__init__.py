@@ -12,21 +12,31 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfigWithService,
     EmailDeliveryInterface,
 )
+from supertokens_python.instrumentation import start_span
 
 _T = TypeVar("_T")
 
 
+class InstrumentedEmailDelivery(EmailDeliveryInterface[_T]):
+    def __init__(self, service: EmailDeliveryInterface[_T]) -> None:
+        self.service = service
+
+    async def send_email(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        with start_span("email_delivery", {"template": type(template_vars).__name__}):
+            await self.service.send_email(template_vars, user_context)
+
+
 class EmailDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: EmailDeliveryInterface[_T]
 
     def __init__(self, config: EmailDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+        self.ingredient_interface_impl = InstrumentedEmailDelivery(
             config.service
             if config.override is None
             else config.override(config.service)
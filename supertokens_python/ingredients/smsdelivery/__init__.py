@@ -12,21 +12,31 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.smsdelivery.types import (
     SMSDeliveryConfigWithService,
     SMSDeliveryInterface,
 )
+from supertokens_python.instrumentation import start_span
 
 _T = TypeVar("_T")
 
 
+class InstrumentedSMSDelivery(SMSDeliveryInterface[_T]):
+    def __init__(self, service: SMSDeliveryInterface[_T]) -> None:
+        self.service = service
+
+    async def send_sms(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        with start_span("sms_delivery", {"template": type(template_vars).__name__}):
+            await self.service.send_sms(template_vars, user_context)
+
+
 class SMSDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: SMSDeliveryInterface[_T]
 
     def __init__(self, config: SMSDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+        self.ingredient_interface_impl = InstrumentedSMSDelivery(
             config.service
             if config.override is None
             else config.override(config.service)
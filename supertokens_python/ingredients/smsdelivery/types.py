@@ -12,10 +12,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, TypeVar, Union
 
-from twilio.rest import Client  # type: ignore
+if TYPE_CHECKING:
+    from twilio.rest import Client  # type: ignore
 
 _T = TypeVar("_T")
 
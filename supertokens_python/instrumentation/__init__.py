@@ -0,0 +1,145 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Hooks for collecting metrics and traces of the work done by the SDK.
+
+Register an `InstrumentationListener` using `add_listener` to be notified of:
+
+- Spans (timed operations): `core_request` (method, url, status_code),
+  `jwks_fetch` (url), `access_token_verification`, `claim_fetch` (claim),
+  `email_delivery` (template) and `sms_delivery` (template).
+- Events: `core_request_rate_limited` (method, path, host, retries_left),
+  `core_request_retry` (method, path, error), and `cache` (cache, hit) for the `jwks`,
+  `core_call_cache`, `user_metadata`, `user_roles`, `email_verification` and
+  `email_for_user_id` caches.
+
+When no listener is registered, instrumenting an operation only costs a function call.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type, Union
+
+from supertokens_python.logger import log_debug_message
+
+
+class Span:
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.start_time = perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        # Can be used by listeners to keep state between on_span_start and on_span_end
+        self.listener_data: Dict[int, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        self.duration_ms = (perf_counter() - self.start_time) * 1000
+        self.error = error
+        for listener in listeners:
+            try:
+                listener.on_span_end(self)
+            except Exception as e:
+                log_debug_message("Instrumentation listener failed: %s", e)
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.end(exc)
+
+
+class NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+    def __enter__(self) -> NoopSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class InstrumentationListener:
+    """
+    Receives the spans and events of the SDK. All the methods do nothing by default, so
+    listeners only need to override the ones they use. They are called synchronously, so
+    they should return quickly.
+    """
+
+    def on_span_start(self, span: Span) -> None:
+        pass
+
+    def on_span_end(self, span: Span) -> None:
+        pass
+
+    def on_event(self, name: str, attributes: Dict[str, Any]) -> None:
+        pass
+
+
+listeners: List[InstrumentationListener] = []
+
+
+def add_listener(listener: InstrumentationListener) -> None:
+    listeners.append(listener)
+
+
+def remove_listener(listener: InstrumentationListener) -> None:
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def start_span(name: str, attributes: Dict[str, Any]) -> Union[Span, NoopSpan]:
+    """
+    Starts a span, which should be ended using `end` or by using it as a context manager.
+    """
+    if not listeners:
+        return NOOP_SPAN
+
+    span = Span(name, attributes)
+    for listener in listeners:
+        try:
+            listener.on_span_start(span)
+        except Exception as e:
+            log_debug_message("Instrumentation listener failed: %s", e)
+    return span
+
+
+def record_event(name: str, attributes: Dict[str, Any]) -> None:
+    for listener in listeners:
+        try:
+            listener.on_event(name, attributes)
+        except Exception as e:
+            log_debug_message("Instrumentation listener failed: %s", e)
@@ -0,0 +1,98 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Reports the spans and events of the SDK to OpenTelemetry. Requires `opentelemetry-api`:
+
+    from supertokens_python.instrumentation import add_listener
+    from supertokens_python.instrumentation.opentelemetry import OpenTelemetryListener
+
+    add_listener(OpenTelemetryListener())
+
+Spans are reported as OpenTelemetry spans named `supertokens.<name>`, and their durations
+(in ms) as histograms with the same name. Events are reported as counters.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.trace import Status, StatusCode, TracerProvider
+
+from supertokens_python.constants import VERSION
+
+from . import InstrumentationListener, Span
+
+INSTRUMENTATION_NAME = "supertokens_python"
+
+
+def get_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "supertokens." + key: value
+        for key, value in attributes.items()
+        if isinstance(value, (str, bool, int, float))
+    }
+
+
+class OpenTelemetryListener(InstrumentationListener):
+    def __init__(
+        self,
+        tracer_provider: Optional[TracerProvider] = None,
+        meter_provider: Optional[MeterProvider] = None,
+    ):
+        self.tracer = trace.get_tracer(
+            INSTRUMENTATION_NAME, VERSION, tracer_provider=tracer_provider
+        )
+        self.meter = metrics.get_meter(
+            INSTRUMENTATION_NAME, VERSION, meter_provider=meter_provider
+        )
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, Counter] = {}
+
+    def get_histogram(self, name: str) -> Histogram:
+        if name not in self.histograms:
+            self.histograms[name] = self.meter.create_histogram(
+                "supertokens." + name + ".duration", unit="ms"
+            )
+        return self.histograms[name]
+
+    def get_counter(self, name: str) -> Counter:
+        if name not in self.counters:
+            self.counters[name] = self.meter.create_counter("supertokens." + name)
+        return self.counters[name]
+
+    def on_span_start(self, span: Span) -> None:
+        span.listener_data[id(self)] = self.tracer.start_span(
+            "supertokens." + span.name, attributes=get_otel_attributes(span.attributes)
+        )
+
+    def on_span_end(self, span: Span) -> None:
+        attributes = get_otel_attributes(span.attributes)
+        if span.error is not None:
+            attributes["error.type"] = type(span.error).__name__
+
+        otel_span: Optional[trace.Span] = span.listener_data.pop(id(self), None)
+        if otel_span is not None:
+            otel_span.set_attributes(attributes)
+            if span.error is not None:
+                otel_span.record_exception(span.error)
+                otel_span.set_status(Status(StatusCode.ERROR, str(span.error)))
+            otel_span.end()
+
+        if span.duration_ms is not None:
+            self.get_histogram(span.name).record(span.duration_ms, attributes)
+
+    def on_event(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.get_counter(name).add(1, get_otel_attributes(attributes))
@@ -0,0 +1,115 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+The JSON encoder / decoder used for core responses, API request and response bodies,
+front tokens and access token payload comparisons.
+
+orjson is used if it is installed (`pip install supertokens-python[orjson]`), and the
+standard library otherwise. A different codec can be set using `set_json_codec`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class JSONCodec(ABC):
+    @abstractmethod
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        """
+        Serialises `obj` to compact (no whitespace) UTF-8 encoded JSON, raising a
+        `ValueError` if it contains NaN or infinite floats.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parses JSON, raising a `ValueError` if it is not valid.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+def has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_non_finite_float(v) for v in obj.values())  # type: ignore
+    if isinstance(obj, (list, tuple)):
+        return any(has_non_finite_float(v) for v in obj)  # type: ignore
+    return False
+
+
+class OrjsonJSONCodec(JSONCodec):
+    def __init__(self):
+        import orjson  # type: ignore
+
+        self.orjson = orjson
+        # Like the standard library, dict keys which are not strings (like ints) are allowed
+        self.options: int = orjson.OPT_NON_STR_KEYS  # type: ignore
+        self.fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        options = self.options
+        if sort_keys:
+            options |= self.orjson.OPT_SORT_KEYS  # type: ignore
+        try:
+            result: bytes = self.orjson.dumps(obj, option=options)  # type: ignore
+        except TypeError:
+            # orjson doesn't support some values that the standard library does, like
+            # ints larger than 64 bits
+            return self.fallback.dumps(obj, sort_keys)
+        # orjson writes NaN and infinite floats as null, while the standard library
+        # raises. They can only be in the output if it has a null, so other values are
+        # not checked.
+        if b"null" in result and has_non_finite_float(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return result
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.orjson.loads(data)  # type: ignore
+
+
+def get_default_json_codec() -> JSONCodec:
+    try:
+        return OrjsonJSONCodec()
+    except ImportError:
+        return StdlibJSONCodec()
+
+
+json_codec: JSONCodec = get_default_json_codec()
+
+
+def get_json_codec() -> JSONCodec:
+    return json_codec
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    global json_codec
+    json_codec = codec
@@ -14,6 +14,7 @@
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from os import getenv, path
 from typing import Union
 
@@ -36,13 +37,27 @@ if debug_env == "1":
     enable_debug_logging()
 
 
+def is_debug_enabled() -> bool:
+    """
+    Should be used to skip computing the arguments of debug logs which are expensive to
+    compute (like `json.dumps(...)`) when debug logging is off. It's cheap to call, since
+    logging caches the result (until the log level is changed).
+    """
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
 def _get_log_timestamp() -> str:
     return datetime.utcnow().isoformat()[:-3] + "Z"
 
 
+@lru_cache(maxsize=None)
+def _get_relative_path(pathname: str) -> str:
+    return path.relpath(pathname, supertokens_dir)
+
+
 class CustomStreamHandler(logging.StreamHandler):  # type: ignore
     def emit(self, record: logging.LogRecord):
-        relative_path = path.relpath(record.pathname, supertokens_dir)
+        relative_path = _get_relative_path(record.pathname)
 
         record.msg = json.dumps(
             {
@@ -13,6 +13,7 @@
 # under the License.
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -31,6 +32,7 @@ class NormalisedURLDomain:
         return self.__value
 
 
+@lru_cache(maxsize=1024)
 def normalise_domain_path_or_throw_error(
     input_str: str, ignore_protocol: bool = False
 ) -> str:
@@ -14,11 +14,11 @@
 from __future__ import annotations
 
 import asyncio
-from json import JSONDecodeError
+import threading
 from os import environ
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from httpx import AsyncClient, Client, ConnectTimeout, NetworkError, Response
 
 from .constants import (
     API_KEY_HEADER,
@@ -28,6 +28,8 @@ from .constants import (
     SUPPORTED_CDI_VERSIONS,
     RATE_LIMIT_STATUS_CODE,
 )
+from .instrumentation import record_event, start_span
+from .json_codec import get_json_codec
 from .normalised_url_path import NormalisedURLPath
 
 if TYPE_CHECKING:
@@ -38,7 +40,10 @@ from typing import List, Set, Union
 from .process_state import AllowedProcessStates, ProcessState
 from .utils import find_max_version, is_4xx_error, is_5xx_error
 from sniffio import AsyncLibraryNotFoundError
-from supertokens_python.async_to_sync_wrapper import create_or_get_event_loop
+from supertokens_python.async_to_sync_wrapper import (
+    create_or_get_event_loop,
+    is_using_sync_http_client,
+)
 from supertokens_python.utils import get_timestamp_ms
 
 
@@ -70,6 +75,8 @@ class Querier:
     ] = None
     __global_cache_tag = get_timestamp_ms()
     __disable_cache = False
+    sync_client: Optional[Client] = None
+    sync_client_lock = threading.Lock()
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -78,6 +85,15 @@ class Querier:
         if rid_to_core is not None:
             self.__rid_to_core = rid_to_core
 
+    @staticmethod
+    def get_sync_client() -> Client:
+        # Shared by all threads so that connections to the core are reused
+        if Querier.sync_client is None:
+            with Querier.sync_client_lock:
+                if Querier.sync_client is None:
+                    Querier.sync_client = Client(timeout=30.0)
+        return Querier.sync_client
+
     @staticmethod
     def reset():
         if ("SUPERTOKENS_ENV" not in environ) or (
@@ -105,6 +121,26 @@ class Querier:
         if attempts_remaining == 0:
             raise Exception("Retry request failed")
 
+        with start_span("core_request", {"method": method, "url": url}) as span:
+            response = await self.__api_request(
+                url, method, attempts_remaining, *args, **kwargs
+            )
+            span.set_attribute("status_code", response.status_code)
+            return response
+
+    async def __api_request(
+        self,
+        url: str,
+        method: str,
+        attempts_remaining: int,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        if is_using_sync_http_client():
+            # Called from sync code (see async_to_sync_wrapper.sync), so the request is
+            # made using the pooled sync client, which is shared by all threads.
+            return Querier.get_sync_client().request(method, url, *args, **kwargs)
+
         try:
             async with AsyncClient(timeout=30.0) as client:
                 if method == "GET":
@@ -281,10 +317,13 @@ class Querier:
                 ):
                     self.invalidate_core_call_cache(user_context, False)
 
-                if not Querier.__disable_cache and unique_key in user_context.get(
-                    "_default", {}
-                ).get("core_call_cache", {}):
-                    return user_context["_default"]["core_call_cache"][unique_key]
+                if not Querier.__disable_cache:
+                    cache_hit = unique_key in user_context.get("_default", {}).get(
+                        "core_call_cache", {}
+                    )
+                    record_event("cache", {"cache": "core_call_cache", "hit": cache_hit})
+                    if cache_hit:
+                        return user_context["_default"]["core_call_cache"][unique_key]
 
             if Querier.network_interceptor is not None:
                 (
@@ -508,6 +547,15 @@ class Querier:
 
             if response.status_code == RATE_LIMIT_STATUS_CODE:
                 retries_left = retry_info_map[url]
+                record_event(
+                    "core_request_rate_limited",
+                    {
+                        "method": method,
+                        "path": path.get_as_string_dangerous(),
+                        "host": current_host,
+                        "retries_left": retries_left,
+                    },
+                )
 
                 if retries_left > 0:
                     retry_info_map[url] = retries_left - 1
@@ -535,13 +583,21 @@ class Querier:
             res: Dict[str, Any] = {"_headers": dict(response.headers)}
 
             try:
-                res.update(response.json())
-            except JSONDecodeError:
+                res.update(get_json_codec().loads(response.content))
+            except ValueError:
                 res["_text"] = response.text
 
             return res
 
-        except (ConnectionError, NetworkError, ConnectTimeout) as _:
+        except (ConnectionError, NetworkError, ConnectTimeout) as e:
+            record_event(
+                "core_request_retry",
+                {
+                    "method": method,
+                    "path": path.get_as_string_dangerous(),
+                    "error": type(e).__name__,
+                },
+            )
             return await self.__send_request_helper(
                 path, method, http_function, no_of_tries - 1, retry_info_map
             )
@@ -23,15 +23,22 @@ from .recipe import DashboardRecipe
 from supertokens_python.recipe.dashboard import utils
 
 InputOverrideConfig = utils.InputOverrideConfig
+UsersPageCacheConfig = utils.UsersPageCacheConfig
 
 
 def init(
     api_key: Optional[str] = None,
     admins: Optional[List[str]] = None,
     override: Optional[InputOverrideConfig] = None,
+    user_metadata_fetch_concurrency: int = 5,
+    users_page_cache: Optional[UsersPageCacheConfig] = None,
+    session_info_fetch_concurrency: int = 5,
 ) -> Callable[[AppInfo], RecipeModule]:
     return DashboardRecipe.init(
         api_key,
         admins,
         override,
+        user_metadata_fetch_concurrency,
+        users_page_cache,
+        session_info_fetch_concurrency,
     )
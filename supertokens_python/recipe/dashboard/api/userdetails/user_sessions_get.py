@@ -1,11 +1,11 @@
-import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.session.asyncio import (
     get_all_session_handles_for_user,
     get_session_information,
 )
+from supertokens_python.utils import map_with_concurrency
 
 from ...interfaces import (
     APIInterface,
@@ -15,6 +15,41 @@ from ...interfaces import (
 )
 
 
+async def get_sessions_information(
+    session_handles: Iterable[str], concurrency: int, user_context: Dict[str, Any]
+) -> List[SessionInfo]:
+    """
+    Returns the information of the sessions, in the order of `session_handles`, while
+    fetching the information of at most `concurrency` sessions at a time. Sessions
+    which no longer exist (or whose information couldn't be fetched) are skipped.
+    """
+
+    async def fetch(session_handle: str) -> Optional[SessionInfo]:
+        try:
+            session_response = await get_session_information(
+                session_handle, user_context
+            )
+        except Exception:
+            return None
+        return SessionInfo(session_response) if session_response is not None else None
+
+    sessions = await map_with_concurrency(fetch, session_handles, concurrency)
+    return [session for session in sessions if session is not None]
+
+
+def get_int_query_param(api_options: APIOptions, name: str) -> Optional[int]:
+    value = api_options.request.get_query_param(name)
+    if value is None:
+        return None
+    try:
+        result = int(value)
+    except ValueError:
+        result = -1
+    if result < 0:
+        raise_bad_input_exception(f"Invalid value recieved for '{name}'")
+    return result
+
+
 async def handle_sessions_get(
     _api_interface: APIInterface,
     _tenant_id: str,
@@ -26,27 +61,29 @@ async def handle_sessions_get(
     if user_id is None:
         raise_bad_input_exception("Missing required parameter 'userId'")
 
+    # Optional, to get a page of sessions at a time for users with many sessions
+    limit = get_int_query_param(api_options, "limit")
+    offset = get_int_query_param(api_options, "offset") or 0
+
     # Passing tenant id as None sets fetch_across_all_tenants to True
     # which is what we want here.
     session_handles = await get_all_session_handles_for_user(
         user_id, None, user_context
     )
-    sessions: List[Optional[SessionInfo]] = [None for _ in session_handles]
-
-    async def call_(i: int, session_handle: str):
-        try:
-            session_response = await get_session_information(
-                session_handle, user_context
-            )
-            if session_response is not None:
-                sessions[i] = SessionInfo(session_response)
-        except Exception:
-            sessions[i] = None
+    page_handles = session_handles[offset:]
+    if limit is not None:
+        page_handles = page_handles[:limit]
 
-    session_info_promises = [
-        call_(i, handle) for i, handle in enumerate(session_handles)
-    ]
+    sessions = await get_sessions_information(
+        page_handles, api_options.config.session_info_fetch_concurrency, user_context
+    )
 
-    await asyncio.gather(*session_info_promises)
+    if limit is None:
+        return UserSessionsGetAPIResponse(sessions)
 
-    return UserSessionsGetAPIResponse([s for s in sessions if s is not None])
+    next_offset = offset + len(page_handles)
+    return UserSessionsGetAPIResponse(
+        sessions,
+        len(session_handles),
+        next_offset if next_offset < len(session_handles) else None,
+    )
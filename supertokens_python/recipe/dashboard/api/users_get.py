@@ -13,11 +13,12 @@
 # under the License.
 from __future__ import annotations
 
-import asyncio
-from typing import TYPE_CHECKING, Any, Awaitable, List, Dict
+from typing import TYPE_CHECKING, Any, List, Dict
 from typing_extensions import Literal
 
 from supertokens_python.supertokens import Supertokens
+from supertokens_python.types import User
+from supertokens_python.utils import map_with_concurrency
 
 from ...usermetadata import UserMetadataRecipe
 from ...usermetadata.asyncio import get_user_metadata
@@ -54,64 +55,62 @@ async def handle_users_get_api(
 
     pagination_token = api_options.request.get_query_param("paginationToken")
 
+    query = api_options.request.get_query_params()
+    cache_key = (tenant_id, tuple(sorted(query.items())))
+    if api_options.users_page_cache is not None:
+        cached_page = api_options.users_page_cache.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
     users_response = await Supertokens.get_instance().get_users(
         tenant_id,
         time_joined_order=time_joined_order,
         limit=int(limit),
         pagination_token=pagination_token,
         include_recipe_ids=None,
-        query=api_options.request.get_query_params(),
+        query=query,
         user_context=user_context,
     )
 
-    # user metadata bulk fetch with batches:
-
     try:
         UserMetadataRecipe.get_instance()
     except GeneralError:
-        return DashboardUsersGetResponse(
+        result = DashboardUsersGetResponse(
             users_response.users, users_response.next_pagination_token
         )
+    else:
+        result = DashboardUsersGetResponse(
+            await get_users_with_metadata(
+                users_response.users,
+                api_options.config.user_metadata_fetch_concurrency,
+                user_context,
+            ),
+            users_response.next_pagination_token,
+        )
+
+    if api_options.users_page_cache is not None:
+        api_options.users_page_cache.set(cache_key, result)
 
+    return result
+
+
+async def get_users_with_metadata(
+    users: List[User], concurrency: int, user_context: Dict[str, Any]
+) -> List[UserWithMetadata]:
     users_with_metadata: List[UserWithMetadata] = [
-        UserWithMetadata().from_user(user) for user in users_response.users
+        UserWithMetadata().from_user(user) for user in users
     ]
-    metadata_fetch_awaitables: List[Awaitable[Any]] = []
-
-    async def get_user_metadata_and_update_user(user_idx: int) -> None:
-        user = users_response.users[user_idx]
+    # At most `concurrency` metadata fetches are in flight at a time, and a new one is
+    # started as soon as any of them finishes. The same user_context is used for all of
+    # them, so they share its core call cache.
+    async def get_user_metadata_and_update_user(user: UserWithMetadata) -> None:
         user_metadata = await get_user_metadata(user.user_id, user_context)
-        first_name = user_metadata.metadata.get("first_name")
-        last_name = user_metadata.metadata.get("last_name")
 
         # None becomes null which is acceptable for the dashboard.
-        users_with_metadata[user_idx].first_name = first_name
-        users_with_metadata[user_idx].last_name = last_name
-
-    # Batch calls to get user metadata:
-    for i, _ in enumerate(users_response.users):
-        metadata_fetch_awaitables.append(get_user_metadata_and_update_user(i))
-
-    promise_arr_start_position = 0
-    batch_size = 5
-
-    while promise_arr_start_position < len(metadata_fetch_awaitables):
-        # We want to query only 5 in parallel at a time
-        promises_to_call = [
-            metadata_fetch_awaitables[i]
-            for i in range(
-                promise_arr_start_position,
-                min(
-                    promise_arr_start_position + batch_size,
-                    len(metadata_fetch_awaitables),
-                ),
-            )
-        ]
-        await asyncio.gather(*promises_to_call)
-
-        promise_arr_start_position += batch_size
-
-    return DashboardUsersGetResponse(
-        users_with_metadata,
-        users_response.next_pagination_token,
+        user.first_name = user_metadata.metadata.get("first_name")
+        user.last_name = user_metadata.metadata.get("last_name")
+
+    await map_with_concurrency(
+        get_user_metadata_and_update_user, users_with_metadata, concurrency
     )
+    return users_with_metadata
@@ -22,6 +22,7 @@ from ...types import APIResponse
 
 if TYPE_CHECKING:
     from ...supertokens import AppInfo
+    from ...utils import TTLCache
     from .utils import DashboardConfig, UserWithMetadata
 
     from supertokens_python.recipe.session.interfaces import SessionInformationResult
@@ -72,6 +73,7 @@ class APIOptions:
         config: DashboardConfig,
         recipe_implementation: RecipeInterface,
         app_info: AppInfo,
+        users_page_cache: Optional[TTLCache[Any, DashboardUsersGetResponse]] = None,
     ):
         self.request: BaseRequest = request
         self.response: BaseResponse = response
@@ -79,6 +81,7 @@ class APIOptions:
         self.config: DashboardConfig = config
         self.recipe_implementation: RecipeInterface = recipe_implementation
         self.app_info = app_info
+        self.users_page_cache = users_page_cache
 
 
 class APIInterface:
@@ -204,7 +207,14 @@ class UserMetadataGetAPIOkResponse(APIResponse):
 class UserSessionsGetAPIResponse(APIResponse):
     status: str = "OK"
 
-    def __init__(self, sessions: List[SessionInfo]):
+    def __init__(
+        self,
+        sessions: List[SessionInfo],
+        total_sessions: Optional[int] = None,
+        next_offset: Optional[int] = None,
+    ):
+        self.total_sessions = total_sessions
+        self.next_offset = next_offset
         self.sessions = [
             {
                 "accessTokenPayload": s.access_token_payload,
@@ -219,7 +229,12 @@ class UserSessionsGetAPIResponse(APIResponse):
         ]
 
     def to_json(self) -> Dict[str, Any]:
-        return {"status": self.status, "sessions": self.sessions}
+        response: Dict[str, Any] = {"status": self.status, "sessions": self.sessions}
+        # Only set if the sessions were requested a page at a time
+        if self.total_sessions is not None:
+            response["totalSessions"] = self.total_sessions
+            response["nextOffset"] = self.next_offset
+        return response
 
 
 class UserEmailVerifyGetAPIResponse(APIResponse):
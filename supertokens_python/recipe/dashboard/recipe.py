@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Dict, Any
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.recipe_module import APIHandled, RecipeModule
+from supertokens_python.utils import TTLCache
 
 from .api import (
     api_key_protector,
@@ -44,7 +45,7 @@ from .api import (
 )
 from .api.implementation import APIImplementation
 from .exceptions import SuperTokensDashboardError
-from .interfaces import APIInterface, APIOptions
+from .interfaces import APIInterface, APIOptions, DashboardUsersGetResponse
 from .recipe_implementation import RecipeImplementation
 
 if TYPE_CHECKING:
@@ -75,6 +76,7 @@ from .constants import (
 )
 from .utils import (
     InputOverrideConfig,
+    UsersPageCacheConfig,
     validate_and_normalise_user_input,
 )
 
@@ -90,12 +92,26 @@ class DashboardRecipe(RecipeModule):
         api_key: Optional[str],
         admins: Optional[List[str]],
         override: Optional[InputOverrideConfig] = None,
+        user_metadata_fetch_concurrency: int = 5,
+        users_page_cache: Optional[UsersPageCacheConfig] = None,
+        session_info_fetch_concurrency: int = 5,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             api_key,
             admins,
             override,
+            user_metadata_fetch_concurrency,
+            users_page_cache,
+            session_info_fetch_concurrency,
+        )
+        self.users_page_cache: Optional[TTLCache[Any, DashboardUsersGetResponse]] = (
+            TTLCache(
+                self.config.users_page_cache.ttl_sec * 1000,
+                self.config.users_page_cache.max_size,
+            )
+            if self.config.users_page_cache is not None
+            else None
         )
         recipe_implementation = RecipeImplementation()
         self.recipe_implementation = (
@@ -271,6 +287,7 @@ class DashboardRecipe(RecipeModule):
             self.config,
             self.recipe_implementation,
             self.get_app_info(),
+            self.users_page_cache,
         )
         # For these APIs we dont need API key validation
         if request_id == DASHBOARD_API:
@@ -333,13 +350,18 @@ class DashboardRecipe(RecipeModule):
             api_function = handle_list_tenants_api
 
         if api_function is not None:
-            return await api_key_protector(
-                self.api_implementation,
-                tenant_id,
-                api_options,
-                api_function,
-                user_context,
-            )
+            try:
+                return await api_key_protector(
+                    self.api_implementation,
+                    tenant_id,
+                    api_options,
+                    api_function,
+                    user_context,
+                )
+            finally:
+                # Any change made using the dashboard may affect the listed users
+                if method != "get" and self.users_page_cache is not None:
+                    self.users_page_cache.clear()
 
         return None
 
@@ -360,6 +382,9 @@ class DashboardRecipe(RecipeModule):
         api_key: Optional[str],
         admins: Optional[List[str]] = None,
         override: Optional[InputOverrideConfig] = None,
+        user_metadata_fetch_concurrency: int = 5,
+        users_page_cache: Optional[UsersPageCacheConfig] = None,
+        session_info_fetch_concurrency: int = 5,
     ):
         def func(app_info: AppInfo):
             if DashboardRecipe.__instance is None:
@@ -369,6 +394,9 @@ class DashboardRecipe(RecipeModule):
                     api_key,
                     admins,
                     override,
+                    user_metadata_fetch_concurrency,
+                    users_page_cache,
+                    session_info_fetch_concurrency,
                 )
                 return DashboardRecipe.__instance
             raise Exception(
@@ -167,6 +167,23 @@ class OverrideConfig:
         self.apis = apis
 
 
+class UsersPageCacheConfig:
+    """
+    Enables caching the pages returned by the dashboard's user listing API in memory for
+    `ttl_sec` seconds, for at most `max_size` pages. Changes made using the dashboard
+    clear the cache, but changes made elsewhere (like users signing up or updating their
+    metadata) may not be shown till the cached pages expire.
+    """
+
+    def __init__(self, ttl_sec: int = 30, max_size: int = 100):
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+
+
 class DashboardConfig:
     def __init__(
         self,
@@ -174,11 +191,17 @@ class DashboardConfig:
         admins: Optional[List[str]],
         override: OverrideConfig,
         auth_mode: str,
+        user_metadata_fetch_concurrency: int = 5,
+        users_page_cache: Optional[UsersPageCacheConfig] = None,
+        session_info_fetch_concurrency: int = 5,
     ):
         self.api_key = api_key
         self.admins = admins
         self.override = override
         self.auth_mode = auth_mode
+        self.user_metadata_fetch_concurrency = user_metadata_fetch_concurrency
+        self.users_page_cache = users_page_cache
+        self.session_info_fetch_concurrency = session_info_fetch_concurrency
 
 
 def validate_and_normalise_user_input(
@@ -186,11 +209,20 @@ def validate_and_normalise_user_input(
     api_key: Union[str, None],
     admins: Optional[List[str]],
     override: Optional[InputOverrideConfig] = None,
+    user_metadata_fetch_concurrency: int = 5,
+    users_page_cache: Optional[UsersPageCacheConfig] = None,
+    session_info_fetch_concurrency: int = 5,
 ) -> DashboardConfig:
 
     if override is None:
         override = InputOverrideConfig()
 
+    if user_metadata_fetch_concurrency <= 0:
+        raise ValueError("user_metadata_fetch_concurrency must be a positive integer")
+
+    if session_info_fetch_concurrency <= 0:
+        raise ValueError("session_info_fetch_concurrency must be a positive integer")
+
     if api_key is not None and admins is not None:
         log_debug_message(
             "User Dashboard: Providing 'admins' has no effect when using an api key."
@@ -206,6 +238,9 @@ def validate_and_normalise_user_input(
             apis=override.apis,
         ),
         "api-key" if api_key else "email-password",
+        user_metadata_fetch_concurrency,
+        users_page_cache,
+        session_info_fetch_concurrency,
     )
 
 
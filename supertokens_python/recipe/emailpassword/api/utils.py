@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.emailpassword.constants import FORM_FIELD_EMAIL_ID
@@ -25,7 +25,7 @@ from supertokens_python.recipe.emailpassword.types import (
     FormField,
     NormalisedFormField,
 )
-from supertokens_python.utils import find_first_occurrence_in_list
+from supertokens_python.utils import map_with_concurrency
 
 
 async def validate_form_or_throw_error(
@@ -33,20 +33,30 @@ async def validate_form_or_throw_error(
     config_form_fields: List[NormalisedFormField],
     tenant_id: str,
 ):
-    validation_errors: List[ErrorFormField] = []
     if len(config_form_fields) != len(inputs):
         raise_bad_input_exception("Are you sending too many / too few formFields?")
 
-    for field in config_form_fields:
-        input_field: Union[None, FormField] = find_first_occurrence_in_list(
-            lambda x: x.id == field.id, inputs
-        )
+    # If an id is sent more than once, its first value is validated
+    inputs_by_id: Dict[str, FormField] = {}
+    for input_field in inputs:
+        inputs_by_id.setdefault(input_field.id, input_field)
+
+    async def validate(field: NormalisedFormField) -> Optional[str]:
+        input_field = inputs_by_id.get(field.id)
         if input_field is None or (input_field.value == "" and not field.optional):
-            validation_errors.append(ErrorFormField(field.id, "Field is not optional"))
-        else:
-            error = await field.validate(input_field.value, tenant_id)
-            if error is not None:
-                validation_errors.append(ErrorFormField(field.id, error))
+            return "Field is not optional"
+        return await field.validate(input_field.value, tenant_id)
+
+    # The validators are independent of each other, and may do I/O (like checking if a
+    # username is taken), so they are run concurrently
+    errors = await map_with_concurrency(
+        validate, config_form_fields, max(len(config_form_fields), 1)
+    )
+    validation_errors = [
+        ErrorFormField(field.id, error)
+        for field, error in zip(config_form_fields, errors)
+        if error is not None
+    ]
 
     if len(validation_errors) != 0:
         # raise BadInputError(msg="Error in input formFields")
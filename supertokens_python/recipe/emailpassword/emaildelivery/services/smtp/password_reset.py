@@ -18,8 +18,6 @@ from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailpassword.types import PasswordResetEmailTemplateVars
 from supertokens_python.supertokens import Supertokens
 
-from .password_reset_email import html_template
-
 
 def get_password_reset_email_content(
     email_input: PasswordResetEmailTemplateVars,
@@ -36,6 +34,9 @@ def get_password_reset_email_content(
 
 
 def get_password_reset_email_html(app_name: str, email: str, reset_link: str):
+    # The template is large, so it is only loaded when an email is sent
+    from .password_reset_email import html_template
+
     return Template(html_template).substitute(
         appname=app_name, resetLink=reset_link, toEmail=email
     )
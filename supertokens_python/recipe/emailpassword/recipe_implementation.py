@@ -16,6 +16,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Union, Callable
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.emailverification.recipe import EmailVerificationRecipe
 
 from .interfaces import (
     CreateResetPasswordOkResult,
@@ -194,6 +195,10 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if "status" in response and response["status"] == "OK":
+            if email is not None:
+                ev_recipe = EmailVerificationRecipe.get_instance_optional()
+                if ev_recipe is not None:
+                    ev_recipe.forget_email_for_user_id(user_id)
             return UpdateEmailOrPasswordOkResult()
         if "status" in response and response["status"] == "EMAIL_ALREADY_EXISTS_ERROR":
             return UpdateEmailOrPasswordEmailAlreadyExistsError()
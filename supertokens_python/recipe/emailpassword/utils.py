@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from re import fullmatch
+import re
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union, Dict
 from supertokens_python.framework import BaseRequest
 
@@ -43,6 +43,15 @@ async def default_validator(_: str, __: str) -> Union[str, None]:
     return None
 
 
+PASSWORD_ALPHABET_REGEX = re.compile(r"^.*[A-Za-z]+.*$")
+PASSWORD_NUMBER_REGEX = re.compile(r"^.*[0-9]+.*$")
+# Regex from https://stackoverflow.com/a/46181/3867175
+EMAIL_REGEX = re.compile(
+    r'^(([^<>()\[\]\\.,;:\s@"]+(\.[^<>()\[\]\\.,;:\s@"]+)*)|(".+"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,'
+    r"3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
+)
+
+
 async def default_password_validator(value: str, _tenant_id: str) -> Union[str, None]:
     # length >= 8 && < 100
     # must have a number and a character
@@ -54,10 +63,10 @@ async def default_password_validator(value: str, _tenant_id: str) -> Union[str,
     if len(value) >= 100:
         return "Password's length must be lesser than 100 characters"
 
-    if fullmatch(r"^.*[A-Za-z]+.*$", value) is None:
+    if PASSWORD_ALPHABET_REGEX.fullmatch(value) is None:
         return "Password must contain at least one alphabet"
 
-    if fullmatch(r"^.*[0-9]+.*$", value) is None:
+    if PASSWORD_NUMBER_REGEX.fullmatch(value) is None:
         return "Password must contain at least one number"
 
     return None
@@ -66,15 +75,7 @@ async def default_password_validator(value: str, _tenant_id: str) -> Union[str,
 async def default_email_validator(value: Any, _tenant_id: str) -> Union[str, None]:
     # We check if the email syntax is correct
     # As per https://github.com/supertokens/supertokens-auth-react/issues/5#issuecomment-709512438
-    # Regex from https://stackoverflow.com/a/46181/3867175
-    if (not isinstance(value, str)) or (
-        fullmatch(
-            r'^(([^<>()\[\]\\.,;:\s@"]+(\.[^<>()\[\]\\.,;:\s@"]+)*)|(".+"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,'
-            r"3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$",
-            value,
-        )
-        is None
-    ):
+    if (not isinstance(value, str)) or EMAIL_REGEX.fullmatch(value) is None:
         return "Email is not valid"
 
     return None
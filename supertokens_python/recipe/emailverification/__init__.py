@@ -26,6 +26,7 @@ from .types import EmailTemplateVars
 from ...ingredients.emaildelivery.types import EmailDeliveryConfig
 
 InputOverrideConfig = utils.OverrideConfig
+VerificationStatusCacheConfig = utils.VerificationStatusCacheConfig
 exception = ex
 SMTPService = emaildelivery_services.SMTPService
 EmailVerificationClaim = recipe.EmailVerificationClaim
@@ -45,10 +46,12 @@ def init(
     email_delivery: Union[EmailDeliveryConfig[EmailTemplateVars], None] = None,
     get_email_for_user_id: Optional[TypeGetEmailForUserIdFunction] = None,
     override: Union[OverrideConfig, None] = None,
+    verification_status_cache: Union[VerificationStatusCacheConfig, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return EmailVerificationRecipe.init(
         mode,
         email_delivery,
         get_email_for_user_id,
         override,
+        verification_status_cache,
     )
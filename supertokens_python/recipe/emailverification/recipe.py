@@ -30,10 +30,11 @@ from supertokens_python.recipe.emailverification.types import (
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 
 from ...ingredients.emaildelivery.types import EmailDeliveryConfig
+from ...instrumentation import record_event
 from ...logger import log_debug_message
 from ...post_init_callbacks import PostSTInitCallbacks
 from ...types import MaybeAwaitable
-from ...utils import get_timestamp_ms
+from ...utils import TTLCache, get_timestamp_ms
 from ..session import SessionRecipe
 from ..session.claim_base_classes.boolean_claim import (
     BooleanClaim,
@@ -75,7 +76,12 @@ from supertokens_python.recipe.emailverification.utils import get_email_verify_l
 from .api import handle_email_verify_api, handle_generate_email_verify_token_api
 from .constants import USER_EMAIL_VERIFY, USER_EMAIL_VERIFY_TOKEN
 from .exceptions import SuperTokensEmailVerificationError
-from .utils import MODE_TYPE, OverrideConfig, validate_and_normalise_user_input
+from .utils import (
+    MODE_TYPE,
+    OverrideConfig,
+    VerificationStatusCacheConfig,
+    validate_and_normalise_user_input,
+)
 
 
 class EmailVerificationRecipe(RecipeModule):
@@ -92,6 +98,7 @@ class EmailVerificationRecipe(RecipeModule):
         email_delivery: Union[EmailDeliveryConfig[EmailTemplateVars], None] = None,
         get_email_for_user_id: Optional[TypeGetEmailForUserIdFunction] = None,
         override: Union[OverrideConfig, None] = None,
+        verification_status_cache: Union[VerificationStatusCacheConfig, None] = None,
     ) -> None:
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -100,6 +107,7 @@ class EmailVerificationRecipe(RecipeModule):
             email_delivery,
             get_email_for_user_id,
             override,
+            verification_status_cache,
         )
 
         recipe_implementation = RecipeImplementation(
@@ -129,6 +137,21 @@ class EmailVerificationRecipe(RecipeModule):
         self.get_email_for_user_id_funcs_from_other_recipes: List[
             TypeGetEmailForUserIdFunction
         ] = []
+        # The email of a user (or that they have none), by user id, so that claim
+        # refetches which hit the verification status cache don't query the core
+        self.email_cache: Optional[
+            TTLCache[str, Union[GetEmailForUserIdOkResult, EmailDoesNotExistError]]
+        ] = (
+            TTLCache(
+                self.config.verification_status_cache.ttl_sec * 1000,
+                self.config.verification_status_cache.max_size,
+            )
+            if self.config.verification_status_cache is not None
+            else None
+        )
+        # Incremented on every change to an email, so that a lookup which started
+        # before a change doesn't cache the email from before it
+        self.email_cache_version = 0
 
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and isinstance(
@@ -208,6 +231,7 @@ class EmailVerificationRecipe(RecipeModule):
         email_delivery: Union[EmailDeliveryConfig[EmailTemplateVars], None] = None,
         get_email_for_user_id: Optional[TypeGetEmailForUserIdFunction] = None,
         override: Union[OverrideConfig, None] = None,
+        verification_status_cache: Union[VerificationStatusCacheConfig, None] = None,
     ):
         def func(app_info: AppInfo) -> EmailVerificationRecipe:
             if EmailVerificationRecipe.__instance is None:
@@ -220,6 +244,7 @@ class EmailVerificationRecipe(RecipeModule):
                     email_delivery,
                     get_email_for_user_id,
                     override,
+                    verification_status_cache,
                 )
 
                 def callback():
@@ -262,6 +287,27 @@ class EmailVerificationRecipe(RecipeModule):
 
     async def get_email_for_user_id(
         self, user_id: str, user_context: Dict[str, Any]
+    ) -> Union[GetEmailForUserIdOkResult, EmailDoesNotExistError, UnknownUserIdError]:
+        cache_version = self.email_cache_version
+        if self.email_cache is not None:
+            cached = self.email_cache.get(user_id)
+            record_event(
+                "cache", {"cache": "email_for_user_id", "hit": cached is not None}
+            )
+            if cached is not None:
+                return cached
+
+        res = await self._get_email_for_user_id(user_id, user_context)
+        if (
+            self.email_cache is not None
+            and not isinstance(res, UnknownUserIdError)
+            and cache_version == self.email_cache_version
+        ):
+            self.email_cache.set(user_id, res)
+        return res
+
+    async def _get_email_for_user_id(
+        self, user_id: str, user_context: Dict[str, Any]
     ) -> Union[GetEmailForUserIdOkResult, EmailDoesNotExistError, UnknownUserIdError]:
         if self.config.get_email_for_user_id is not None:
             res = await self.config.get_email_for_user_id(user_id, user_context)
@@ -275,6 +321,16 @@ class EmailVerificationRecipe(RecipeModule):
 
         return UnknownUserIdError()
 
+    def forget_email_for_user_id(self, user_id: str):
+        """
+        Removes the cached email of the user. Called by the recipes which change the
+        email of a user.
+        """
+        if self.email_cache is None:
+            return
+        self.email_cache_version += 1
+        self.email_cache.delete(user_id)
+
     def add_get_email_for_user_id_func(self, f: TypeGetEmailForUserIdFunction):
         self.get_email_for_user_id_funcs_from_other_recipes.append(f)
 
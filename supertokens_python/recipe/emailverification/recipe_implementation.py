@@ -13,9 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
+from supertokens_python.instrumentation import record_event
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.utils import TTLCache
 
 from .interfaces import (
     CreateEmailVerificationTokenEmailAlreadyVerifiedError,
@@ -39,6 +41,45 @@ class RecipeImplementation(RecipeInterface):
         super().__init__()
         self.querier = querier
         self.config = config
+        # Whether the email of a user is verified, by (user id, email)
+        self.verification_status_cache: Optional[TTLCache[Tuple[str, str], bool]] = (
+            TTLCache(
+                config.verification_status_cache.ttl_sec * 1000,
+                config.verification_status_cache.max_size,
+            )
+            if config.verification_status_cache is not None
+            else None
+        )
+        # Incremented on every change to a verification status, so that a read which
+        # started before a change doesn't cache the status from before it
+        self.verification_status_cache_version = 0
+
+    def cache_verification_status(
+        self,
+        user_id: str,
+        email: str,
+        is_verified: bool,
+        read_cache_version: Optional[int] = None,
+    ):
+        """
+        Caches the status after a change to it, or after reading it from the core, if
+        `read_cache_version` (the cache version from before the read) is given.
+        """
+        if self.verification_status_cache is None:
+            return
+        if read_cache_version is None:
+            self.verification_status_cache_version += 1
+        elif read_cache_version != self.verification_status_cache_version:
+            return
+        assert self.config.verification_status_cache is not None
+        ttl_sec = (
+            self.config.verification_status_cache.ttl_sec
+            if is_verified
+            else self.config.verification_status_cache.negative_ttl_sec
+        )
+        self.verification_status_cache.set(
+            (user_id, email), is_verified, ttl_sec * 1000
+        )
 
     async def create_email_verification_token(
         self, user_id: str, email: str, tenant_id: str, user_context: Dict[str, Any]
@@ -54,6 +95,7 @@ class RecipeImplementation(RecipeInterface):
         )
         if "status" in response and response["status"] == "OK":
             return CreateEmailVerificationTokenOkResult(response["token"])
+        self.cache_verification_status(user_id, email, True)
         return CreateEmailVerificationTokenEmailAlreadyVerifiedError()
 
     async def verify_email_using_token(
@@ -66,6 +108,7 @@ class RecipeImplementation(RecipeInterface):
             user_context,
         )
         if "status" in response and response["status"] == "OK":
+            self.cache_verification_status(response["userId"], response["email"], True)
             return VerifyEmailUsingTokenOkResult(
                 User(response["userId"], response["email"])
             )
@@ -74,10 +117,22 @@ class RecipeImplementation(RecipeInterface):
     async def is_email_verified(
         self, user_id: str, email: str, user_context: Dict[str, Any]
     ) -> bool:
+        cache_version = self.verification_status_cache_version
+        if self.verification_status_cache is not None:
+            is_verified = self.verification_status_cache.get((user_id, email))
+            record_event(
+                "cache", {"cache": "email_verification", "hit": is_verified is not None}
+            )
+            if is_verified is not None:
+                return is_verified
+
         params = {"userId": user_id, "email": email}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/user/email/verify"), params, user_context
         )
+        self.cache_verification_status(
+            user_id, email, response["isVerified"], cache_version
+        )
         return response["isVerified"]
 
     async def revoke_email_verification_tokens(
@@ -98,4 +153,5 @@ class RecipeImplementation(RecipeInterface):
         await self.querier.send_post_request(
             NormalisedURLPath("/recipe/user/email/verify/remove"), data, user_context
         )
+        self.cache_verification_status(user_id, email, False)
         return UnverifyEmailOkResult()
@@ -48,6 +48,32 @@ class OverrideConfig:
 MODE_TYPE = Literal["REQUIRED", "OPTIONAL"]
 
 
+class VerificationStatusCacheConfig:
+    """
+    Enables caching whether an email of a user is verified in memory, for at most
+    `max_size` (user id, email) pairs. Verified emails are cached for `ttl_sec` seconds
+    and unverified ones for `negative_ttl_sec` seconds, so that users who have just
+    verified their email elsewhere are not kept waiting. The email of at most `max_size`
+    users is also cached for `ttl_sec` seconds. Verifying or unverifying emails, or
+    changing them, through this SDK instance updates the cache, but changes made
+    elsewhere (another process or the core directly) may not be seen till the entry
+    expires.
+    """
+
+    def __init__(
+        self, ttl_sec: int = 60, negative_ttl_sec: int = 5, max_size: int = 10000
+    ):
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be a positive integer")
+        if negative_ttl_sec <= 0:
+            raise ValueError("negative_ttl_sec must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_sec = ttl_sec
+        self.negative_ttl_sec = negative_ttl_sec
+        self.max_size = max_size
+
+
 class EmailVerificationConfig:
     def __init__(
         self,
@@ -57,11 +83,13 @@ class EmailVerificationConfig:
         ],
         get_email_for_user_id: Optional[TypeGetEmailForUserIdFunction],
         override: OverrideConfig,
+        verification_status_cache: Optional[VerificationStatusCacheConfig],
     ):
         self.mode = mode
         self.override = override
         self.get_email_delivery_config = get_email_delivery_config
         self.get_email_for_user_id = get_email_for_user_id
+        self.verification_status_cache = verification_status_cache
 
 
 def validate_and_normalise_user_input(
@@ -70,6 +98,7 @@ def validate_and_normalise_user_input(
     email_delivery: Union[EmailDeliveryConfig[EmailTemplateVars], None] = None,
     get_email_for_user_id: Optional[TypeGetEmailForUserIdFunction] = None,
     override: Union[OverrideConfig, None] = None,
+    verification_status_cache: Union[VerificationStatusCacheConfig, None] = None,
 ) -> EmailVerificationConfig:
     if mode not in ["REQUIRED", "OPTIONAL"]:
         raise ValueError(
@@ -95,11 +124,20 @@ def validate_and_normalise_user_input(
     if override is None:
         override = OverrideConfig()
 
+    if verification_status_cache is not None and not isinstance(  # type: ignore
+        verification_status_cache, VerificationStatusCacheConfig
+    ):
+        raise ValueError(
+            "verification_status_cache must be an instance of "
+            "VerificationStatusCacheConfig or None"
+        )
+
     return EmailVerificationConfig(
         mode,
         get_email_delivery_config,
         get_email_for_user_id,
         override,
+        verification_status_cache,
     )
 
 
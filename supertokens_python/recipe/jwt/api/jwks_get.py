@@ -12,12 +12,66 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Dict
-from supertokens_python.recipe.jwt.interfaces import APIInterface, APIOptions
+
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Tuple
+
+from supertokens_python.json_codec import get_json_codec
+from supertokens_python.recipe.jwt.interfaces import (
+    APIInterface,
+    APIOptions,
+    JsonWebKey,
+)
 from supertokens_python.utils import send_200_response
 
 from ..interfaces import JWKSGetResponse
 
+KeysFingerprint = Tuple[Tuple[str, str, str, str, str, str], ...]
+
+
+class SerialisedJWKS:
+    def __init__(self, fingerprint: KeysFingerprint, body: bytes):
+        self.fingerprint = fingerprint
+        self.body = body
+        self.etag = '"' + sha256(body).hexdigest()[:32] + '"'
+
+
+# The JWKS only changes when the core rotates its keys, so we keep the serialised
+# body (and its ETag) of the last response around and reuse it while the keys are the same.
+serialised_jwks: Optional[SerialisedJWKS] = None
+
+
+def get_keys_fingerprint(keys: List[JsonWebKey]) -> KeysFingerprint:
+    return tuple((key.kty, key.kid, key.n, key.e, key.alg, key.use) for key in keys)
+
+
+def get_serialised_jwks(result: JWKSGetResponse) -> SerialisedJWKS:
+    global serialised_jwks
+
+    fingerprint = get_keys_fingerprint(result.keys)
+    cached = serialised_jwks
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+
+    body = get_json_codec().dumps(result.to_json())
+    cached = SerialisedJWKS(fingerprint, body)
+    serialised_jwks = cached
+    return cached
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in ("*", etag):
+            return True
+
+    return False
+
 
 async def jwks_get(
     api_implementation: APIInterface,
@@ -32,4 +86,15 @@ async def jwks_get(
     if isinstance(result, JWKSGetResponse):
         api_options.response.set_header("Access-Control-Allow-Origin", "*")
 
+        jwks = get_serialised_jwks(result)
+        api_options.response.set_header("ETag", jwks.etag)
+
+        if etag_matches(api_options.request.get_header("If-None-Match"), jwks.etag):
+            api_options.response.set_status_code(304)
+            return api_options.response
+
+        api_options.response.set_raw_json_content(jwks.body)
+        api_options.response.set_status_code(200)
+        return api_options.response
+
     return send_200_response(result.to_json(), api_options.response)
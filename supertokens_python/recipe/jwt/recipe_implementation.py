@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
+from supertokens_python.utils import get_timestamp_ms
 import re
 
 if TYPE_CHECKING:
@@ -37,12 +38,26 @@ from .interfaces import JsonWebKey
 DEFAULT_JWKS_MAX_AGE = 60
 
 
+class CachedJWKS:
+    def __init__(self, keys: List[JsonWebKey], validity_in_secs: int):
+        self.keys = keys
+        self.validity_in_secs = validity_in_secs
+        self.expiry_time = get_timestamp_ms() + validity_in_secs * 1000
+
+    def is_fresh(self) -> bool:
+        return get_timestamp_ms() < self.expiry_time
+
+    def get_remaining_validity_in_secs(self) -> int:
+        return max(0, (self.expiry_time - get_timestamp_ms()) // 1000)
+
+
 class RecipeImplementation(RecipeInterface):
     def __init__(self, querier: Querier, config: JWTConfig, app_info: AppInfo):
         super().__init__()
         self.querier = querier
         self.config = config
         self.app_info = app_info
+        self.cached_jwks: Optional[CachedJWKS] = None
 
     async def create_jwt(
         self,
@@ -72,6 +87,16 @@ class RecipeImplementation(RecipeInterface):
         return CreateJwtResultUnsupportedAlgorithm()
 
     async def get_jwks(self, user_context: Dict[str, Any]) -> GetJWKSResult:
+        cached_jwks = self.cached_jwks
+        if cached_jwks is not None and cached_jwks.is_fresh():
+            # We return a new result object (and list) each time so that overrides
+            # modifying the result do not change what is stored in the cache. The
+            # validity is what is left of it, so that clients don't cache the keys for
+            # longer than we do.
+            return GetJWKSResult(
+                list(cached_jwks.keys), cached_jwks.get_remaining_validity_in_secs()
+            )
+
         response = await self.querier.send_get_request(
             NormalisedURLPath("/.well-known/jwks.json"),
             {},
@@ -79,7 +104,16 @@ class RecipeImplementation(RecipeInterface):
         )
 
         validity_in_secs = DEFAULT_JWKS_MAX_AGE
-        cache_control = response["_headers"].get("Cache-Control")
+        # The header names in the dict are lowercase, but may not be if the querier
+        # was overridden
+        cache_control = next(
+            (
+                value
+                for name, value in response["_headers"].items()
+                if name.lower() == "cache-control"
+            ),
+            None,
+        )
 
         if cache_control is not None:
             pattern = r",?\s*max-age=(\d+)(?:,|$)"
@@ -98,4 +132,9 @@ class RecipeImplementation(RecipeInterface):
                 )
             )
 
+        if validity_in_secs > 0:
+            # The core tells us how long these keys are valid for, so we can serve
+            # them from memory till then instead of querying the core on each call.
+            self.cached_jwks = CachedJWKS(list(keys), validity_in_secs)
+
         return GetJWKSResult(keys, validity_in_secs)
@@ -13,8 +13,6 @@
 # under the License.
 from typing import Union, Any, Dict
 
-import phonenumbers  # type: ignore
-from phonenumbers import format_number, parse  # type: ignore
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.passwordless.interfaces import APIInterface, APIOptions
 from supertokens_python.recipe.passwordless.utils import (
@@ -101,6 +99,9 @@ async def create_code(
                 GeneralErrorResponse(validation_error).to_json()
             )
             return api_options.response
+        import phonenumbers  # type: ignore
+        from phonenumbers import format_number, parse  # type: ignore
+
         try:
             phone_number_formatted: str = format_number(
                 parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
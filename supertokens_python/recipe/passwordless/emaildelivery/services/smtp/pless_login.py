@@ -20,8 +20,6 @@ from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.supertokens import Supertokens
 from supertokens_python.utils import humanize_time
 
-from .pless_login_email import magic_link_body, otp_and_magic_link_body, otp_body
-
 if TYPE_CHECKING:
     from supertokens_python.recipe.passwordless.interfaces import (
         PasswordlessLoginEmailTemplateVars,
@@ -50,6 +48,9 @@ def get_pless_email_html(
     url_with_link_code: Union[str, None] = None,
     user_input_code: Union[str, None] = None,
 ):
+    # The templates are large, so they are only loaded when an email is sent
+    from .pless_login_email import magic_link_body, otp_and_magic_link_body, otp_body
+
     if (user_input_code is not None) and (url_with_link_code is not None):
         html_template = otp_and_magic_link_body
     elif user_input_code is not None:
@@ -20,6 +20,7 @@ from supertokens_python.querier import Querier
 from .types import DeviceCode, DeviceType, User
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.emailverification.recipe import EmailVerificationRecipe
 
 from .interfaces import (
     ConsumeCodeExpiredUserInputCodeError,
@@ -259,6 +260,10 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if result["status"] == "OK":
+            if email is not None:
+                ev_recipe = EmailVerificationRecipe.get_instance_optional()
+                if ev_recipe is not None:
+                    ev_recipe.forget_email_for_user_id(user_id)
             return UpdateUserOkResult()
         if result["status"] == "UNKNOWN_USER_ID_ERROR":
             return UpdateUserUnknownUserIdError()
@@ -276,6 +281,9 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if result["status"] == "OK":
+            ev_recipe = EmailVerificationRecipe.get_instance_optional()
+            if ev_recipe is not None:
+                ev_recipe.forget_email_for_user_id(user_id)
             return DeleteUserInfoOkResult()
         if result.get("EMAIL_ALREADY_EXISTS_ERROR"):
             raise Exception("Should never come here")
@@ -40,7 +40,6 @@ if TYPE_CHECKING:
 
 from re import fullmatch
 
-from phonenumbers import is_valid_number, parse  # type: ignore
 from supertokens_python.recipe.passwordless.emaildelivery.services.backward_compatibility import (
     BackwardCompatibilityService,
 )
@@ -50,6 +49,9 @@ from supertokens_python.recipe.passwordless.smsdelivery.services.backward_compat
 
 
 async def default_validate_phone_number(value: str, _tenant_id: str):
+    # phonenumbers takes a while to import, so it's only loaded if phone numbers are used
+    from phonenumbers import is_valid_number, parse  # type: ignore
+
     try:
         parsed_phone_number: Any = parse(value, None)
         if not is_valid_number(parsed_phone_number):
@@ -28,6 +28,7 @@ from .recipe import SessionRecipe
 
 InputErrorHandlers = utils.InputErrorHandlers
 InputOverrideConfig = utils.InputOverrideConfig
+CheckDatabaseCacheConfig = utils.CheckDatabaseCacheConfig
 SessionContainer = interfaces.SessionContainer
 exceptions = ex
 
@@ -52,6 +53,8 @@ def init(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    coalesce_refresh_requests: Union[bool, None] = None,
+    check_database_cache: Union[CheckDatabaseCacheConfig, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return SessionRecipe.init(
         cookie_domain,
@@ -67,4 +70,6 @@ def init(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        coalesce_refresh_requests,
+        check_database_cache,
     )
@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
 from supertokens_python.recipe.openid.interfaces import (
     GetOpenIdDiscoveryConfigurationResult,
@@ -21,6 +21,8 @@ from supertokens_python.recipe.session.interfaces import (
     ClaimsValidationResult,
     GetClaimValueOkResult,
     JSONObject,
+    RevokeAllSessionsForUserResult,
+    RevokeSessionsResult,
     SessionClaim,
     SessionClaimValidator,
     SessionContainer,
@@ -29,7 +31,7 @@ from supertokens_python.recipe.session.interfaces import (
 )
 from supertokens_python.recipe.session.recipe import SessionRecipe
 from supertokens_python.types import MaybeAwaitable
-from supertokens_python.utils import FRAMEWORKS, resolve
+from supertokens_python.utils import FRAMEWORKS, map_with_concurrency, resolve
 
 from ...jwt.interfaces import (
     CreateJwtOkResult,
@@ -467,6 +469,96 @@ async def revoke_multiple_sessions(
     )
 
 
+async def revoke_all_sessions_for_users(
+    user_ids: Iterable[str],
+    tenant_id: Optional[str] = None,
+    concurrency: int = 10,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[RevokeAllSessionsForUserResult]:
+    """
+    Revokes all the sessions of each of the users, with at most `concurrency` core
+    calls at a time. A failure for one user doesn't stop the others; it's returned in
+    the user's result. `on_progress` is called with the number of users done after
+    each user.
+    """
+    if user_context is None:
+        user_context = {}
+    ctx: Dict[str, Any] = user_context
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    done = 0
+
+    async def revoke(user_id: str) -> RevokeAllSessionsForUserResult:
+        nonlocal done
+        try:
+            result = RevokeAllSessionsForUserResult(
+                user_id,
+                await recipe_implementation.revoke_all_sessions_for_user(
+                    user_id,
+                    tenant_id or DEFAULT_TENANT_ID,
+                    tenant_id is None,
+                    ctx,
+                ),
+            )
+        except Exception as e:
+            result = RevokeAllSessionsForUserResult(user_id, [], e)
+        done += 1
+        if on_progress is not None:
+            on_progress(done)
+        return result
+
+    return await map_with_concurrency(revoke, user_ids, concurrency)
+
+
+async def revoke_sessions_in_batches(
+    session_handles: Iterable[str],
+    batch_size: int = 100,
+    concurrency: int = 5,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> RevokeSessionsResult:
+    """
+    Revokes the sessions, `batch_size` sessions per core call (using
+    `revoke_multiple_sessions`) with at most `concurrency` calls at a time. The handles
+    of batches whose call failed are returned in `failed_session_handles`.
+    `on_progress` is called with the number of handles done after each batch.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    if user_context is None:
+        user_context = {}
+    ctx: Dict[str, Any] = user_context
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    revoked: List[str] = []
+    failed: List[str] = []
+    done = 0
+
+    def get_batches() -> Iterable[List[str]]:
+        batch: List[str] = []
+        for session_handle in session_handles:
+            batch.append(session_handle)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def revoke(batch: List[str]) -> None:
+        nonlocal done
+        try:
+            revoked.extend(
+                await recipe_implementation.revoke_multiple_sessions(batch, ctx)
+            )
+        except Exception:
+            failed.extend(batch)
+        done += len(batch)
+        if on_progress is not None:
+            on_progress(done)
+
+    await map_with_concurrency(revoke, get_batches(), concurrency)
+    return RevokeSessionsResult(revoked, failed)
+
+
 async def get_session_information(
     session_handle: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> Union[SessionInformationResult, None]:
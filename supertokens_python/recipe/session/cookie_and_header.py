@@ -49,9 +49,11 @@ if TYPE_CHECKING:
         SessionConfig,
     )
 
+from base64 import b64encode
 from json import dumps
 from typing import Any, Dict
 
+from supertokens_python.json_codec import get_json_codec
 from supertokens_python.utils import get_header, utf_base64encode, get_timestamp_ms
 
 
@@ -61,9 +63,11 @@ def build_front_token(
     if access_token_payload is None:
         access_token_payload = {}
     token_info = {"uid": user_id, "ate": at_expiry, "up": access_token_payload}
-    return utf_base64encode(
-        dumps(token_info, separators=(",", ":"), sort_keys=True), urlsafe=False
-    )
+    token_json = get_json_codec().dumps(token_info, sort_keys=True)
+    if not token_json.isascii():
+        # Non ASCII characters are escaped in front tokens, like json.dumps does by default
+        token_json = dumps(token_info, separators=(",", ":"), sort_keys=True).encode()
+    return b64encode(token_json).decode("utf-8")
 
 
 def _set_front_token_in_headers(
@@ -484,27 +488,6 @@ def clear_session_cookies_from_older_cookie_domain(
 def has_multiple_cookies_for_token_type(
     request: BaseRequest, token_type: TokenType
 ) -> bool:
-    cookie_string = request.get_header("cookie")
-    if cookie_string is None:
-        return False
-
-    cookies = _parse_cookie_string_from_request_header_allow_duplicates(cookie_string)
+    cookies = request.get_cookies_allow_duplicates()
     cookie_name = get_cookie_name_from_token_type(token_type)
     return cookie_name in cookies and len(cookies[cookie_name]) > 1
-
-
-def _parse_cookie_string_from_request_header_allow_duplicates(
-    cookie_string: str,
-) -> Dict[str, List[str]]:
-    cookies: Dict[str, List[str]] = {}
-    cookie_pairs = cookie_string.split(";")
-    for cookie_pair in cookie_pairs:
-        name_value = cookie_pair.split("=")
-        if len(name_value) != 2:
-            continue
-        name, value = unquote(name_value[0].strip()), unquote(name_value[1].strip())
-        if name in cookies:
-            cookies[name].append(value)
-        else:
-            cookies[name] = [value]
-    return cookies
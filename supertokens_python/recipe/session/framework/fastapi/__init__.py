@@ -11,13 +11,12 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import json
-
 from typing import Any, Callable, Coroutine, Dict, Union, List, Optional
 
 from supertokens_python import Supertokens
 from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
 from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.json_codec import get_json_codec
 from supertokens_python.recipe.session import SessionRecipe
 from supertokens_python.exceptions import SuperTokensError
 from supertokens_python.types import MaybeAwaitable
@@ -87,7 +86,7 @@ async def session_exception_handler(
         base_req, exc, base_res, user_context
     )
     if isinstance(result, FastApiResponse):
-        body = json.loads(result.response.body)
+        body = get_json_codec().loads(result.response.body)
         return JSONResponse(body, status_code=result.response.status_code)
 
     raise Exception("Should never come here")
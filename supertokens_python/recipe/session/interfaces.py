@@ -89,6 +89,28 @@ class SessionInformationResult:
         self.tenant_id = tenant_id
 
 
+class RevokeAllSessionsForUserResult:
+    def __init__(
+        self,
+        user_id: str,
+        session_handles_revoked: List[str],
+        error: Optional[Exception] = None,
+    ):
+        self.user_id = user_id
+        # Empty if revoking the sessions failed, with the reason in `error`
+        self.session_handles_revoked = session_handles_revoked
+        self.error = error
+
+
+class RevokeSessionsResult:
+    def __init__(
+        self, session_handles_revoked: List[str], failed_session_handles: List[str]
+    ):
+        self.session_handles_revoked = session_handles_revoked
+        # The handles in batches for which the core call failed
+        self.failed_session_handles = failed_session_handles
+
+
 class ReqResInfo:
     def __init__(
         self,
@@ -12,7 +12,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import requests
 from os import environ
 from typing import List, Optional
 from typing_extensions import TypedDict
@@ -21,6 +20,7 @@ from jwt import PyJWK, PyJWKSet
 
 from supertokens_python.recipe.session.utils import SessionConfig
 from supertokens_python.utils import RWMutex, RWLockContext, get_timestamp_ms
+from supertokens_python.instrumentation import record_event, start_span
 from supertokens_python.querier import Querier
 from supertokens_python.logger import log_debug_message
 
@@ -95,6 +95,7 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
 
     with RWLockContext(mutex, read=True):
         matching_keys = find_matching_keys(get_cached_keys(), kid)
+        record_event("cache", {"cache": "jwks", "hit": matching_keys is not None})
         if matching_keys is not None:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Returning JWKS from cache")
@@ -119,6 +120,8 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
         if matching_keys is not None:
             return matching_keys
 
+        import requests
+
         for path in core_paths:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Attempting to fetch JWKS from path: %s", path)
@@ -126,7 +129,7 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
             cached_jwks: Optional[List[PyJWK]] = None
             try:
                 log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
+                with start_span("jwks_fetch", {"url": path}), requests.get(
                     path, timeout=JWKSConfig["request_timeout"] / 1000
                 ) as response:  # 5 second timeout
                     response.raise_for_status()
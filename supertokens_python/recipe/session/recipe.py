@@ -58,6 +58,7 @@ from .api import handle_refresh_api, handle_signout_api
 from .utils import (
     InputErrorHandlers,
     InputOverrideConfig,
+    CheckDatabaseCacheConfig,
     TokenTransferMethod,
     validate_and_normalise_user_input,
 )
@@ -93,6 +94,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        coalesce_refresh_requests: Union[bool, None] = None,
+        check_database_cache: Union[CheckDatabaseCacheConfig, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -110,6 +113,8 @@ class SessionRecipe(RecipeModule):
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
             jwks_refresh_interval_sec,
+            coalesce_refresh_requests,
+            check_database_cache,
         )
         self.openid_recipe = OpenIdRecipe(
             recipe_id,
@@ -310,6 +315,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        coalesce_refresh_requests: Union[bool, None] = None,
+        check_database_cache: Union[CheckDatabaseCacheConfig, None] = None,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -329,6 +336,8 @@ class SessionRecipe(RecipeModule):
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
                     jwks_refresh_interval_sec,
+                    coalesce_refresh_requests,
+                    check_database_cache,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
@@ -16,9 +16,11 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.instrumentation import start_span
+from supertokens_python.json_codec import get_json_codec
+from supertokens_python.logger import is_debug_enabled, log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
-from supertokens_python.utils import resolve
+from supertokens_python.utils import TTLCache, resolve
 
 from ...types import MaybeAwaitable
 from . import session_functions
@@ -58,6 +60,19 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         self.querier = querier
         self.config = config
         self.app_info = app_info
+        self.check_database_cache: Optional[
+            TTLCache[str, session_functions.CheckDatabaseCacheEntry]
+        ] = (
+            TTLCache(
+                config.check_database_cache.ttl_sec * 1000,
+                config.check_database_cache.max_size,
+            )
+            if config.check_database_cache is not None
+            else None
+        )
+        # Incremented whenever sessions are revoked, so that a verification which
+        # started before a revocation doesn't put the revoked session back in the cache
+        self.check_database_cache_version = 0
 
     async def create_new_session(
         self,
@@ -112,7 +127,8 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         user_context: Dict[str, Any],
     ) -> ClaimsValidationResult:
         access_token_payload_update = None
-        original_access_token_payload = json.dumps(access_token_payload)
+        json_codec = get_json_codec()
+        original_access_token_payload = json_codec.dumps(access_token_payload)
 
         for validator in claim_validators:
             log_debug_message(
@@ -125,24 +141,26 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        user_context,
+                with start_span("claim_fetch", {"claim": validator.claim.key}):
+                    value = await resolve(
+                        validator.claim.fetch_value(
+                            user_id,
+                            access_token_payload.get("tId", DEFAULT_TENANT_ID),
+                            user_context,
+                        )
+                    )
+                if is_debug_enabled():
+                    log_debug_message(
+                        "update_claims_in_payload_if_needed %s refetch result %s",
+                        validator.id,
+                        json.dumps(value),
                     )
-                )
-                log_debug_message(
-                    "update_claims_in_payload_if_needed %s refetch result %s",
-                    validator.id,
-                    json.dumps(value),
-                )
                 if value is not None:
                     access_token_payload = validator.claim.add_to_payload_(
                         access_token_payload, value, user_context
                     )
 
-        if json.dumps(access_token_payload) != original_access_token_payload:
+        if json_codec.dumps(access_token_payload) != original_access_token_payload:
             access_token_payload_update = access_token_payload
 
         invalid_claims = await validate_claims_in_payload(
@@ -13,8 +13,10 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional
 
 from supertokens_python.recipe.session.interfaces import SessionInformationResult
 
@@ -24,6 +26,7 @@ from .jwt import ParsedJWTInfo
 if TYPE_CHECKING:
     from .recipe_implementation import RecipeImplementation
 
+from supertokens_python.instrumentation import start_span
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.process_state import AllowedProcessStates, ProcessState
@@ -77,6 +80,27 @@ class GetSessionAPIResponseSession:
         self.tenant_id = tenant_id
 
 
+class CheckDatabaseCacheEntry:
+    def __init__(self, access_token_hash: str, session: GetSessionAPIResponseSession):
+        self.access_token_hash = access_token_hash
+        self.session = session
+
+
+def get_access_token_hash(access_token: str) -> str:
+    return sha256(access_token.encode("utf-8")).hexdigest()
+
+
+def remove_from_check_database_cache(
+    recipe_implementation: RecipeImplementation, session_handles: List[str]
+):
+    check_database_cache = recipe_implementation.check_database_cache
+    if check_database_cache is None:
+        return
+    recipe_implementation.check_database_cache_version += 1
+    for session_handle in session_handles:
+        check_database_cache.delete(session_handle)
+
+
 class GetSessionAPIResponseAccessToken:
     def __init__(self, token: str, expiry: int, createdTime: int) -> None:
         self.token = token
@@ -157,11 +181,13 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
-            config,
-            parsed_access_token,
-            config.anti_csrf_function_or_string == "VIA_TOKEN" and do_anti_csrf_check,
-        )
+        with start_span("access_token_verification", {}):
+            access_token_info = get_info_from_access_token(
+                config,
+                parsed_access_token,
+                config.anti_csrf_function_or_string == "VIA_TOKEN"
+                and do_anti_csrf_check,
+            )
 
     except Exception as e:
         if not isinstance(e, TryRefreshTokenError):
@@ -270,6 +296,30 @@ async def get_session(
             )
         )
 
+    # If the token passed local verification, the core call is only made to check that the
+    # session has not been revoked. If enabled, we trust a recent successful check for a while.
+    check_database_cache = recipe_implementation.check_database_cache
+    check_database_cache_version = recipe_implementation.check_database_cache_version
+    access_token_hash: Optional[str] = None
+    if (
+        check_database_cache is not None
+        and access_token_info is not None
+        and always_check_core
+        and access_token_info["parentRefreshTokenHash1"] is None
+    ):
+        access_token_hash = get_access_token_hash(
+            parsed_access_token.raw_token_string
+        )
+        cache_entry = check_database_cache.get(access_token_info["sessionHandle"])
+        if (
+            cache_entry is not None
+            and cache_entry.access_token_hash == access_token_hash
+        ):
+            log_debug_message(
+                "getSession: Returning session from the check_database cache"
+            )
+            return GetSessionAPIResponse(cache_entry.session)
+
     ProcessState.get_instance().add_state(
         AllowedProcessStates.CALLING_SERVICE_IN_VERIFY
     )
@@ -289,6 +339,26 @@ async def get_session(
         user_context=user_context,
     )
     if response["status"] == "OK":
+        if (
+            check_database_cache is not None
+            and access_token_info is not None
+            and access_token_hash is not None
+            and "accessToken" not in response
+            and check_database_cache_version
+            == recipe_implementation.check_database_cache_version
+        ):
+            session = GetSessionAPIResponseSession(
+                response["session"]["handle"],
+                response["session"]["userId"],
+                response["session"]["userDataInJWT"],
+                access_token_info["expiryTime"],
+                response["session"].get("tenantId") or access_token_info["tenantId"],
+            )
+            check_database_cache.set(
+                session.handle, CheckDatabaseCacheEntry(access_token_hash, session)
+            )
+            return GetSessionAPIResponse(session)
+
         return GetSessionAPIResponse(
             GetSessionAPIResponseSession(
                 response["session"]["handle"],
@@ -329,6 +399,31 @@ async def get_session(
     raise_try_refresh_token_exception(response["message"])
 
 
+# Refresh calls that are currently waiting on the core, keyed by the event loop they
+# run on and a hash of the refresh call inputs. Only used if coalesce_refresh_requests is enabled.
+in_flight_refreshes: Dict[
+    Tuple[int, str], "asyncio.Future[CreateOrRefreshAPIResponse]"
+] = {}
+
+
+def get_refresh_coalescing_key(
+    refresh_token: str,
+    anti_csrf_token: Union[str, None],
+    disable_anti_csrf: bool,
+    use_dynamic_access_token_signing_key: bool,
+) -> str:
+    return sha256(
+        "\n".join(
+            [
+                refresh_token,
+                anti_csrf_token or "",
+                str(disable_anti_csrf),
+                str(use_dynamic_access_token_signing_key),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
 async def refresh_session(
     recipe_implementation: RecipeImplementation,
     refresh_token: str,
@@ -336,6 +431,58 @@ async def refresh_session(
     disable_anti_csrf: bool,
     use_dynamic_access_token_signing_key: bool,
     user_context: Optional[Dict[str, Any]],
+) -> CreateOrRefreshAPIResponse:
+    if not recipe_implementation.config.coalesce_refresh_requests:
+        return await refresh_session_using_core(
+            recipe_implementation,
+            refresh_token,
+            anti_csrf_token,
+            disable_anti_csrf,
+            use_dynamic_access_token_signing_key,
+            user_context,
+        )
+
+    # Frontends with multiple tabs open can send several refresh calls with the same
+    # refresh token at the same time. We make only one core call for these and all the
+    # callers get the same new tokens. Futures are bound to an event loop, so we only
+    # share calls made on the same loop.
+    key = (
+        id(asyncio.get_running_loop()),
+        get_refresh_coalescing_key(
+            refresh_token,
+            anti_csrf_token,
+            disable_anti_csrf,
+            use_dynamic_access_token_signing_key,
+        ),
+    )
+    in_flight = in_flight_refreshes.get(key)
+    if in_flight is None:
+        in_flight = asyncio.ensure_future(
+            refresh_session_using_core(
+                recipe_implementation,
+                refresh_token,
+                anti_csrf_token,
+                disable_anti_csrf,
+                use_dynamic_access_token_signing_key,
+                user_context,
+            )
+        )
+        in_flight_refreshes[key] = in_flight
+        in_flight.add_done_callback(lambda _: in_flight_refreshes.pop(key, None))
+    else:
+        log_debug_message("refreshSession: Sharing result of an in-flight refresh call")
+
+    # shield so that one of the callers being cancelled does not cancel the call for the others
+    return await asyncio.shield(in_flight)
+
+
+async def refresh_session_using_core(
+    recipe_implementation: RecipeImplementation,
+    refresh_token: str,
+    anti_csrf_token: Union[str, None],
+    disable_anti_csrf: bool,
+    use_dynamic_access_token_signing_key: bool,
+    user_context: Optional[Dict[str, Any]],
 ) -> CreateOrRefreshAPIResponse:
     data = {
         "refreshToken": refresh_token,
@@ -421,6 +568,9 @@ async def revoke_all_sessions_for_user(
             {"userId": user_id, "revokeAcrossAllTenants": revoke_across_all_tenants},
             user_context=user_context,
         )
+    remove_from_check_database_cache(
+        recipe_implementation, response["sessionHandlesRevoked"]
+    )
     return response["sessionHandlesRevoked"]
 
 
@@ -459,6 +609,7 @@ async def revoke_session(
         {"sessionHandles": [session_handle]},
         user_context=user_context,
     )
+    remove_from_check_database_cache(recipe_implementation, [session_handle])
     return len(response["sessionHandlesRevoked"]) == 1
 
 
@@ -472,6 +623,7 @@ async def revoke_multiple_sessions(
         {"sessionHandles": session_handles},
         user_context=user_context,
     )
+    remove_from_check_database_cache(recipe_implementation, session_handles)
     return response["sessionHandlesRevoked"]
 
 
@@ -503,6 +655,7 @@ async def update_access_token_payload(
         {"sessionHandle": session_handle, "userDataInJWT": new_access_token_payload},
         user_context=user_context,
     )
+    remove_from_check_database_cache(recipe_implementation, [session_handle])
     if response["status"] == "UNAUTHORISED":
         return False
 
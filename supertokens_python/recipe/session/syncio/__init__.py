@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Dict, List, Union, Callable, Optional, TypeVar
+from typing import Any, Dict, Iterable, List, Union, Callable, Optional, TypeVar
 
 from supertokens_python.async_to_sync_wrapper import sync
 from supertokens_python.recipe.openid.interfaces import (
@@ -32,6 +32,8 @@ from ..interfaces import (
     SessionClaim,
     JSONObject,
     ClaimsValidationResult,
+    RevokeAllSessionsForUserResult,
+    RevokeSessionsResult,
     SessionDoesNotExistError,
     GetClaimValueOkResult,
 )
@@ -221,6 +223,42 @@ def revoke_multiple_sessions(
     return sync(async_revoke_multiple_sessions(session_handles, user_context))
 
 
+def revoke_all_sessions_for_users(
+    user_ids: Iterable[str],
+    tenant_id: Optional[str] = None,
+    concurrency: int = 10,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[RevokeAllSessionsForUserResult]:
+    from supertokens_python.recipe.session.asyncio import (
+        revoke_all_sessions_for_users as async_revoke_all_sessions_for_users,
+    )
+
+    return sync(
+        async_revoke_all_sessions_for_users(
+            user_ids, tenant_id, concurrency, on_progress, user_context
+        )
+    )
+
+
+def revoke_sessions_in_batches(
+    session_handles: Iterable[str],
+    batch_size: int = 100,
+    concurrency: int = 5,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> RevokeSessionsResult:
+    from supertokens_python.recipe.session.asyncio import (
+        revoke_sessions_in_batches as async_revoke_sessions_in_batches,
+    )
+
+    return sync(
+        async_revoke_sessions_in_batches(
+            session_handles, batch_size, concurrency, on_progress, user_context
+        )
+    )
+
+
 def get_session_information(
     session_handle: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> Union[SessionInformationResult, None]:
@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
@@ -23,6 +24,7 @@ from supertokens_python.exceptions import raise_general_exception
 from supertokens_python.framework import BaseResponse
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.utils import (
+    get_top_level_domain_for_same_site_resolution,
     is_an_ip_address,
     resolve,
     send_200_response,
@@ -49,7 +51,7 @@ if TYPE_CHECKING:
     )
     from .recipe import SessionRecipe
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import is_debug_enabled, log_debug_message
 
 
 def normalise_session_scope(session_scope: str) -> str:
@@ -349,6 +351,23 @@ class OverrideConfig:
         self.apis = apis
 
 
+class CheckDatabaseCacheConfig:
+    """
+    Enables caching successful check_database session verifications in memory for
+    `ttl_sec` seconds, for at most `max_size` sessions. Revoking sessions through this
+    SDK instance clears their entries, but sessions revoked elsewhere (another process
+    or the core directly) may still be considered valid till their entry expires.
+    """
+
+    def __init__(self, ttl_sec: int = 5, max_size: int = 10000):
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+
+
 TokenType = Literal["access", "refresh"]
 TokenTransferMethod = Literal["cookie", "header"]
 
@@ -384,6 +403,8 @@ class SessionConfig:
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
         jwks_refresh_interval_sec: int,
+        coalesce_refresh_requests: bool,
+        check_database_cache: Optional[CheckDatabaseCacheConfig],
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -404,6 +425,8 @@ class SessionConfig:
         self.framework = framework
         self.mode = mode
         self.jwks_refresh_interval_sec = jwks_refresh_interval_sec
+        self.coalesce_refresh_requests = coalesce_refresh_requests
+        self.check_database_cache = check_database_cache
 
 
 def validate_and_normalise_user_input(
@@ -427,6 +450,8 @@ def validate_and_normalise_user_input(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    coalesce_refresh_requests: Union[bool, None] = None,
+    check_database_cache: Union[CheckDatabaseCacheConfig, None] = None,
 ):
     _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
@@ -440,6 +465,11 @@ def validate_and_normalise_user_input(
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
 
+    if check_database_cache is not None and not isinstance(check_database_cache, CheckDatabaseCacheConfig):  # type: ignore
+        raise ValueError(
+            "check_database_cache must be an instance of CheckDatabaseCacheConfig or None"
+        )
+
     cookie_domain = (
         normalise_session_scope(cookie_domain) if cookie_domain is not None else None
     )
@@ -491,30 +521,31 @@ def validate_and_normalise_user_input(
         # as provided an empty string.
         _ = normalise_same_site(cookie_same_site)
 
+    api_domain_scheme = get_url_scheme(app_info.api_domain.get_as_string_dangerous())
+
+    # The origin can be a function of the request, so we memoise the result for each
+    # origin instead of resolving the top level domain of the origin on every call.
+    @lru_cache(maxsize=1024)
+    def get_cookie_same_site_for_origin(
+        origin: str,
+    ) -> Literal["lax", "strict", "none"]:
+        top_level_website_domain = get_top_level_domain_for_same_site_resolution(
+            origin
+        )
+        if (app_info.top_level_api_domain != top_level_website_domain) or (
+            api_domain_scheme != get_url_scheme(origin)
+        ):
+            return "none"
+        return "lax"
+
     def get_cookie_same_site(
         request: Optional[BaseRequest], user_context: Dict[str, Any]
     ) -> Literal["lax", "strict", "none"]:
-        nonlocal cookie_same_site
         if cookie_same_site is not None:
             return normalise_same_site(cookie_same_site)
-        top_level_api_domain = app_info.top_level_api_domain
-        top_level_website_domain = app_info.get_top_level_website_domain(
-            request, user_context
-        )
-
-        api_domain_scheme = get_url_scheme(
-            app_info.api_domain.get_as_string_dangerous()
-        )
-        website_domain_scheme = get_url_scheme(
+        return get_cookie_same_site_for_origin(
             app_info.get_origin(request, user_context).get_as_string_dangerous()
         )
-        if (top_level_api_domain != top_level_website_domain) or (
-            api_domain_scheme != website_domain_scheme
-        ):
-            cookie_same_site = "none"
-        else:
-            cookie_same_site = "lax"
-        return cookie_same_site
 
     def anti_csrf_function(
         request: Optional[BaseRequest], user_context: Dict[str, Any]
@@ -537,6 +568,9 @@ def validate_and_normalise_user_input(
     if jwks_refresh_interval_sec is None:
         jwks_refresh_interval_sec = 4 * 3600  # 4 hours
 
+    if coalesce_refresh_requests is None:
+        coalesce_refresh_requests = False
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -554,6 +588,8 @@ def validate_and_normalise_user_input(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        coalesce_refresh_requests,
+        check_database_cache,
     )
 
 
@@ -601,11 +637,12 @@ async def validate_claims_in_payload(
         claim_validation_res = await validator.validate(
             new_access_token_payload, user_context
         )
-        log_debug_message(
-            "validate_claims_in_payload %s validate res %s",
-            validator.id,
-            json.dumps(claim_validation_res.__dict__),
-        )
+        if is_debug_enabled():
+            log_debug_message(
+                "validate_claims_in_payload %s validate res %s",
+                validator.id,
+                json.dumps(claim_validation_res.__dict__),
+            )
         if not claim_validation_res.is_valid:
             validation_errors.append(
                 ClaimValidationError(validator.id, claim_validation_res.reason)
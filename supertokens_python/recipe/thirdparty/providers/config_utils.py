@@ -1,20 +1,8 @@
-from typing import List, Dict, Optional, Any
+from importlib import import_module
+from typing import List, Dict, Optional, Any, Tuple
 
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
-from .active_directory import ActiveDirectory
-from .apple import Apple
-from .bitbucket import Bitbucket
-from .boxy_saml import BoxySAML
-from .discord import Discord
-from .facebook import Facebook
-from .github import Github
-from .gitlab import Gitlab
-from .google_workspaces import GoogleWorkspaces
-from .google import Google
-from .linkedin import Linkedin
-from .twitter import Twitter
-from .okta import Okta
 from .custom import NewProvider
 from .utils import do_get_request
 
@@ -186,33 +174,31 @@ def merge_providers_from_core_and_static(
     return merged_providers
 
 
+# (third party ID prefix, module, class) of the built in providers. The module of a provider
+# is only imported once a provider with a matching third party ID is created. More specific
+# prefixes must come first (e.g. google-workspaces before google).
+BUILT_IN_PROVIDERS: List[Tuple[str, str, str]] = [
+    ("active-directory", "active_directory", "ActiveDirectory"),
+    ("apple", "apple", "Apple"),
+    ("bitbucket", "bitbucket", "Bitbucket"),
+    ("discord", "discord", "Discord"),
+    ("facebook", "facebook", "Facebook"),
+    ("github", "github", "Github"),
+    ("gitlab", "gitlab", "Gitlab"),
+    ("google-workspaces", "google_workspaces", "GoogleWorkspaces"),
+    ("google", "google", "Google"),
+    ("okta", "okta", "Okta"),
+    ("linkedin", "linkedin", "Linkedin"),
+    ("twitter", "twitter", "Twitter"),
+    ("boxy-saml", "boxy_saml", "BoxySAML"),
+]
+
+
 def create_provider(provider_input: ProviderInput) -> Provider:
-    if provider_input.config.third_party_id.startswith("active-directory"):
-        return ActiveDirectory(provider_input)
-    if provider_input.config.third_party_id.startswith("apple"):
-        return Apple(provider_input)
-    if provider_input.config.third_party_id.startswith("bitbucket"):
-        return Bitbucket(provider_input)
-    if provider_input.config.third_party_id.startswith("discord"):
-        return Discord(provider_input)
-    if provider_input.config.third_party_id.startswith("facebook"):
-        return Facebook(provider_input)
-    if provider_input.config.third_party_id.startswith("github"):
-        return Github(provider_input)
-    if provider_input.config.third_party_id.startswith("gitlab"):
-        return Gitlab(provider_input)
-    if provider_input.config.third_party_id.startswith("google-workspaces"):
-        return GoogleWorkspaces(provider_input)
-    if provider_input.config.third_party_id.startswith("google"):
-        return Google(provider_input)
-    if provider_input.config.third_party_id.startswith("okta"):
-        return Okta(provider_input)
-    if provider_input.config.third_party_id.startswith("linkedin"):
-        return Linkedin(provider_input)
-    if provider_input.config.third_party_id.startswith("twitter"):
-        return Twitter(provider_input)
-    if provider_input.config.third_party_id.startswith("boxy-saml"):
-        return BoxySAML(provider_input)
+    for prefix, module_name, class_name in BUILT_IN_PROVIDERS:
+        if provider_input.config.third_party_id.startswith(prefix):
+            module = import_module("." + module_name, __package__)
+            return getattr(module, class_name)(provider_input)
 
     return NewProvider(provider_input)
 
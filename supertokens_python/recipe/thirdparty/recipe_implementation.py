@@ -16,6 +16,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.emailverification.recipe import EmailVerificationRecipe
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
 from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
@@ -138,6 +139,10 @@ class RecipeImplementation(RecipeInterface):
             data,
             user_context=user_context,
         )
+        # Signing in updates the email of an existing user if it has changed
+        ev_recipe = EmailVerificationRecipe.get_instance_optional()
+        if ev_recipe is not None:
+            ev_recipe.forget_email_for_user_id(response["user"]["id"])
         return SignInUpOkResult(
             User(
                 response["user"]["id"],
@@ -172,6 +177,10 @@ class RecipeImplementation(RecipeInterface):
             data,
             user_context=user_context,
         )
+        # Signing in updates the email of an existing user if it has changed
+        ev_recipe = EmailVerificationRecipe.get_instance_optional()
+        if ev_recipe is not None:
+            ev_recipe.forget_email_for_user_id(response["user"]["id"])
         return ManuallyCreateOrUpdateUserOkResult(
             User(
                 response["user"]["id"],
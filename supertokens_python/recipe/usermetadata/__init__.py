@@ -18,6 +18,8 @@ from typing import TYPE_CHECKING, Callable, Union
 from . import utils
 from .recipe import UserMetadataRecipe
 
+MetadataCacheConfig = utils.MetadataCacheConfig
+
 if TYPE_CHECKING:
     from supertokens_python.supertokens import AppInfo
 
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 
 
 def init(
-    override: Union[utils.InputOverrideConfig, None] = None
+    override: Union[utils.InputOverrideConfig, None] = None,
+    metadata_cache: Union[MetadataCacheConfig, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
-    return UserMetadataRecipe.init(override)
+    return UserMetadataRecipe.init(override, metadata_cache)
@@ -33,7 +33,7 @@ from supertokens_python.recipe.usermetadata.utils import (
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 from supertokens_python.supertokens import AppInfo
 
-from .utils import InputOverrideConfig
+from .utils import InputOverrideConfig, MetadataCacheConfig
 
 
 class UserMetadataRecipe(RecipeModule):
@@ -45,10 +45,15 @@ class UserMetadataRecipe(RecipeModule):
         recipe_id: str,
         app_info: AppInfo,
         override: Union[InputOverrideConfig, None] = None,
+        metadata_cache: Union[MetadataCacheConfig, None] = None,
     ):
         super().__init__(recipe_id, app_info)
-        self.config = validate_and_normalise_user_input(self, app_info, override)
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
+        self.config = validate_and_normalise_user_input(
+            self, app_info, override, metadata_cache
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.config
+        )
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -88,11 +93,14 @@ class UserMetadataRecipe(RecipeModule):
         return []
 
     @staticmethod
-    def init(override: Union[InputOverrideConfig, None] = None):
+    def init(
+        override: Union[InputOverrideConfig, None] = None,
+        metadata_cache: Union[MetadataCacheConfig, None] = None,
+    ):
         def func(app_info: AppInfo):
             if UserMetadataRecipe.__instance is None:
                 UserMetadataRecipe.__instance = UserMetadataRecipe(
-                    UserMetadataRecipe.recipe_id, app_info, override
+                    UserMetadataRecipe.recipe_id, app_info, override, metadata_cache
                 )
                 return UserMetadataRecipe.__instance
             raise Exception(
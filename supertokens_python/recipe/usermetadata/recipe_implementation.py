@@ -13,28 +13,74 @@
 # under the License.
 
 
-from typing import Any, Dict
+from copy import deepcopy
+from typing import Any, Dict, Optional
 
+from supertokens_python.instrumentation import record_event
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
+from supertokens_python.utils import TTLCache
 
 from .interfaces import ClearUserMetadataResult, MetadataResult, RecipeInterface
+from .utils import UserMetadataConfig
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(self, querier: Querier, config: UserMetadataConfig):
         super().__init__()
         self.querier = querier
+        self.metadata_cache: Optional[TTLCache[str, Dict[str, Any]]] = (
+            TTLCache(
+                config.metadata_cache.ttl_sec * 1000, config.metadata_cache.max_size
+            )
+            if config.metadata_cache is not None
+            else None
+        )
+        # Incremented on every update, so that a read which started before an update
+        # doesn't cache the metadata from before it
+        self.metadata_cache_version = 0
+
+    def cache_metadata(
+        self,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]],
+        read_cache_version: Optional[int] = None,
+    ):
+        """
+        Caches the metadata after an update to it, or after reading it from the core,
+        if `read_cache_version` (the cache version from before the read) is given.
+        """
+        if self.metadata_cache is None:
+            return
+        if read_cache_version is None:
+            self.metadata_cache_version += 1
+        elif read_cache_version != self.metadata_cache_version:
+            return
+        if metadata is None:
+            self.metadata_cache.delete(user_id)
+        else:
+            # Copied so that changes made by the caller to the result are not cached
+            self.metadata_cache.set(user_id, deepcopy(metadata))
 
     async def get_user_metadata(
         self, user_id: str, user_context: Dict[str, Any]
     ) -> MetadataResult:
+        cache_version = self.metadata_cache_version
+        if self.metadata_cache is not None:
+            metadata = self.metadata_cache.get(user_id)
+            record_event(
+                "cache", {"cache": "user_metadata", "hit": metadata is not None}
+            )
+            if metadata is not None:
+                return MetadataResult(metadata=deepcopy(metadata))
+
         params = {"userId": user_id}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/user/metadata"),
             params,
             user_context=user_context,
         )
+        self.cache_metadata(user_id, response["metadata"], cache_version)
         return MetadataResult(metadata=response["metadata"])
 
     async def update_user_metadata(
@@ -49,6 +95,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.cache_metadata(user_id, response["metadata"])
         return MetadataResult(metadata=response["metadata"])
 
     async def clear_user_metadata(
@@ -60,4 +107,5 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.cache_metadata(user_id, None)
         return ClearUserMetadataResult()
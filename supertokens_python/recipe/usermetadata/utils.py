@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from supertokens_python.recipe.usermetadata.interfaces import (
     APIInterface,
@@ -36,20 +36,48 @@ class InputOverrideConfig:
         self.apis = apis
 
 
+class MetadataCacheConfig:
+    """
+    Enables caching the metadata of at most `max_size` users in memory, for `ttl_sec`
+    seconds. Updating or clearing the metadata of a user through this SDK instance
+    updates the cache, but changes made elsewhere (another process or the core directly)
+    may not be seen till the entry expires.
+    """
+
+    def __init__(self, ttl_sec: int = 60, max_size: int = 10000):
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+
+
 class UserMetadataConfig:
-    def __init__(self, override: InputOverrideConfig) -> None:
+    def __init__(
+        self,
+        override: InputOverrideConfig,
+        metadata_cache: Optional[MetadataCacheConfig],
+    ) -> None:
         self.override = override
+        self.metadata_cache = metadata_cache
 
 
 def validate_and_normalise_user_input(
     _recipe: UserMetadataRecipe,
     _app_info: AppInfo,
     override: Union[InputOverrideConfig, None] = None,
+    metadata_cache: Union[MetadataCacheConfig, None] = None,
 ) -> UserMetadataConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
 
+    if metadata_cache is not None and not isinstance(metadata_cache, MetadataCacheConfig):  # type: ignore
+        raise ValueError(
+            "metadata_cache must be an instance of MetadataCacheConfig or None"
+        )
+
     if override is None:
         override = InputOverrideConfig()
 
-    return UserMetadataConfig(override=override)
+    return UserMetadataConfig(override=override, metadata_cache=metadata_cache)
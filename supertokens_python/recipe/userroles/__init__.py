@@ -21,6 +21,7 @@ from . import recipe
 
 PermissionClaim = recipe.PermissionClaim
 UserRoleClaim = recipe.UserRoleClaim
+RolesCacheConfig = utils.RolesCacheConfig
 
 if TYPE_CHECKING:
     from supertokens_python.supertokens import AppInfo
@@ -32,9 +33,11 @@ def init(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[utils.InputOverrideConfig, None] = None,
+    roles_cache: Union[RolesCacheConfig, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return UserRolesRecipe.init(
         skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token,
         override,
+        roles_cache,
     )
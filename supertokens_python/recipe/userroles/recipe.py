@@ -33,7 +33,7 @@ from ..session import SessionRecipe
 from ..session.claim_base_classes.primitive_array_claim import PrimitiveArrayClaim
 from .exceptions import SuperTokensUserRolesError
 from .interfaces import GetPermissionsForRoleOkResult
-from .utils import InputOverrideConfig
+from .utils import InputOverrideConfig, RolesCacheConfig
 
 
 class UserRolesRecipe(RecipeModule):
@@ -47,6 +47,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        roles_cache: Union[RolesCacheConfig, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -55,8 +56,11 @@ class UserRolesRecipe(RecipeModule):
             skip_adding_roles_to_access_token,
             skip_adding_permissions_to_access_token,
             override,
+            roles_cache,
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.config
         )
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -110,6 +114,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        roles_cache: Union[RolesCacheConfig, None] = None,
     ):
         def func(app_info: AppInfo):
             if UserRolesRecipe.__instance is None:
@@ -119,6 +124,7 @@ class UserRolesRecipe(RecipeModule):
                     skip_adding_roles_to_access_token,
                     skip_adding_permissions_to_access_token,
                     override,
+                    roles_cache,
                 )
                 return UserRolesRecipe.__instance
             raise Exception(
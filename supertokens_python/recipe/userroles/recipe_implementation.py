@@ -13,10 +13,12 @@
 # under the License.
 
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from supertokens_python.instrumentation import record_event
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
+from supertokens_python.utils import TTLCache
 
 from .interfaces import (
     AddRoleToUserOkResult,
@@ -32,12 +34,35 @@ from .interfaces import (
     RemoveUserRoleOkResult,
     UnknownRoleError,
 )
+from .utils import UserRolesConfig
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(self, querier: Querier, config: UserRolesConfig):
         super().__init__()
         self.querier = querier
+        # The roles of a user, by (tenant id, user id)
+        self.roles_cache: Optional[TTLCache[Tuple[str, str], List[str]]] = (
+            TTLCache(config.roles_cache.ttl_sec * 1000, config.roles_cache.max_size)
+            if config.roles_cache is not None
+            else None
+        )
+        # Incremented on every change to roles, so that a read which started before a
+        # change doesn't cache the roles from before it
+        self.roles_cache_version = 0
+
+    def invalidate_roles_cache(self, key: Optional[Tuple[str, str]]):
+        """
+        Removes the roles of a (tenant id, user id) from the cache, or of all users if
+        `key` is None.
+        """
+        if self.roles_cache is None:
+            return
+        self.roles_cache_version += 1
+        if key is None:
+            self.roles_cache.clear()
+        else:
+            self.roles_cache.delete(key)
 
     async def add_role_to_user(
         self,
@@ -52,6 +77,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.invalidate_roles_cache((tenant_id, user_id))
         if response["status"] == "OK":
             return AddRoleToUserOkResult(
                 did_user_already_have_role=response["didUserAlreadyHaveRole"]
@@ -71,6 +97,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.invalidate_roles_cache((tenant_id, user_id))
         if response["status"] == "OK":
             return RemoveUserRoleOkResult(
                 did_user_have_role=response["didUserHaveRole"]
@@ -80,12 +107,21 @@ class RecipeImplementation(RecipeInterface):
     async def get_roles_for_user(
         self, user_id: str, tenant_id: str, user_context: Dict[str, Any]
     ) -> GetRolesForUserOkResult:
+        cache_version = self.roles_cache_version
+        if self.roles_cache is not None:
+            roles = self.roles_cache.get((tenant_id, user_id))
+            record_event("cache", {"cache": "user_roles", "hit": roles is not None})
+            if roles is not None:
+                return GetRolesForUserOkResult(roles=list(roles))
+
         params = {"userId": user_id}
         response = await self.querier.send_get_request(
             NormalisedURLPath(f"{tenant_id}/recipe/user/roles"),
             params,
             user_context=user_context,
         )
+        if self.roles_cache is not None and cache_version == self.roles_cache_version:
+            self.roles_cache.set((tenant_id, user_id), list(response["roles"]))
         return GetRolesForUserOkResult(roles=response["roles"])
 
     async def get_users_that_have_role(
@@ -160,6 +196,8 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        # The role is removed from all the users that had it, in all tenants
+        self.invalidate_roles_cache(None)
         return DeleteRoleOkResult(did_role_exist=response["didRoleExist"])
 
     async def get_all_roles(self, user_context: Dict[str, Any]) -> GetAllRolesOkResult:
@@ -33,18 +33,39 @@ class InputOverrideConfig:
         self.apis = apis
 
 
+class RolesCacheConfig:
+    """
+    Enables caching the roles of at most `max_size` users (per tenant) in memory, for
+    `ttl_sec` seconds. The cache is used by `get_roles_for_user`, and so by both
+    `UserRoleClaim` and `PermissionClaim`. Adding or removing roles of a user, or
+    deleting a role, through this SDK instance updates the cache, but changes made
+    elsewhere (another process or the core directly) may not be seen till the entry
+    expires.
+    """
+
+    def __init__(self, ttl_sec: int = 60, max_size: int = 10000):
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+
+
 class UserRolesConfig:
     def __init__(
         self,
         skip_adding_roles_to_access_token: bool,
         skip_adding_permissions_to_access_token: bool,
         override: InputOverrideConfig,
+        roles_cache: Optional[RolesCacheConfig],
     ) -> None:
         self.skip_adding_roles_to_access_token = skip_adding_roles_to_access_token
         self.skip_adding_permissions_to_access_token = (
             skip_adding_permissions_to_access_token
         )
         self.override = override
+        self.roles_cache = roles_cache
 
 
 def validate_and_normalise_user_input(
@@ -53,10 +74,14 @@ def validate_and_normalise_user_input(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[InputOverrideConfig, None] = None,
+    roles_cache: Union[RolesCacheConfig, None] = None,
 ) -> UserRolesConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
 
+    if roles_cache is not None and not isinstance(roles_cache, RolesCacheConfig):  # type: ignore
+        raise ValueError("roles_cache must be an instance of RolesCacheConfig or None")
+
     if override is None:
         override = InputOverrideConfig()
 
@@ -69,4 +94,5 @@ def validate_and_normalise_user_input(
         skip_adding_roles_to_access_token=skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token=skip_adding_permissions_to_access_token,
         override=override,
+        roles_cache=roles_cache,
     )
@@ -14,8 +14,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from os import environ
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+    Tuple,
+)
 
 from typing_extensions import Literal
 
@@ -26,7 +38,14 @@ from supertokens_python.logger import (
 )
 
 
-from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT, USER_DELETE, USERS
+from .constants import (
+    DEFAULT_MAX_REQUEST_BODY_SIZE,
+    FDI_KEY_HEADER,
+    RID_KEY_HEADER,
+    USER_COUNT,
+    USER_DELETE,
+    USERS,
+)
 from .exceptions import SuperTokensError
 from .interfaces import (
     CreateUserIdMappingOkResult,
@@ -59,7 +78,12 @@ if TYPE_CHECKING:
 
 import json
 
-from .exceptions import BadInputError, GeneralError, raise_general_exception
+from .exceptions import (
+    BadInputError,
+    GeneralError,
+    RequestBodyTooLargeError,
+    raise_general_exception,
+)
 
 
 class SupertokensConfig:
@@ -212,10 +236,19 @@ class Supertokens:
         mode: Optional[Literal["asgi", "wsgi"]],
         telemetry: Optional[bool],
         debug: Optional[bool],
+        max_request_body_size: Optional[int] = None,
     ):
         if not isinstance(app_info, InputAppInfo):  # type: ignore
             raise ValueError("app_info must be an instance of InputAppInfo")
 
+        if max_request_body_size is not None and max_request_body_size <= 0:
+            raise ValueError("max_request_body_size must be a positive integer")
+        self.max_request_body_size = (
+            max_request_body_size
+            if max_request_body_size is not None
+            else DEFAULT_MAX_REQUEST_BODY_SIZE
+        )
+
         self.app_info = AppInfo(
             app_info.app_name,
             app_info.api_domain,
@@ -288,6 +321,7 @@ class Supertokens:
         mode: Optional[Literal["asgi", "wsgi"]],
         telemetry: Optional[bool],
         debug: Optional[bool],
+        max_request_body_size: Optional[int] = None,
     ):
         if Supertokens.__instance is None:
             Supertokens.__instance = Supertokens(
@@ -298,9 +332,16 @@ class Supertokens:
                 mode,
                 telemetry,
                 debug,
+                max_request_body_size,
             )
             PostSTInitCallbacks.run_post_init_callbacks()
 
+    @staticmethod
+    def get_max_request_body_size() -> int:
+        if Supertokens.__instance is None:
+            return DEFAULT_MAX_REQUEST_BODY_SIZE
+        return Supertokens.__instance.max_request_body_size
+
     @staticmethod
     def reset():
         if ("SUPERTOKENS_ENV" not in environ) or (
@@ -432,6 +473,88 @@ class Supertokens:
 
         return UsersResponse(users, next_pagination_token)
 
+    async def iterate_user_pages(
+        self,
+        tenant_id: str,
+        time_joined_order: Literal["ASC", "DESC"],
+        page_size: int,
+        pagination_token: Optional[str],
+        include_recipe_ids: Union[None, List[str]],
+        query: Union[Dict[str, str], None],
+        user_context: Optional[Dict[str, Any]],
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[UsersResponse]:
+        """
+        Yields the pages of users, starting from `pagination_token`, until the last page
+        or `max_pages` pages. The next page is fetched while the current one is being
+        consumed. Each page is fetched with a copy of `user_context`, so that the core
+        responses cached in it are not kept for the whole iteration.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be a positive integer")
+        if user_context is None:
+            user_context = {}
+
+        def get_page(pagination_token: Optional[str]) -> "asyncio.Task[UsersResponse]":
+            return asyncio.ensure_future(
+                self.get_users(
+                    tenant_id,
+                    time_joined_order,
+                    page_size,
+                    pagination_token,
+                    include_recipe_ids,
+                    query,
+                    dict(user_context),
+                )
+            )
+
+        next_page: Optional["asyncio.Task[UsersResponse]"] = get_page(pagination_token)
+        pages = 0
+        try:
+            while next_page is not None:
+                page = await next_page
+                pages += 1
+                next_page = (
+                    get_page(page.next_pagination_token)
+                    if page.next_pagination_token is not None
+                    and (max_pages is None or pages < max_pages)
+                    else None
+                )
+                yield page
+        finally:
+            # If the caller stops iterating early
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iterate_users(
+        self,
+        tenant_id: str,
+        time_joined_order: Literal["ASC", "DESC"],
+        page_size: int,
+        include_recipe_ids: Union[None, List[str]],
+        query: Union[Dict[str, str], None],
+        user_context: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[User]:
+        """
+        Yields all the users, fetching them `page_size` at a time. The next page is
+        fetched while the users of the current page are being consumed.
+        """
+        pages = self.iterate_user_pages(
+            tenant_id,
+            time_joined_order,
+            page_size,
+            None,
+            include_recipe_ids,
+            query,
+            user_context,
+        )
+        try:
+            async for page in pages:
+                for user in page.users:
+                    yield user
+        finally:
+            await pages.aclose()  # type: ignore
+
     async def create_user_id_mapping(  # pylint: disable=no-self-use
         self,
         supertokens_user_id: str,
@@ -702,11 +825,15 @@ class Supertokens:
     ):
         log_debug_message("errorHandler: Started")
         log_debug_message(
-            "errorHandler: Error is from SuperTokens recipe. Message: %s", str(err)
+            "errorHandler: Error is from SuperTokens recipe. Message: %s", err
         )
         if isinstance(err, GeneralError):
             raise err
 
+        if isinstance(err, RequestBodyTooLargeError):
+            log_debug_message("errorHandler: Sending 413 status code response")
+            return send_non_200_response_with_message(str(err), 413, response)
+
         if isinstance(err, BadInputError):
             log_debug_message("errorHandler: Sending 400 status code response")
             return send_non_200_response_with_message(str(err), 400, response)
@@ -11,7 +11,9 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Union, Any
+
+from typing_extensions import Literal
 
 from supertokens_python import Supertokens
 from supertokens_python.async_to_sync_wrapper import sync
@@ -25,7 +27,7 @@ from supertokens_python.interfaces import (
     UserIdMappingAlreadyExistsError,
     UserIDTypes,
 )
-from supertokens_python.types import UsersResponse
+from supertokens_python.types import User, UsersResponse
 
 
 def get_users_oldest_first(
@@ -70,6 +72,41 @@ def get_users_newest_first(
     )
 
 
+def iterate_users(
+    tenant_id: str,
+    time_joined_order: Literal["ASC", "DESC"] = "ASC",
+    page_size: int = 100,
+    include_recipe_ids: Union[None, List[str]] = None,
+    query: Union[None, Dict[str, str]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> Iterator[User]:
+    """
+    Iterates over all the users of the tenant, fetching them `page_size` at a time (see
+    `Supertokens.iterate_user_pages`). The event loop running the next page's fetch is
+    only driven while a page is awaited, unless SUPERTOKENS_BACKGROUND_EVENT_LOOP=1, in
+    which case the next page is fetched while the current one is consumed.
+    """
+    pages = Supertokens.get_instance().iterate_user_pages(
+        tenant_id,
+        time_joined_order,
+        page_size,
+        None,
+        include_recipe_ids,
+        query,
+        user_context,
+    )
+    try:
+        while True:
+            try:
+                page = sync(pages.__anext__())
+            except StopAsyncIteration:
+                return
+            yield from page.users
+    finally:
+        # Cancels the prefetch of the next page if the caller stops iterating early
+        sync(pages.aclose())  # type: ignore
+
+
 def get_user_count(
     include_recipe_ids: Union[None, List[str]] = None,
     tenant_id: Optional[str] = None,
@@ -0,0 +1,204 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Usage: `python -m supertokens_python.tools <command> --help`
+
+The core to use is set using `--connection-uri` and `--api-key`, or the
+SUPERTOKENS_CONNECTION_URI and SUPERTOKENS_API_KEY env vars.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import List, Optional
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import (
+    emailpassword,
+    passwordless,
+    thirdparty,
+    usermetadata,
+    userroles,
+)
+
+
+def init_supertokens(args: argparse.Namespace) -> None:
+    if args.connection_uri is None:
+        sys.exit("Please set --connection-uri or SUPERTOKENS_CONNECTION_URI")
+
+    init(
+        app_info=InputAppInfo(
+            app_name="SuperTokens tools",
+            api_domain="http://localhost",
+            website_domain="http://localhost",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig(args.connection_uri, args.api_key),
+        # The recipes whose users can be imported, and whose data is exported
+        recipe_list=[
+            emailpassword.init(),
+            thirdparty.init(),
+            passwordless.init(
+                contact_config=passwordless.ContactEmailOrPhoneConfig(),
+                flow_type="USER_INPUT_CODE_AND_MAGIC_LINK",
+            ),
+            usermetadata.init(),
+            # The session recipe isn't initialised, so the role claims can't be added
+            userroles.init(
+                skip_adding_roles_to_access_token=True,
+                skip_adding_permissions_to_access_token=True,
+            ),
+        ],
+        telemetry=False,
+    )
+
+
+def print_progress(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+def export_command(args: argparse.Namespace) -> None:
+    from .export import export_users
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "csv" if args.output.endswith(".csv") else "jsonl"
+
+    result = asyncio.run(
+        export_users(
+            args.output,
+            tenant_id=args.tenant_id,
+            output_format=output_format,
+            page_size=args.page_size,
+            include_recipe_ids=args.recipe_id,
+            include_metadata=not args.no_metadata,
+            include_roles=not args.no_roles,
+            include_user_id_mapping=args.user_id_mapping,
+            concurrency=args.concurrency,
+            checkpoint_path=args.checkpoint,
+            on_progress=lambda n: print_progress(f"Exported {n} users"),
+        )
+    )
+    print_progress(
+        f"Exported {result.exported_users} users to {args.output}"
+        + ("" if result.completed else " (not completed)")
+    )
+
+
+def import_command(args: argparse.Namespace) -> None:
+    from .import_users import import_users
+
+    result = asyncio.run(
+        import_users(
+            args.input,
+            tenant_id=args.tenant_id,
+            concurrency=args.concurrency,
+            operations_per_second=args.operations_per_second,
+            max_retries=args.max_retries,
+            map_source_user_ids=args.map_source_user_ids,
+            errors_path=args.errors,
+            checkpoint_path=args.checkpoint,
+            on_progress=lambda n: print_progress(f"Processed {n} rows"),
+        )
+    )
+    print_progress(
+        f"Imported {result.imported_users} users, {result.failed_users} failed"
+        + (f" (see {args.errors})" if result.failed_users and args.errors else "")
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m supertokens_python.tools", description=__doc__
+    )
+    parser.add_argument(
+        "--connection-uri", default=os.environ.get("SUPERTOKENS_CONNECTION_URI")
+    )
+    parser.add_argument("--api-key", default=os.environ.get("SUPERTOKENS_API_KEY"))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser(
+        "export", help="Export users, with their metadata and roles, to JSONL or CSV"
+    )
+    export_parser.add_argument("--output", required=True)
+    export_parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        help="Defaults to csv if the output ends with .csv, and jsonl otherwise",
+    )
+    export_parser.add_argument("--tenant-id", default="public")
+    export_parser.add_argument("--page-size", type=int, default=100)
+    export_parser.add_argument(
+        "--recipe-id",
+        action="append",
+        help="Only export users of this recipe (can be repeated)",
+    )
+    export_parser.add_argument("--no-metadata", action="store_true")
+    export_parser.add_argument("--no-roles", action="store_true")
+    export_parser.add_argument("--user-id-mapping", action="store_true")
+    export_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="The maximum number of concurrent core calls for the metadata, roles "
+        "and user id mappings of users",
+    )
+    export_parser.add_argument(
+        "--checkpoint",
+        help="File to save the progress in. If it exists, the export resumes from it",
+    )
+    export_parser.set_defaults(handler=export_command)
+
+    import_parser = commands.add_parser(
+        "import",
+        help="Import users, with their metadata and roles, from JSONL in the format "
+        "written by export (emailpassword users also need a password)",
+    )
+    import_parser.add_argument("--input", required=True)
+    import_parser.add_argument("--tenant-id", default="public")
+    import_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="The maximum number of users imported at a time",
+    )
+    import_parser.add_argument(
+        "--operations-per-second",
+        type=float,
+        help="Limits the rate of core operations (like creating a user)",
+    )
+    import_parser.add_argument("--max-retries", type=int, default=3)
+    import_parser.add_argument(
+        "--map-source-user-ids",
+        action="store_true",
+        help="Map the user ids in the input to the new users, if they don't have an "
+        "externalUserId",
+    )
+    import_parser.add_argument(
+        "--errors", help="File to write the rows which failed to (as JSONL)"
+    )
+    import_parser.add_argument(
+        "--checkpoint",
+        help="File to save the progress in. If it exists, the import resumes from it",
+    )
+    import_parser.set_defaults(handler=import_command)
+
+    args = parser.parse_args(argv)
+    init_supertokens(args)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import csv
+import json
+import os
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union
+
+from typing_extensions import Literal
+
+from supertokens_python.interfaces import GetUserIdMappingOkResult
+from supertokens_python.json_codec import get_json_codec
+from supertokens_python.recipe.usermetadata.asyncio import get_user_metadata
+from supertokens_python.recipe.userroles.asyncio import get_roles_for_user
+from supertokens_python.supertokens import Supertokens
+from supertokens_python.types import User
+from supertokens_python.utils import map_with_concurrency
+
+ExportFormat = Literal["jsonl", "csv"]
+
+
+class ExportCheckpoint:
+    """
+    Where an export got to: the pagination token of the next page to export, the
+    number of users exported so far and the size of the output file after writing them.
+    """
+
+    def __init__(
+        self,
+        next_pagination_token: Optional[str],
+        exported_users: int,
+        output_size: int,
+    ):
+        self.next_pagination_token = next_pagination_token
+        self.exported_users = exported_users
+        self.output_size = output_size
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "nextPaginationToken": self.next_pagination_token,
+            "exportedUsers": self.exported_users,
+            "outputSize": self.output_size,
+        }
+
+    @staticmethod
+    def from_json(json_input: Dict[str, Any]) -> ExportCheckpoint:
+        return ExportCheckpoint(
+            json_input["nextPaginationToken"],
+            json_input["exportedUsers"],
+            json_input["outputSize"],
+        )
+
+
+def read_checkpoint(path: str) -> Optional[ExportCheckpoint]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return ExportCheckpoint.from_json(json.load(f))
+
+
+def write_checkpoint(path: str, checkpoint: ExportCheckpoint) -> None:
+    # Written to a temporary file first, so that a crash never leaves a partial
+    # checkpoint behind
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(checkpoint.to_json(), f)
+    os.replace(temp_path, path)
+
+
+class ExportResult:
+    def __init__(self, exported_users: int, completed: bool):
+        self.exported_users = exported_users
+        self.completed = completed
+
+
+class UserExportWriter:
+    def __init__(
+        self,
+        output: TextIO,
+        output_format: ExportFormat,
+        include_metadata: bool,
+        include_roles: bool,
+        include_user_id_mapping: bool,
+    ):
+        self.output = output
+        self.output_format = output_format
+        self.columns = [
+            "id",
+            "recipeId",
+            "timeJoined",
+            "email",
+            "phoneNumber",
+            "thirdPartyId",
+            "thirdPartyUserId",
+            "tenantIds",
+        ]
+        if include_metadata:
+            self.columns.append("metadata")
+        if include_roles:
+            self.columns.append("roles")
+        if include_user_id_mapping:
+            self.columns.append("externalUserId")
+        self.csv_writer = csv.writer(output) if output_format == "csv" else None
+
+    def write_header(self) -> None:
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(self.columns)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self.csv_writer is None:
+            self.output.write(get_json_codec().dumps(row).decode("utf-8") + "\n")
+            return
+
+        user = row["user"]
+        third_party = user.get("thirdParty") or {}
+        values: Dict[str, Any] = {
+            "id": user["id"],
+            "recipeId": row["recipeId"],
+            "timeJoined": user["timeJoined"],
+            "email": user.get("email"),
+            "phoneNumber": user.get("phoneNumber"),
+            "thirdPartyId": third_party.get("id"),
+            "thirdPartyUserId": third_party.get("user_id"),
+            "tenantIds": json.dumps(user["tenantIds"]),
+            "metadata": json.dumps(row.get("metadata")),
+            "roles": json.dumps(row.get("roles")),
+            "externalUserId": row.get("externalUserId"),
+        }
+        self.csv_writer.writerow(
+            ["" if values[c] is None else values[c] for c in self.columns]
+        )
+
+
+async def export_users(
+    output_path: str,
+    tenant_id: str = "public",
+    output_format: ExportFormat = "jsonl",
+    page_size: int = 100,
+    include_recipe_ids: Union[None, List[str]] = None,
+    include_metadata: bool = True,
+    include_roles: bool = True,
+    include_user_id_mapping: bool = False,
+    concurrency: int = 10,
+    checkpoint_path: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> ExportResult:
+    """
+    Exports the users of the tenant to `output_path`, one JSON object per line (in the
+    format of `User.to_json`, with the `metadata`, `roles` and `externalUserId` of the
+    user added) or as CSV.
+
+    Users are fetched a page at a time (the next page is fetched while the current one
+    is being written), and the metadata, roles and user id mapping of at most
+    `concurrency` users are fetched at a time. After each page, the output is flushed
+    and the progress is saved to `checkpoint_path` (if given). If the checkpoint exists
+    when this is called, the export continues from it, appending to the output. If the
+    output was removed (or is shorter than when the checkpoint was saved), the export
+    starts over.
+
+    `max_pages` stops the export after that many pages, and `on_progress` is called with
+    the total number of users exported after each page.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    if user_context is None:
+        user_context = {}
+
+    checkpoint = read_checkpoint(checkpoint_path) if checkpoint_path else None
+    if checkpoint is not None and (
+        not os.path.exists(output_path)
+        or os.path.getsize(output_path) < checkpoint.output_size
+    ):
+        checkpoint = None
+    if checkpoint is not None:
+        # Anything written after the checkpoint was saved is written again
+        os.truncate(output_path, checkpoint.output_size)
+        exported_users = checkpoint.exported_users
+        pagination_token = checkpoint.next_pagination_token
+    else:
+        exported_users = 0
+        pagination_token = None
+
+    async def get_row(user: User, page_user_context: Dict[str, Any]) -> Dict[str, Any]:
+        row = user.to_json()
+        if include_metadata:
+            row["metadata"] = (
+                await get_user_metadata(user.user_id, page_user_context)
+            ).metadata
+        if include_roles:
+            row["roles"] = (
+                await get_roles_for_user(tenant_id, user.user_id, page_user_context)
+            ).roles
+        if include_user_id_mapping:
+            mapping = await Supertokens.get_instance().get_user_id_mapping(
+                user.user_id, "SUPERTOKENS", page_user_context
+            )
+            row["externalUserId"] = (
+                mapping.external_user_id
+                if isinstance(mapping, GetUserIdMappingOkResult)
+                else None
+            )
+        return row
+
+    if checkpoint is not None and checkpoint.next_pagination_token is None:
+        return ExportResult(exported_users, True)
+
+    with open(
+        output_path, "a" if checkpoint is not None else "w", newline=""
+    ) as output:
+        writer = UserExportWriter(
+            output,
+            output_format,
+            include_metadata,
+            include_roles,
+            include_user_id_mapping,
+        )
+        if checkpoint is None:
+            writer.write_header()
+
+        pages = Supertokens.get_instance().iterate_user_pages(
+            tenant_id,
+            "ASC",
+            page_size,
+            pagination_token,
+            include_recipe_ids,
+            None,
+            user_context,
+            max_pages,
+        )
+        try:
+            async for page in pages:
+                pagination_token = page.next_pagination_token
+                # Each page uses its own user context, so that the core responses
+                # cached in it are freed once the page is written
+                page_user_context = dict(user_context)
+                rows = await map_with_concurrency(
+                    partial(get_row, page_user_context=page_user_context),
+                    page.users,
+                    concurrency,
+                )
+                for row in rows:
+                    writer.write(row)
+                output.flush()
+                exported_users += len(rows)
+
+                if checkpoint_path is not None:
+                    write_checkpoint(
+                        checkpoint_path,
+                        ExportCheckpoint(
+                            pagination_token,
+                            exported_users,
+                            os.fstat(output.fileno()).st_size,
+                        ),
+                    )
+                if on_progress is not None:
+                    on_progress(exported_users)
+        finally:
+            await pages.aclose()  # type: ignore
+
+    return ExportResult(exported_users, pagination_token is None)
@@ -0,0 +1,438 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+
+from httpx import TransportError
+
+from supertokens_python.interfaces import (
+    UnknownSupertokensUserIDError,
+    UserIdMappingAlreadyExistsError,
+)
+from supertokens_python.json_codec import get_json_codec
+from supertokens_python.recipe.emailpassword.asyncio import get_user_by_email, sign_up
+from supertokens_python.recipe.emailpassword.interfaces import (
+    SignUpEmailAlreadyExistsError,
+)
+from supertokens_python.recipe.passwordless.asyncio import signinup
+from supertokens_python.recipe.thirdparty.asyncio import (
+    manually_create_or_update_user,
+)
+from supertokens_python.recipe.usermetadata.asyncio import update_user_metadata
+from supertokens_python.recipe.userroles.asyncio import (
+    add_role_to_user,
+    create_new_role_or_add_permissions,
+)
+from supertokens_python.recipe.userroles.interfaces import UnknownRoleError
+from supertokens_python.supertokens import Supertokens
+from supertokens_python.utils import for_each_with_concurrency
+
+_T = TypeVar("_T")
+
+
+class ImportCheckpoint:
+    """
+    Where an import got to: all the rows before `processed_rows` have been imported (or
+    have failed and been written to the errors file, which had `errors_size` bytes).
+    """
+
+    def __init__(
+        self,
+        processed_rows: int,
+        imported_users: int,
+        failed_users: int,
+        errors_size: int,
+    ):
+        self.processed_rows = processed_rows
+        self.imported_users = imported_users
+        self.failed_users = failed_users
+        self.errors_size = errors_size
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "processedRows": self.processed_rows,
+            "importedUsers": self.imported_users,
+            "failedUsers": self.failed_users,
+            "errorsSize": self.errors_size,
+        }
+
+    @staticmethod
+    def from_json(json_input: Dict[str, Any]) -> ImportCheckpoint:
+        return ImportCheckpoint(
+            json_input["processedRows"],
+            json_input["importedUsers"],
+            json_input["failedUsers"],
+            json_input["errorsSize"],
+        )
+
+
+def read_checkpoint(path: str) -> Optional[ImportCheckpoint]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return ImportCheckpoint.from_json(json.load(f))
+
+
+def write_checkpoint(path: str, checkpoint: ImportCheckpoint) -> None:
+    # Written to a temporary file first, so that a crash never leaves a partial
+    # checkpoint behind
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(checkpoint.to_json(), f)
+    os.replace(temp_path, path)
+
+
+class ImportResult:
+    def __init__(self, imported_users: int, failed_users: int):
+        self.imported_users = imported_users
+        self.failed_users = failed_users
+
+
+class ImportRowError(Exception):
+    pass
+
+
+class RateLimiter:
+    """
+    Lets at most `rate` calls to `acquire` through per second (a token bucket, which
+    allows bursts of up to `rate` calls).
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def is_transient_error(e: Exception) -> bool:
+    # The querier raises a plain Exception with the status code in the message for non
+    # 2xx responses from the core (429s are already retried by it)
+    return isinstance(e, TransportError) or (
+        re.search(r"with status code: 5\d\d", str(e)) is not None
+    )
+
+
+class UserImporter:
+    def __init__(
+        self,
+        tenant_id: str,
+        map_source_user_ids: bool,
+        rate_limiter: Optional[RateLimiter],
+        max_retries: int,
+        retry_delay_sec: float,
+        user_context: Dict[str, Any],
+    ):
+        self.tenant_id = tenant_id
+        self.map_source_user_ids = map_source_user_ids
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_delay_sec = retry_delay_sec
+        self.user_context = user_context
+
+    async def call(self, func: Callable[[Dict[str, Any]], Awaitable[_T]]) -> _T:
+        """
+        Does an operation, waiting for the rate limit and retrying transient errors
+        with exponential backoff.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            try:
+                # Each call gets its own user context, so that core responses are not
+                # cached across calls
+                return await func(dict(self.user_context))
+            except Exception as e:
+                if attempt >= self.max_retries or not is_transient_error(e):
+                    raise
+            await asyncio.sleep(self.retry_delay_sec * 2**attempt)
+            attempt += 1
+
+    async def create_user(self, row: Dict[str, Any]) -> str:
+        recipe_id = row.get("recipeId")
+        user = row.get("user", {})
+        tenant_id = self.tenant_id
+
+        if recipe_id == "emailpassword":
+            email, password = user.get("email"), row.get("password")
+            if email is None or password is None:
+                raise ImportRowError(
+                    "emailpassword users need an email and a password (password "
+                    "hashes can't be imported)"
+                )
+            result = await self.call(
+                lambda uc: sign_up(tenant_id, email, password, uc)
+            )
+            if isinstance(result, SignUpEmailAlreadyExistsError):
+                # Imported before (like when resuming an import)
+                existing_user = await self.call(
+                    lambda uc: get_user_by_email(tenant_id, email, uc)
+                )
+                if existing_user is None:
+                    raise ImportRowError("Email already exists")
+                return existing_user.user_id
+            return result.user.user_id
+
+        if recipe_id == "thirdparty":
+            third_party = user.get("thirdParty")
+            if third_party is None or user.get("email") is None:
+                raise ImportRowError("thirdparty users need an email and thirdParty")
+            result = await self.call(
+                lambda uc: manually_create_or_update_user(
+                    tenant_id,
+                    third_party["id"],
+                    third_party["user_id"],
+                    user["email"],
+                    uc,
+                )
+            )
+            if not hasattr(result, "user"):
+                raise ImportRowError(type(result).__name__)
+            return result.user.user_id  # type: ignore
+
+        if recipe_id == "passwordless":
+            email, phone_number = user.get("email"), user.get("phoneNumber")
+            if email is None and phone_number is None:
+                raise ImportRowError(
+                    "passwordless users need an email or a phone number"
+                )
+            result = await self.call(
+                lambda uc: signinup(tenant_id, email, phone_number, uc)
+            )
+            return result.user.user_id
+
+        raise ImportRowError(f"Unsupported recipeId: {recipe_id}")
+
+    async def import_row(self, row: Dict[str, Any]) -> str:
+        """
+        Imports the user in the row (in the format written by `export_users`), returning
+        their user id. Rows are imported in a way that importing a row again is safe.
+        """
+        user_id = await self.create_user(row)
+
+        external_user_id = row.get("externalUserId")
+        if external_user_id is None and self.map_source_user_ids:
+            external_user_id = row.get("user", {}).get("id")
+        if external_user_id is not None and external_user_id != user_id:
+            mapping_result = await self.call(
+                lambda uc: Supertokens.get_instance().create_user_id_mapping(
+                    user_id, external_user_id, None, None, uc
+                )
+            )
+            if isinstance(mapping_result, UnknownSupertokensUserIDError):
+                raise ImportRowError("Unknown SuperTokens user id: " + user_id)
+            if isinstance(mapping_result, UserIdMappingAlreadyExistsError):
+                raise ImportRowError(
+                    f"User id mapping already exists for {user_id} or "
+                    + external_user_id
+                )
+            # The user is referred to by their external user id from now on
+            user_id = external_user_id
+
+        metadata = row.get("metadata")
+        if metadata:
+            await self.call(lambda uc: update_user_metadata(user_id, metadata, uc))
+
+        for role in row.get("roles") or []:
+            await self.add_role(user_id, role)
+
+        return user_id
+
+    async def add_role(self, user_id: str, role: str) -> None:
+        result = await self.call(
+            lambda uc: add_role_to_user(self.tenant_id, user_id, role, uc)
+        )
+        if isinstance(result, UnknownRoleError):
+            await self.call(lambda uc: create_new_role_or_add_permissions(role, [], uc))
+            await self.call(
+                lambda uc: add_role_to_user(self.tenant_id, user_id, role, uc)
+            )
+
+
+async def import_users(
+    input_path: str,
+    tenant_id: str = "public",
+    concurrency: int = 10,
+    operations_per_second: Optional[float] = None,
+    max_retries: int = 3,
+    retry_delay_sec: float = 0.5,
+    map_source_user_ids: bool = False,
+    errors_path: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 100,
+    on_progress: Optional[Callable[[int], None]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+) -> ImportResult:
+    """
+    Imports the users in `input_path`, a JSONL file in the format written by
+    `export_users` (emailpassword users also need a `password`). For each user, this
+    creates the user, their user id mapping (to `externalUserId`, or to the user's id
+    in the file if `map_source_user_ids` is True), metadata and roles (creating roles
+    which don't exist).
+
+    Up to `concurrency` users are imported at a time, and at most
+    `operations_per_second` operations (like creating a user or adding a role, which
+    are one core call each, except creating passwordless users which takes two) are
+    done per second, if set. Operations which fail with a network error or a 5xx
+    response from the core are retried up to `max_retries` times.
+
+    Rows which fail are written to `errors_path` (with the error and their line
+    number) and the import continues. Every `checkpoint_every` rows, the progress is
+    saved to `checkpoint_path` (if given). If the checkpoint exists when this is called,
+    the import continues from it. Since rows are imported concurrently, the rows after
+    the checkpoint may have been imported already, which is safe since importing a row
+    again doesn't change anything.
+
+    `on_progress` is called with the number of processed rows after each checkpoint.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    if checkpoint_every <= 0:
+        raise ValueError("checkpoint_every must be a positive integer")
+    if user_context is None:
+        user_context = {}
+
+    checkpoint = read_checkpoint(checkpoint_path) if checkpoint_path else None
+    if checkpoint is None:
+        checkpoint = ImportCheckpoint(0, 0, 0, 0)
+    elif errors_path is not None and os.path.exists(errors_path):
+        # The errors of the rows after the checkpoint are written again
+        os.truncate(errors_path, checkpoint.errors_size)
+
+    importer = UserImporter(
+        tenant_id,
+        map_source_user_ids,
+        RateLimiter(operations_per_second) if operations_per_second else None,
+        max_retries,
+        retry_delay_sec,
+        user_context,
+    )
+    # The rows after checkpoint.processed_rows which are done, with the error if they
+    # failed. They are only counted (and their errors written) once all the rows before
+    # them are done, so that the checkpoint never includes them twice.
+    finished_rows: Dict[int, Optional[Exception]] = {}
+    blank_rows: Set[int] = set()
+    errors_file: Optional[TextIO] = None
+    imported_users = checkpoint.imported_users
+    failed_users = checkpoint.failed_users
+    processed_rows = checkpoint.processed_rows
+    last_saved_rows = processed_rows
+
+    def save_progress(force: bool = False) -> None:
+        nonlocal processed_rows, last_saved_rows, imported_users, failed_users
+        while True:
+            if processed_rows in blank_rows:
+                blank_rows.remove(processed_rows)
+            elif processed_rows in finished_rows:
+                error = finished_rows.pop(processed_rows)
+                if error is None:
+                    imported_users += 1
+                else:
+                    failed_users += 1
+                    if errors_file is not None:
+                        line = {
+                            "line": processed_rows + 1,
+                            "error": str(error) or type(error).__name__,
+                        }
+                        errors_file.write(get_json_codec().dumps(line).decode("utf-8"))
+                        errors_file.write("\n")
+            else:
+                break
+            processed_rows += 1
+        if not force and processed_rows - last_saved_rows < checkpoint_every:
+            return
+        last_saved_rows = processed_rows
+        errors_size = 0
+        if errors_file is not None:
+            errors_file.flush()
+            errors_size = os.fstat(errors_file.fileno()).st_size
+        if checkpoint_path is not None:
+            write_checkpoint(
+                checkpoint_path,
+                ImportCheckpoint(
+                    processed_rows, imported_users, failed_users, errors_size
+                ),
+            )
+        if on_progress is not None:
+            on_progress(processed_rows)
+
+    async def import_line(index_and_line: Tuple[int, str]) -> None:
+        # Errors other than the row failing to import (like the checkpoint not being
+        # writable) are raised, which stops the import
+        index, line = index_and_line
+        try:
+            await importer.import_row(get_json_codec().loads(line))
+            finished_rows[index] = None
+        except Exception as e:
+            finished_rows[index] = e
+        save_progress()
+
+    def read_lines(input_file: TextIO) -> Iterator[Tuple[int, str]]:
+        for index, line in enumerate(input_file):
+            if index < checkpoint.processed_rows:
+                continue
+            if not line.strip():
+                blank_rows.add(index)
+                continue
+            yield index, line
+
+    if errors_path is not None:
+        errors_file = open(  # pylint: disable=consider-using-with
+            errors_path, "a", encoding="utf-8"
+        )
+    try:
+        with open(input_path, encoding="utf-8") as input_file:
+            # Only `concurrency` rows are read ahead of the ones being imported
+            await for_each_with_concurrency(
+                import_line, read_lines(input_file), concurrency
+            )
+        save_progress(force=True)
+    finally:
+        if errors_file is not None:
+            errors_file.close()
+
+    return ImportResult(imported_users, failed_users)
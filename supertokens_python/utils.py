@@ -14,9 +14,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import warnings
+from collections import OrderedDict
+from functools import lru_cache
 from base64 import urlsafe_b64decode, urlsafe_b64encode, b64encode, b64decode
 from math import floor
 from re import fullmatch
@@ -27,7 +30,12 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Generic,
+    Hashable,
+    Iterable,
     List,
+    Set,
+    Tuple,
     TypeVar,
     Union,
     Optional,
@@ -35,30 +43,54 @@ from typing import (
 from urllib.parse import urlparse
 
 from httpx import HTTPStatusError, Response
-from tldextract import extract  # type: ignore
 
-from supertokens_python.framework.django.framework import DjangoFramework
-from supertokens_python.framework.fastapi.framework import FastapiFramework
-from supertokens_python.framework.flask.framework import FlaskFramework
 from supertokens_python.framework.request import BaseRequest
 from supertokens_python.framework.response import BaseResponse
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import is_debug_enabled, log_debug_message
 
 from .constants import ERROR_MESSAGE_KEY, RID_KEY_HEADER
 from .exceptions import raise_general_exception
 from .types import MaybeAwaitable
 
 _T = TypeVar("_T")
+_R = TypeVar("_R")
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
 
 if TYPE_CHECKING:
-    pass
+    from supertokens_python.framework.types import Framework
 
 
-FRAMEWORKS = {
-    "fastapi": FastapiFramework(),
-    "flask": FlaskFramework(),
-    "django": DjangoFramework(),
-}
+class FrameworkRegistry(Dict[str, "Framework"]):
+    """
+    Maps framework names to their adapters. An adapter (and the modules of its framework
+    integration) is only imported the first time it is looked up, so apps don't pay the
+    import cost of the frameworks they don't use.
+    """
+
+    def __missing__(self, name: str) -> Framework:
+        if name == "fastapi":
+            from supertokens_python.framework.fastapi.framework import (
+                FastapiFramework,
+            )
+
+            framework: Framework = FastapiFramework()
+        elif name == "flask":
+            from supertokens_python.framework.flask.framework import FlaskFramework
+
+            framework = FlaskFramework()
+        elif name == "django":
+            from supertokens_python.framework.django.framework import DjangoFramework
+
+            framework = DjangoFramework()
+        else:
+            raise KeyError(name)
+
+        self[name] = framework
+        return framework
+
+
+FRAMEWORKS = FrameworkRegistry()
 
 
 def is_an_ip_address(ip_address: str) -> bool:
@@ -131,9 +163,7 @@ def send_non_200_response(
 ) -> BaseResponse:
     if status_code < 300:
         raise_general_exception("Calling sendNon200Response with status code < 300")
-    log_debug_message(
-        "Sending response to client with status code: %s", str(status_code)
-    )
+    log_debug_message("Sending response to client with status code: %s", status_code)
     response.set_status_code(status_code)
     response.set_json_content(content=body)
     return response
@@ -206,11 +236,12 @@ def handle_httpx_client_exceptions(
     if isinstance(e, HTTPStatusError) and isinstance(e.response, Response):  # type: ignore
         res = e.response  # type: ignore
         log_debug_message("Error status: %s", res.status_code)  # type: ignore
-        log_debug_message("Error response: %s", res.json())
+        if is_debug_enabled():
+            log_debug_message("Error response: %s", res.json())
     else:
-        log_debug_message("Error: %s", str(e))
+        log_debug_message("Error: %s", e)
 
-    if input_ is not None:
+    if input_ is not None and is_debug_enabled():
         log_debug_message("Logging the input:")
         log_debug_message("%s", json.dumps(input_))
 
@@ -266,6 +297,32 @@ async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     return obj  # type: ignore
 
 
+tld_extractor: Optional[Callable[..., Any]] = None
+
+
+def get_tld_extractor() -> Callable[..., Any]:
+    """
+    Returns a tldextract extractor which only uses the public suffix list snapshot bundled
+    with tldextract. Unlike `tldextract.extract`, it never downloads the list or reads and
+    writes a disk cache, so it works without network access and does not slow down cold
+    starts. It (and tldextract) is loaded the first time a domain needs to be resolved.
+    """
+    global tld_extractor
+    if tld_extractor is None:
+        from tldextract import TLDExtract  # type: ignore
+
+        tld_extractor = TLDExtract(
+            cache_dir=False,  # type: ignore
+            suffix_list_urls=(),
+            fallback_to_snapshot=True,
+            include_psl_private_domains=True,
+        )
+    return tld_extractor
+
+
+# Memoised since this runs (with a public suffix list lookup) several times per request when
+# the origin is a function. The result only depends on the url, which can be one of a few origins.
+@lru_cache(maxsize=1024)
 def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     url_obj = urlparse(url)
     hostname = url_obj.hostname
@@ -276,7 +333,7 @@ def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     if hostname.startswith("localhost") or is_an_ip_address(hostname):
         return "localhost"
 
-    parsed_url: Any = extract(hostname, include_psl_private_domains=True)
+    parsed_url: Any = get_tld_extractor()(hostname)
     if parsed_url.domain == "":  # type: ignore
         # We need to do this because of https://github.com/supertokens/supertokens-python/issues/394
         if hostname.endswith(".amazonaws.com") and parsed_url.suffix == hostname:
@@ -345,3 +402,129 @@ class RWLockContext:
 
 def normalise_email(email: str) -> str:
     return email.strip().lower()
+
+
+async def map_with_concurrency(
+    func: Callable[[_T], Awaitable[_R]], items: Iterable[_T], concurrency: int
+) -> List[_R]:
+    """
+    Calls `func` on each item, with at most `concurrency` calls running at a time, and
+    returns the results in the order of `items`. Items are read from the iterable only
+    when there is room for another call, so it can be a (large) generator. If a call
+    fails, no more items are read, the other calls are cancelled and its error is
+    raised.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: List["asyncio.Task[_R]"] = []
+    failed = False
+
+    async def run(item: _T) -> _R:
+        nonlocal failed
+        try:
+            return await func(item)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            semaphore.release()
+
+    try:
+        for item in items:
+            await semaphore.acquire()
+            if failed:
+                break
+            tasks.append(asyncio.ensure_future(run(item)))
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def for_each_with_concurrency(
+    func: Callable[[_T], Awaitable[Any]], items: Iterable[_T], concurrency: int
+) -> None:
+    """
+    Like `map_with_concurrency`, but for calls whose results aren't needed: only the
+    calls in flight are kept, so memory doesn't grow with the number of items.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    pending: Set["asyncio.Future[Any]"] = set()
+
+    async def wait_for_one():
+        nonlocal pending
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            # Raises the error of a failed call
+            task.result()
+
+    try:
+        for item in items:
+            if len(pending) >= concurrency:
+                await wait_for_one()
+            pending.add(asyncio.ensure_future(func(item)))
+        while pending:
+            await wait_for_one()
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+
+
+class TTLCache(Generic[_K, _V]):
+    """
+    A thread safe, in memory cache which holds at most `max_size` entries (evicting
+    the least recently used ones first) and expires entries `ttl_ms` after they are set.
+    """
+
+    def __init__(self, ttl_ms: int, max_size: int):
+        if ttl_ms <= 0:
+            raise ValueError("ttl_ms must be a positive integer")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.ttl_ms = ttl_ms
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[_K, Tuple[int, _V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> Optional[_V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= get_timestamp_ms():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: _K, value: _V, ttl_ms: Optional[int] = None) -> None:
+        expires_at = get_timestamp_ms() + (self.ttl_ms if ttl_ms is None else ttl_ms)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: _K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,103 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Measures the per request overhead of debug logging, by running the middleware on a path
+that no API handles and validating a few claims, with debug logging off and on.
+
+Run with `python -m tests.benchmarks.bench_debug_logging`.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict
+
+from starlette.requests import Request
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.logger import NAMESPACE, streamHandler
+from supertokens_python.recipe import emailpassword, session
+from supertokens_python.recipe.session.claims import BooleanClaim
+from supertokens_python.recipe.session.utils import validate_claims_in_payload
+from supertokens_python.utils import get_timestamp_ms
+
+REQUESTS = 5000
+
+claim = BooleanClaim("st-bench", fetch_value=lambda *_: True)  # type: ignore
+claim_validators = [claim.validators.has_value(True) for _ in range(3)]
+access_token_payload: Dict[str, Any] = {"st-bench": {"v": True, "t": get_timestamp_ms()}}
+
+
+def create_request() -> FastApiRequest:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/auth/not-an-api",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"rid", b"session")],
+    }
+    return FastApiRequest(Request(scope))
+
+
+async def handle_requests(count: int) -> float:
+    st = Supertokens.get_instance()
+    start = time.perf_counter()
+    for _ in range(count):
+        request = create_request()
+        user_context: Dict[str, Any] = {}
+        await st.middleware(request, FastApiResponse(None), user_context)  # type: ignore
+        await validate_claims_in_payload(
+            claim_validators, access_token_payload, user_context
+        )
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def measure(loop: asyncio.AbstractEventLoop) -> float:
+    loop.run_until_complete(handle_requests(REQUESTS // 10))  # warm up
+    return min(loop.run_until_complete(handle_requests(REQUESTS)) for _ in range(3))
+
+
+def main():
+    init(
+        app_info=InputAppInfo(
+            app_name="bench",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        recipe_list=[session.init(), emailpassword.init()],
+        telemetry=False,
+    )
+    logger = logging.getLogger(NAMESPACE)
+    loop = asyncio.new_event_loop()
+
+    logger.setLevel(logging.INFO)
+    off = measure(loop)
+
+    with open(os.devnull, "w") as devnull:
+        streamHandler.setStream(devnull)  # type: ignore
+        logger.setLevel(logging.DEBUG)
+        on = measure(loop)
+
+    print(f"Debug logging off: {off:.1f}us per request")
+    print(f"Debug logging on:  {on:.1f}us per request")
+
+
+if __name__ == "__main__":
+    main()
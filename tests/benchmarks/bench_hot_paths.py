@@ -0,0 +1,257 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Microbenchmarks of the code run on every request. The core is not needed, since the
+`Querier` is stubbed and the JWKS cache is filled with a locally generated key.
+
+Run with `python -m tests.benchmarks.bench_hot_paths`. The results are compared with the
+baselines in `baselines.json`:
+
+- `--check` exits with an error if a benchmark is slower than its baseline by more than
+  the tolerance (0.5, so 50%, by default, can be set using
+  SUPERTOKENS_BENCHMARK_TOLERANCE). `make benchmark` runs this.
+- `--save` (`make benchmark-save`) stores the results as the new baselines. Baselines
+  depend on the machine, so they should be saved on the machine where `--check` is run.
+- `--quick` runs every benchmark only once, to check that they work and that they all
+  have a baseline.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import PyJWK
+from starlette.requests import Request
+from starlette.responses import Response
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import emailpassword, session
+from supertokens_python.recipe.session import jwks
+from supertokens_python.recipe.session.access_token import get_info_from_access_token
+from supertokens_python.recipe.session.claims import BooleanClaim
+from supertokens_python.recipe.session.cookie_and_header import (
+    build_front_token,
+    get_token,
+    has_multiple_cookies_for_token_type,
+)
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.session.utils import validate_claims_in_payload
+from supertokens_python.utils import get_timestamp_ms
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_TOLERANCE = 0.5
+
+# Each benchmark is a function doing one operation, sync or async
+Benchmark = Callable[[], Union[Any, Awaitable[Any]]]
+
+ACCESS_TOKEN_PAYLOAD: Dict[str, Any] = {
+    "sub": "user-id",
+    "sessionHandle": "session-handle",
+    "refreshTokenHash1": "refresh-token-hash",
+    "parentRefreshTokenHash1": None,
+    "antiCsrfToken": None,
+    "tId": "public",
+    "iss": "http://api.example.com/auth",
+    "st-bench": {"v": True, "t": get_timestamp_ms()},
+}
+
+
+def create_access_token() -> str:
+    """
+    Creates an access token signed by a new key, and puts the key in the JWKS cache like
+    it would be after fetching it from the core.
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_key = private_key.public_key()
+    public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key))  # type: ignore
+    public_jwk.update({"kid": "bench-key", "alg": "RS256", "use": "sig"})
+    jwks.cached_keys = jwks.CachedKeys([PyJWK(public_jwk)], 3600)
+
+    now = int(time.time())
+    return jwt.encode(  # type: ignore
+        {**ACCESS_TOKEN_PAYLOAD, "iat": now, "exp": now + 3600},
+        private_key,  # type: ignore
+        algorithm="RS256",
+        headers={"kid": "bench-key", "version": "5"},
+    )
+
+
+def create_request(
+    path: str, query_string: bytes = b"", headers: Optional[List[Any]] = None
+) -> FastApiRequest:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query_string,
+        "root_path": "",
+        "headers": headers or [],
+    }
+    return FastApiRequest(Request(scope))
+
+
+async def send_get_request_stub(
+    _: Querier, path: NormalisedURLPath, *__: Any, **___: Any
+) -> Dict[str, Any]:
+    if path.get_as_string_dangerous().endswith("/recipe/user"):
+        return {"status": "UNKNOWN_EMAIL_ERROR"}
+    raise Exception("Unexpected core request: " + path.get_as_string_dangerous())
+
+
+def setup() -> Dict[str, Benchmark]:
+    init(
+        app_info=InputAppInfo(
+            app_name="bench",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        recipe_list=[session.init(), emailpassword.init()],
+        telemetry=False,
+    )
+    setattr(Querier, "send_get_request", send_get_request_stub)
+
+    st = Supertokens.get_instance()
+    session_config = SessionRecipe.get_instance().config
+    access_token = create_access_token()
+    parsed_access_token = parse_jwt_without_signature_verification(access_token)
+    cookie_header = (
+        "_ga=GA1.1.1234; theme=dark; sFrontToken=front; "
+        + "sAccessToken="
+        + access_token
+    ).encode()
+    claim = BooleanClaim("st-bench", fetch_value=lambda *_: True)  # type: ignore
+    claim_validators = [claim.validators.has_value(True) for _ in range(3)]
+
+    async def middleware(path: str, query_string: bytes = b""):
+        request = create_request(path, query_string)
+        response = FastApiResponse(Response())
+        return await st.middleware(request, response, {})
+
+    def parse_cookies():
+        request = create_request("/", headers=[(b"cookie", cookie_header)])
+        return get_token(
+            request, "access", "cookie"
+        ), has_multiple_cookies_for_token_type(request, "access")
+
+    return {
+        "parse_jwt_without_signature_verification": lambda: (
+            parse_jwt_without_signature_verification(access_token)
+        ),
+        "get_info_from_access_token": lambda: get_info_from_access_token(
+            session_config, parsed_access_token, False
+        ),
+        "middleware_handled_path": lambda: middleware(
+            "/auth/emailpassword/email/exists", b"email=john%40example.com"
+        ),
+        "middleware_unhandled_path": lambda: middleware("/api/todos"),
+        "cookie_parsing": parse_cookies,
+        "normalised_url_path": lambda: NormalisedURLPath("/auth/session/refresh"),
+        "claim_validation": lambda: validate_claims_in_payload(
+            claim_validators, ACCESS_TOKEN_PAYLOAD, {}
+        ),
+        "build_front_token": lambda: build_front_token(
+            "user-id", get_timestamp_ms() + 3600_000, ACCESS_TOKEN_PAYLOAD
+        ),
+    }
+
+
+async def run(benchmark: Benchmark, number: int) -> float:
+    """
+    Runs `benchmark` `number` times and returns the time taken per run in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(number):
+        result = benchmark()
+        if asyncio.iscoroutine(result):
+            await result
+    return (time.perf_counter() - start) / number * 1_000_000
+
+
+async def measure(benchmark: Benchmark) -> float:
+    # Calibrate the number of runs to take about 0.2s, like timeit does
+    number = 1
+    while (await run(benchmark, number)) * number < 200_000:
+        number *= 2
+    return min([await run(benchmark, number) for _ in range(7)])
+
+
+def load_baselines() -> Dict[str, float]:
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+    with open(BASELINES_PATH) as f:
+        return json.load(f)
+
+
+def main(args: List[str]) -> int:
+    benchmarks = setup()
+    loop = asyncio.new_event_loop()
+
+    if "--quick" in args:
+        for benchmark in benchmarks.values():
+            loop.run_until_complete(run(benchmark, 1))
+        print(f"Ran {len(benchmarks)} benchmarks")
+        missing = [name for name in benchmarks if name not in load_baselines()]
+        if missing:
+            print("No baseline for: " + ", ".join(missing))
+            return 1
+        return 0
+
+    tolerance = float(
+        os.environ.get("SUPERTOKENS_BENCHMARK_TOLERANCE", str(DEFAULT_TOLERANCE))
+    )
+    baselines = load_baselines()
+    results: Dict[str, float] = {}
+    regressions: List[str] = []
+
+    for name, benchmark in benchmarks.items():
+        results[name] = loop.run_until_complete(measure(benchmark))
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<45} {results[name]:>10.2f}us")
+            continue
+
+        change = results[name] / baseline - 1
+        print(f"{name:<45} {results[name]:>10.2f}us {change:>+8.1%} vs baseline")
+        if change > tolerance:
+            regressions.append(name)
+
+    if "--save" in args:
+        with open(BASELINES_PATH, "w") as f:
+            json.dump({k: round(v, 2) for k, v in results.items()}, f, indent=4)
+            f.write("\n")
+        print("Saved the baselines to " + BASELINES_PATH)
+
+    if "--check" in args and regressions:
+        print("Slower than the baseline: " + ", ".join(regressions))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
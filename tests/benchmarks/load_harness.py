@@ -0,0 +1,289 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+End to end load test of one of the example apps (in `examples/`), using the mock core
+(see `mock_core.py`) instead of a real core.
+
+Run with `python -m tests.benchmarks.load_harness --framework fastapi`. Useful options:
+
+- `--scenario sessioninfo` (default) calls an API protected by `verify_session`, and
+  `--scenario refresh` refreshes sessions, which queries the core on every request.
+- `--core-latency-ms` and `--core-error-rate` make the mock core slower or flaky.
+- `--failover` puts a host that is not listening before the mock core in the connection
+  URI, to measure the cost of the SDK failing over to the next host.
+
+The environment is passed on to the app, so SDK options which are set using env vars
+(like `SUPERTOKENS_SYNC_HTTP_CLIENT=1`) can be compared by running the harness with and
+without them. The report includes the number of requests to the core, and the number of
+connections opened to it, to see the effect of connection pooling.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+EXAMPLES_DIR = os.path.join(REPO_ROOT, "examples")
+
+# (directory, command, port) of the example app of each framework
+APPS: Dict[str, Tuple[str, List[str], int]] = {
+    "fastapi": (
+        "with-fastapi/with-thirdpartyemailpassword",
+        ["-m", "uvicorn", "main:app", "--port", "3001", "--log-level", "warning"],
+        3001,
+    ),
+    "flask": (
+        "with-flask/with-thirdpartyemailpassword",
+        ["-c", "from app import app; app.run(port=3001, threaded=True)"],
+        3001,
+    ),
+    "django": (
+        "with-django/with-thirdpartyemailpassword",
+        ["manage.py", "runserver", "8000", "--noreload"],
+        8000,
+    ),
+}
+
+# Needed by the social login providers of the example apps, but not used by the harness
+PROVIDER_ENV_VARS = [
+    "APPLE_CLIENT_ID",
+    "APPLE_CLIENT_ID_MOBILE",
+    "APPLE_KEY_ID",
+    "APPLE_PRIVATE_KEY",
+    "APPLE_TEAM_ID",
+    "DISCORD_CLIENT_ID",
+    "DISCORD_CLIENT_SECRET",
+    "GITHUB_CLIENT_ID",
+    "GITHUB_CLIENT_ID_MOBILE",
+    "GITHUB_CLIENT_SECRET",
+    "GITHUB_CLIENT_SECRET_MOBILE",
+    "GOOGLE_CLIENT_ID",
+    "GOOGLE_CLIENT_ID_MOBILE",
+    "GOOGLE_CLIENT_SECRET",
+    "GOOGLE_CLIENT_SECRET_MOBILE",
+    "GOOGLE_WORKSPACES_CLIENT_ID",
+    "GOOGLE_WORKSPACES_CLIENT_SECRET",
+]
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(
+    port: int, process: "subprocess.Popen[bytes]", timeout_sec: float = 30
+):
+    deadline = time.time() + timeout_sec
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise Exception(f"Process exited with code {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise Exception(f"Timed out waiting for port {port}")
+
+
+def start_process(
+    args: List[str], port: int, cwd: Optional[str] = None, env: Any = None
+) -> "subprocess.Popen[bytes]":
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable] + args,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, process)
+    except Exception:
+        process.kill()
+        raise
+    return process
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percentile / 100))
+    return sorted_values[index]
+
+
+class LoadTest:
+    def __init__(
+        self,
+        app_url: str,
+        scenario: str,
+        requests: int,
+        sessions: List[Tuple[str, str]],
+    ):
+        self.app_url = app_url
+        self.scenario = scenario
+        self.requests_left = requests
+        # The (access token, refresh token) of the session used by each worker
+        self.sessions = sessions
+        self.latencies_ms: List[float] = []
+        self.errors: Dict[str, int] = {}
+
+    async def send_request(
+        self, client: httpx.AsyncClient, tokens: Tuple[str, str]
+    ) -> Tuple[httpx.Response, Tuple[str, str]]:
+        access_token, refresh_token = tokens
+        if self.scenario == "sessioninfo":
+            response = await client.get(
+                self.app_url + "/sessioninfo",
+                headers={"Authorization": "Bearer " + access_token},
+            )
+            # The access token is updated if a claim in it had to be refetched
+            return response, (
+                response.headers.get("st-access-token", access_token),
+                refresh_token,
+            )
+
+        response = await client.post(
+            self.app_url + "/auth/session/refresh",
+            headers={"Authorization": "Bearer " + refresh_token, "rid": "session"},
+        )
+        return response, (
+            response.headers.get("st-access-token", access_token),
+            response.headers.get("st-refresh-token", refresh_token),
+        )
+
+    async def worker(self, client: httpx.AsyncClient, tokens: Tuple[str, str]):
+        while self.requests_left > 0:
+            self.requests_left -= 1
+            start = time.perf_counter()
+            try:
+                response, tokens = await self.send_request(client, tokens)
+                if response.status_code != 200:
+                    error = str(response.status_code)
+                    self.errors[error] = self.errors.get(error, 0) + 1
+            except httpx.HTTPError as e:
+                error = type(e).__name__
+                self.errors[error] = self.errors.get(error, 0) + 1
+            self.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    async def run(self) -> float:
+        limits = httpx.Limits(max_connections=len(self.sessions))
+        async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*[self.worker(client, s) for s in self.sessions])
+            return time.perf_counter() - start
+
+
+def create_session(core_client: httpx.Client, user_id: str) -> Tuple[str, str]:
+    response = core_client.post(
+        "/public/recipe/session", json={"userId": user_id, "useDynamicSigningKey": True}
+    )
+    tokens = response.json()
+    return tokens["accessToken"]["token"], tokens["refreshToken"]["token"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--framework", choices=sorted(APPS), default="fastapi")
+    parser.add_argument(
+        "--scenario", choices=["sessioninfo", "refresh"], default="sessioninfo"
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--core-latency-ms", type=float, default=0)
+    parser.add_argument("--core-error-rate", type=float, default=0)
+    parser.add_argument("--failover", action="store_true")
+    args = parser.parse_args()
+
+    core_port = get_free_port()
+    core_url = f"http://127.0.0.1:{core_port}"
+    connection_uri = core_url
+    if args.failover:
+        connection_uri = f"http://127.0.0.1:{get_free_port()};{core_url}"
+
+    app_dir, app_args, app_port = APPS[args.framework]
+    env = dict(os.environ)
+    for name in PROVIDER_ENV_VARS:
+        env.setdefault(name, "unused")
+    env["SUPERTOKENS_CONNECTION_URI"] = connection_uri
+    env["PYTHONPATH"] = os.pathsep.join(
+        [REPO_ROOT] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else [])
+    )
+
+    core = start_process(
+        [
+            "-m",
+            "tests.benchmarks.mock_core",
+            "--port",
+            str(core_port),
+            "--latency-ms",
+            str(args.core_latency_ms),
+            "--error-rate",
+            str(args.core_error_rate),
+        ],
+        core_port,
+        cwd=REPO_ROOT,
+    )
+    try:
+        app = start_process(
+            app_args, app_port, cwd=os.path.join(EXAMPLES_DIR, app_dir), env=env
+        )
+        try:
+            # The harness uses a single connection to the core, for creating the
+            # sessions and getting the stats
+            with httpx.Client(base_url=core_url) as core_client:
+                sessions = [
+                    create_session(core_client, f"user-{i}")
+                    for i in range(args.concurrency)
+                ]
+                load_test = LoadTest(
+                    f"http://127.0.0.1:{app_port}",
+                    args.scenario,
+                    args.requests,
+                    sessions,
+                )
+                duration_sec = asyncio.run(load_test.run())
+                stats: Dict[str, Any] = core_client.get("/mock/stats").json()
+        finally:
+            app.terminate()
+            app.wait()
+    finally:
+        core.terminate()
+        core.wait()
+
+    latencies = sorted(load_test.latencies_ms)
+    print(
+        f"{args.framework} / {args.scenario}: {len(latencies)} requests, "
+        f"concurrency {args.concurrency}"
+    )
+    print(f"Throughput:   {len(latencies) / duration_sec:.1f} requests/s")
+    print(
+        f"Latency (ms): p50 {get_percentile(latencies, 50):.2f}, "
+        f"p95 {get_percentile(latencies, 95):.2f}, "
+        f"p99 {get_percentile(latencies, 99):.2f}"
+    )
+    print(f"Errors:       {load_test.errors or 'none'}")
+    print(f"Core connections opened: {stats['connections'] - 1}")
+    for api, count in sorted(stats["requests"].items()):
+        if not api.endswith(" /recipe/session") and not api.startswith("GET /mock"):
+            print(f"Core requests {api}: {count}")
+
+
+if __name__ == "__main__":
+    main()
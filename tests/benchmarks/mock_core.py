@@ -0,0 +1,475 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+A lightweight in memory stand-in for the SuperTokens core, for load testing and
+benchmarking the SDK without running the real core. It implements the APIs used by the
+session, user metadata and user roles recipes, and can add latency and errors to the
+responses. Every user id exists, as a third party user with the verified email
+`<user id>@example.com`.
+
+Run with `python -m tests.benchmarks.mock_core --port 3567 [--latency-ms 5]
+[--error-rate 0.01]`.
+
+It also has these APIs, which are not part of the core:
+
+- `GET /mock/stats`: the number of requests per API, and the number of connections
+  opened to it (to measure connection pooling).
+- `PUT /mock/config`: changes the `latency_ms`, `jitter_ms`, `error_rate` and
+  `error_status` options.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
+
+ACCESS_TOKEN_VALIDITY_SEC = 3600
+REFRESH_TOKEN_VALIDITY_SEC = 100 * 24 * 3600
+KEY_ID = "d-mock-core"
+
+Handler = Callable[[Dict[str, Any], Dict[str, Any]], Tuple[int, Dict[str, Any]]]
+ASGIReceive = Callable[[], Awaitable[Dict[str, Any]]]
+ASGISend = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class MockCoreConfig:
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        error_status: int = 500,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+
+class MockSession:
+    def __init__(
+        self,
+        handle: str,
+        user_id: str,
+        tenant_id: str,
+        user_data_in_jwt: Dict[str, Any],
+        user_data_in_database: Dict[str, Any],
+    ):
+        self.handle = handle
+        self.user_id = user_id
+        self.tenant_id = tenant_id
+        self.user_data_in_jwt = user_data_in_jwt
+        self.user_data_in_database = user_data_in_database
+        self.refresh_token = ""
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "handle": self.handle,
+            "userId": self.user_id,
+            "userDataInJWT": self.user_data_in_jwt,
+            "tenantId": self.tenant_id,
+        }
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_tenant_and_path(path: str) -> Tuple[str, str]:
+    # The SDK prefixes tenant specific APIs with the tenant id (/public/recipe/session)
+    parts = path.split("/", 2)
+    if len(parts) == 3 and parts[1] not in ("recipe", "mock", ".well-known", ""):
+        return parts[1], "/" + parts[2]
+    return "public", path
+
+
+class MockCore:
+    """
+    The mock core ASGI app. All its state is in memory.
+    """
+
+    def __init__(self, config: Optional[MockCoreConfig] = None):
+        self.config = config or MockCoreConfig()
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        public_key = self.private_key.public_key()
+        public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key))  # type: ignore
+        public_jwk.update({"kid": KEY_ID, "alg": "RS256", "use": "sig"})
+        self.jwks = {"keys": [public_jwk]}
+
+        self.sessions: Dict[str, MockSession] = {}
+        self.refresh_tokens: Dict[str, str] = {}
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.roles: Dict[str, Set[str]] = {}
+        self.user_roles: Dict[Tuple[str, str], Set[str]] = {}
+
+        self.request_counts: Dict[str, int] = {}
+        self.connections: Set[Tuple[str, int]] = set()
+
+        self.handlers: Dict[Tuple[str, str], Handler] = {
+            ("GET", "/apiversion"): self.api_version,
+            ("GET", "/hello"): self.hello,
+            ("GET", "/.well-known/jwks.json"): self.get_jwks,
+            ("POST", "/recipe/session"): self.create_session,
+            ("POST", "/recipe/session/verify"): self.verify_session,
+            ("POST", "/recipe/session/refresh"): self.refresh_session,
+            ("POST", "/recipe/session/regenerate"): self.regenerate_session,
+            ("POST", "/recipe/session/remove"): self.remove_sessions,
+            ("GET", "/recipe/session"): self.get_session_information,
+            ("GET", "/recipe/session/user"): self.get_sessions_for_user,
+            ("GET", "/recipe/user"): self.get_user,
+            ("GET", "/recipe/user/email/verify"): self.is_email_verified,
+            ("GET", "/recipe/user/metadata"): self.get_user_metadata,
+            ("PUT", "/recipe/user/metadata"): self.update_user_metadata,
+            ("POST", "/recipe/user/metadata/remove"): self.clear_user_metadata,
+            ("PUT", "/recipe/role"): self.create_role,
+            ("GET", "/recipe/roles"): self.get_all_roles,
+            ("GET", "/recipe/role/permissions"): self.get_permissions_for_role,
+            ("POST", "/recipe/role/remove"): self.delete_role,
+            ("PUT", "/recipe/user/role"): self.add_role_to_user,
+            ("POST", "/recipe/user/role/remove"): self.remove_user_role,
+            ("GET", "/recipe/user/roles"): self.get_roles_for_user,
+            ("GET", "/mock/stats"): self.get_stats,
+            ("PUT", "/mock/config"): self.update_config,
+        }
+
+    async def __call__(
+        self, scope: Dict[str, Any], receive: ASGIReceive, send: ASGISend
+    ):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        if scope.get("client") is not None:
+            self.connections.add(tuple(scope["client"]))  # type: ignore
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        status, response = await self.handle(
+            scope["method"], scope["path"], scope["query_string"].decode(), body
+        )
+
+        response_body = json.dumps(response).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": response_body})
+
+    async def handle(
+        self, method: str, path: str, query_string: str, body: bytes
+    ) -> Tuple[int, Dict[str, Any]]:
+        tenant_id, path = get_tenant_and_path(path)
+        key = method + " " + path
+        self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+        handler = self.handlers.get((method, path))
+        if handler is None:
+            return 404, {"message": "Not found: " + key}
+
+        if not path.startswith("/mock/"):
+            jitter_ms = random.uniform(0, self.config.jitter_ms)
+            latency_ms = self.config.latency_ms + jitter_ms
+            if latency_ms > 0:
+                await asyncio.sleep(latency_ms / 1000)
+            if random.random() < self.config.error_rate:
+                return self.config.error_status, {"message": "Injected error"}
+
+        request: Dict[str, Any] = json.loads(body) if body else {}
+        params: Dict[str, Any] = dict(parse_qsl(query_string))
+        params["tenantId"] = tenant_id
+        return handler(request, params)
+
+    def create_access_token(self, session: MockSession) -> Dict[str, Any]:
+        now = int(time.time())
+        access_token = jwt.encode(  # type: ignore
+            {
+                **session.user_data_in_jwt,
+                "sub": session.user_id,
+                "iat": now,
+                "exp": now + ACCESS_TOKEN_VALIDITY_SEC,
+                "sessionHandle": session.handle,
+                "refreshTokenHash1": hash_token(session.refresh_token),
+                "parentRefreshTokenHash1": None,
+                "antiCsrfToken": None,
+                "tId": session.tenant_id,
+            },
+            self.private_key,  # type: ignore
+            algorithm="RS256",
+            headers={"kid": KEY_ID, "version": "5"},
+        )
+        return {
+            "token": access_token,
+            "expiry": (now + ACCESS_TOKEN_VALIDITY_SEC) * 1000,
+            "createdTime": now * 1000,
+        }
+
+    def create_tokens(self, session: MockSession) -> Dict[str, Any]:
+        refresh_token = uuid.uuid4().hex
+        self.refresh_tokens.pop(session.refresh_token, None)
+        self.refresh_tokens[refresh_token] = session.handle
+        session.refresh_token = refresh_token
+
+        now = int(time.time())
+        return {
+            "status": "OK",
+            "session": session.to_json(),
+            "accessToken": self.create_access_token(session),
+            "refreshToken": {
+                "token": refresh_token,
+                "expiry": (now + REFRESH_TOKEN_VALIDITY_SEC) * 1000,
+                "createdTime": now * 1000,
+            },
+        }
+
+    def get_session_from_access_token(
+        self, access_token: str
+    ) -> Tuple[Optional[MockSession], Optional[str]]:
+        try:
+            payload = jwt.decode(  # type: ignore
+                access_token,
+                self.private_key.public_key(),  # type: ignore
+                algorithms=["RS256"],
+            )
+        except jwt.PyJWTError as e:
+            return None, str(e)
+        return self.sessions.get(payload["sessionHandle"]), None
+
+    def api_version(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, {"versions": SUPPORTED_CDI_VERSIONS}
+
+    def hello(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, {"status": "OK"}
+
+    def get_jwks(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, self.jwks
+
+    def create_session(self, request: Dict[str, Any], params: Dict[str, Any]):
+        session = MockSession(
+            uuid.uuid4().hex,
+            request["userId"],
+            params["tenantId"],
+            request.get("userDataInJWT") or {},
+            request.get("userDataInDatabase") or {},
+        )
+        self.sessions[session.handle] = session
+        return 200, self.create_tokens(session)
+
+    def verify_session(self, request: Dict[str, Any], _: Dict[str, Any]):
+        session, error = self.get_session_from_access_token(request["accessToken"])
+        if error is not None:
+            return 200, {"status": "TRY_REFRESH_TOKEN", "message": error}
+        if session is None:
+            return 200, {"status": "UNAUTHORISED", "message": "Session does not exist"}
+        return 200, {"status": "OK", "session": session.to_json()}
+
+    def regenerate_session(self, request: Dict[str, Any], _: Dict[str, Any]):
+        session, _ = self.get_session_from_access_token(request["accessToken"])
+        if session is None:
+            return 200, {"status": "UNAUTHORISED", "message": "Session does not exist"}
+        session.user_data_in_jwt = request.get("userDataInJWT") or {}
+        return 200, {
+            "status": "OK",
+            "session": session.to_json(),
+            "accessToken": self.create_access_token(session),
+        }
+
+    def refresh_session(self, request: Dict[str, Any], _: Dict[str, Any]):
+        handle = self.refresh_tokens.get(request["refreshToken"])
+        session = self.sessions.get(handle) if handle is not None else None
+        if session is None:
+            return 200, {"status": "UNAUTHORISED", "message": "Session does not exist"}
+        return 200, self.create_tokens(session)
+
+    def remove_sessions(self, request: Dict[str, Any], _: Dict[str, Any]):
+        if "sessionHandles" in request:
+            handles: List[str] = request["sessionHandles"]
+        else:
+            handles = [
+                s.handle
+                for s in self.sessions.values()
+                if s.user_id == request["userId"]
+            ]
+
+        revoked: List[str] = []
+        for handle in handles:
+            session = self.sessions.pop(handle, None)
+            if session is not None:
+                self.refresh_tokens.pop(session.refresh_token, None)
+                revoked.append(handle)
+        return 200, {"status": "OK", "sessionHandlesRevoked": revoked}
+
+    def get_session_information(self, _: Dict[str, Any], params: Dict[str, Any]):
+        session = self.sessions.get(params["sessionHandle"])
+        if session is None:
+            return 200, {"status": "UNAUTHORISED", "message": "Session does not exist"}
+        return 200, {
+            "status": "OK",
+            "sessionHandle": session.handle,
+            "userId": session.user_id,
+            "userDataInDatabase": session.user_data_in_database,
+            "userDataInJWT": session.user_data_in_jwt,
+            "expiry": (int(time.time()) + REFRESH_TOKEN_VALIDITY_SEC) * 1000,
+            "timeCreated": int(time.time()) * 1000,
+            "tenantId": session.tenant_id,
+        }
+
+    def get_sessions_for_user(self, _: Dict[str, Any], params: Dict[str, Any]):
+        handles = [
+            s.handle for s in self.sessions.values() if s.user_id == params["userId"]
+        ]
+        return 200, {"status": "OK", "sessionHandles": handles}
+
+    def get_user(self, _: Dict[str, Any], params: Dict[str, Any]):
+        if "userId" not in params:
+            return 200, {"status": "UNKNOWN_EMAIL_ERROR"}
+        user_id = params["userId"]
+        return 200, {
+            "status": "OK",
+            "user": {
+                "id": user_id,
+                "email": user_id + "@example.com",
+                "timeJoined": 0,
+                "tenantIds": ["public"],
+                "thirdParty": {"id": "mock", "userId": user_id},
+            },
+        }
+
+    def is_email_verified(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, {"status": "OK", "isVerified": True}
+
+    def get_user_metadata(self, _: Dict[str, Any], params: Dict[str, Any]):
+        metadata = self.metadata.get(params["userId"], {})
+        return 200, {"status": "OK", "metadata": metadata}
+
+    def update_user_metadata(self, request: Dict[str, Any], _: Dict[str, Any]):
+        metadata = self.metadata.setdefault(request["userId"], {})
+        for key, value in request["metadataUpdate"].items():
+            if value is None:
+                metadata.pop(key, None)
+            else:
+                metadata[key] = value
+        return 200, {"status": "OK", "metadata": metadata}
+
+    def clear_user_metadata(self, request: Dict[str, Any], _: Dict[str, Any]):
+        self.metadata.pop(request["userId"], None)
+        return 200, {"status": "OK"}
+
+    def create_role(self, request: Dict[str, Any], _: Dict[str, Any]):
+        created_new_role = request["role"] not in self.roles
+        self.roles.setdefault(request["role"], set()).update(request["permissions"])
+        return 200, {"status": "OK", "createdNewRole": created_new_role}
+
+    def get_all_roles(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, {"status": "OK", "roles": list(self.roles)}
+
+    def get_permissions_for_role(self, _: Dict[str, Any], params: Dict[str, Any]):
+        if params["role"] not in self.roles:
+            return 200, {"status": "UNKNOWN_ROLE_ERROR"}
+        return 200, {"status": "OK", "permissions": list(self.roles[params["role"]])}
+
+    def delete_role(self, request: Dict[str, Any], _: Dict[str, Any]):
+        did_role_exist = self.roles.pop(request["role"], None) is not None
+        for roles in self.user_roles.values():
+            roles.discard(request["role"])
+        return 200, {"status": "OK", "didRoleExist": did_role_exist}
+
+    def add_role_to_user(self, request: Dict[str, Any], params: Dict[str, Any]):
+        if request["role"] not in self.roles:
+            return 200, {"status": "UNKNOWN_ROLE_ERROR"}
+        key = (params["tenantId"], request["userId"])
+        roles = self.user_roles.setdefault(key, set())
+        did_user_already_have_role = request["role"] in roles
+        roles.add(request["role"])
+        return 200, {
+            "status": "OK",
+            "didUserAlreadyHaveRole": did_user_already_have_role,
+        }
+
+    def remove_user_role(self, request: Dict[str, Any], params: Dict[str, Any]):
+        if request["role"] not in self.roles:
+            return 200, {"status": "UNKNOWN_ROLE_ERROR"}
+        roles = self.user_roles.get((params["tenantId"], request["userId"]), set())
+        did_user_have_role = request["role"] in roles
+        roles.discard(request["role"])
+        return 200, {"status": "OK", "didUserHaveRole": did_user_have_role}
+
+    def get_roles_for_user(self, _: Dict[str, Any], params: Dict[str, Any]):
+        roles = self.user_roles.get((params["tenantId"], params["userId"]), set())
+        return 200, {"status": "OK", "roles": list(roles)}
+
+    def get_stats(self, _: Dict[str, Any], __: Dict[str, Any]):
+        return 200, {
+            "requests": self.request_counts,
+            "connections": len(self.connections),
+        }
+
+    def update_config(self, request: Dict[str, Any], _: Dict[str, Any]):
+        for key, value in request.items():
+            if hasattr(self.config, key):
+                setattr(self.config, key, value)
+        return 200, {"status": "OK"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3567)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=500)
+    args = parser.parse_args()
+
+    import uvicorn  # type: ignore
+
+    app = MockCore(
+        MockCoreConfig(
+            args.latency_ms, args.jitter_ms, args.error_rate, args.error_status
+        )
+    )
+    uvicorn.run(  # type: ignore
+        app, host=args.host, port=args.port, log_level="warning"
+    )
+
+
+if __name__ == "__main__":
+    main()
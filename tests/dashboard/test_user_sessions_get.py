@@ -0,0 +1,144 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from pytest import MonkeyPatch, mark
+from starlette.requests import Request
+from starlette.responses import Response
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import dashboard
+from supertokens_python.recipe.dashboard.api.userdetails import user_sessions_get
+from supertokens_python.recipe.dashboard.constants import USER_SESSION_API
+from supertokens_python.recipe.dashboard.recipe import DashboardRecipe
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.session.interfaces import SessionInformationResult
+
+pytestmark = mark.asyncio
+
+
+def reset_recipes():
+    Supertokens.reset()
+    DashboardRecipe.reset()
+    MultitenancyRecipe.reset()
+
+
+def setup(**dashboard_config: Any):
+    reset_recipes()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[dashboard.init(api_key="someKey", **dashboard_config)],
+    )
+
+
+async def call_api(request_id: str, query_string: bytes) -> Dict[str, Any]:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/auth/dashboard/api/user/sessions",
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"authorization", b"Bearer someKey")],
+    }
+    response = await DashboardRecipe.get_instance().handle_api_request(
+        request_id,
+        "public",
+        FastApiRequest(Request(scope)),
+        NormalisedURLPath("/auth/dashboard/api/user/sessions"),
+        "get",
+        FastApiResponse(Response()),
+        {},
+    )
+    assert isinstance(response, FastApiResponse)
+    return json.loads(response.response.body)
+
+
+def fake_sessions(monkeypatch: MonkeyPatch, handle_count: int) -> Dict[str, int]:
+    counts = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def get_all_session_handles_for_user(*_: Any) -> List[str]:
+        return [f"handle{i}" for i in range(handle_count)]
+
+    async def get_session_information(
+        session_handle: str, _: Dict[str, Any]
+    ) -> Optional[SessionInformationResult]:
+        counts["calls"] += 1
+        counts["in_flight"] += 1
+        counts["max_in_flight"] = max(counts["max_in_flight"], counts["in_flight"])
+        await asyncio.sleep(0.02 if session_handle.endswith("0") else 0.001)
+        counts["in_flight"] -= 1
+        if session_handle == "handle3":
+            # Revoked after its handle was fetched
+            return None
+        return SessionInformationResult(
+            session_handle, "user1", {}, 0, {}, 0, "public"
+        )
+
+    monkeypatch.setattr(
+        user_sessions_get,
+        "get_all_session_handles_for_user",
+        get_all_session_handles_for_user,
+    )
+    monkeypatch.setattr(
+        user_sessions_get, "get_session_information", get_session_information
+    )
+    return counts
+
+
+async def test_sessions_are_fetched_with_bounded_concurrency(
+    monkeypatch: MonkeyPatch,
+):
+    setup(session_info_fetch_concurrency=4)
+    counts = fake_sessions(monkeypatch, 25)
+
+    body = await call_api(USER_SESSION_API, query_string=b"userId=user1")
+
+    handles = [s["sessionHandle"] for s in body["sessions"]]
+    assert handles == [f"handle{i}" for i in range(25) if i != 3]
+    assert "totalSessions" not in body
+    assert counts["calls"] == 25
+    assert counts["max_in_flight"] == 4
+    reset_recipes()
+
+
+async def test_sessions_can_be_paginated(monkeypatch: MonkeyPatch):
+    setup()
+    counts = fake_sessions(monkeypatch, 25)
+
+    body = await call_api(USER_SESSION_API, query_string=b"userId=user1&limit=10")
+    assert [s["sessionHandle"] for s in body["sessions"]] == [
+        f"handle{i}" for i in range(10) if i != 3
+    ]
+    assert (body["totalSessions"], body["nextOffset"]) == (25, 10)
+
+    body = await call_api(
+        USER_SESSION_API, query_string=b"userId=user1&limit=10&offset=20"
+    )
+    assert [s["sessionHandle"] for s in body["sessions"]] == [
+        f"handle{i}" for i in range(20, 25)
+    ]
+    assert (body["totalSessions"], body["nextOffset"]) == (25, None)
+    assert counts["calls"] == 15
+    reset_recipes()
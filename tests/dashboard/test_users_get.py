@@ -0,0 +1,169 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from pytest import MonkeyPatch, mark, raises
+from starlette.requests import Request
+from starlette.responses import Response
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import dashboard, usermetadata
+from supertokens_python.recipe.dashboard import UsersPageCacheConfig
+from supertokens_python.recipe.dashboard.api import users_get
+from supertokens_python.recipe.dashboard.constants import (
+    SIGN_OUT_API,
+    USERS_LIST_GET_API,
+)
+from supertokens_python.recipe.dashboard.recipe import DashboardRecipe
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.usermetadata import UserMetadataRecipe
+from supertokens_python.recipe.usermetadata.interfaces import MetadataResult
+from supertokens_python.types import User, UsersResponse
+
+pytestmark = mark.asyncio
+
+
+def reset_recipes():
+    Supertokens.reset()
+    DashboardRecipe.reset()
+    UserMetadataRecipe.reset()
+    MultitenancyRecipe.reset()
+
+
+class FakeCore:
+    def __init__(self, monkeypatch: MonkeyPatch, user_count: int):
+        self.users = [
+            User("emailpassword", f"user{i}", i, f"user{i}@example.com", None, None, [])
+            for i in range(user_count)
+        ]
+        self.get_users_calls = 0
+        self.metadata_calls = 0
+        self.metadata_in_flight = 0
+        self.max_metadata_in_flight = 0
+
+        async def get_users(*_: Any, **__: Any) -> UsersResponse:
+            self.get_users_calls += 1
+            return UsersResponse(self.users, None)
+
+        async def get_user_metadata(
+            user_id: str, _: Optional[Dict[str, Any]] = None
+        ) -> MetadataResult:
+            self.metadata_calls += 1
+            self.metadata_in_flight += 1
+            self.max_metadata_in_flight = max(
+                self.max_metadata_in_flight, self.metadata_in_flight
+            )
+            # Some fetches are slower than others
+            await asyncio.sleep(0.02 if user_id.endswith("0") else 0.001)
+            self.metadata_in_flight -= 1
+            return MetadataResult({"first_name": "First " + user_id})
+
+        monkeypatch.setattr(Supertokens, "get_users", get_users)
+        monkeypatch.setattr(users_get, "get_user_metadata", get_user_metadata)
+
+
+def setup(**dashboard_config: Any):
+    reset_recipes()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[
+            usermetadata.init(),
+            dashboard.init(api_key="someKey", **dashboard_config),
+        ],
+    )
+
+
+async def call_api(
+    request_id: str, method: str = "get", query_string: bytes = b"limit=10"
+) -> Dict[str, Any]:
+    scope = {
+        "type": "http",
+        "method": method.upper(),
+        "path": "/auth/dashboard/api/users",
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"authorization", b"Bearer someKey")],
+    }
+    response = await DashboardRecipe.get_instance().handle_api_request(
+        request_id,
+        "public",
+        FastApiRequest(Request(scope)),
+        NormalisedURLPath("/auth/dashboard/api/users"),
+        method,
+        FastApiResponse(Response()),
+        {},
+    )
+    assert isinstance(response, FastApiResponse)
+    return json.loads(response.response.body)
+
+
+async def test_user_metadata_is_fetched_with_bounded_concurrency(
+    monkeypatch: MonkeyPatch,
+):
+    setup(user_metadata_fetch_concurrency=3)
+    core = FakeCore(monkeypatch, 20)
+
+    body = await call_api(USERS_LIST_GET_API)
+
+    users: List[Dict[str, Any]] = [u["user"] for u in body["users"]]
+    assert [u["id"] for u in users] == [f"user{i}" for i in range(20)]
+    assert all(u["firstName"] == "First " + u["id"] for u in users)
+    assert core.metadata_calls == 20
+    assert core.max_metadata_in_flight == 3
+    reset_recipes()
+
+
+async def test_users_pages_are_cached_till_a_change_is_made(monkeypatch: MonkeyPatch):
+    setup(users_page_cache=UsersPageCacheConfig())
+    core = FakeCore(monkeypatch, 2)
+
+    first = await call_api(USERS_LIST_GET_API)
+    assert await call_api(USERS_LIST_GET_API) == first
+    assert (core.get_users_calls, core.metadata_calls) == (1, 2)
+
+    # A different page is fetched separately
+    await call_api(USERS_LIST_GET_API, query_string=b"limit=10&paginationToken=abc")
+    assert (core.get_users_calls, core.metadata_calls) == (2, 4)
+
+    await call_api(SIGN_OUT_API, method="post")
+    await call_api(USERS_LIST_GET_API)
+    assert (core.get_users_calls, core.metadata_calls) == (3, 6)
+    reset_recipes()
+
+
+async def test_users_pages_are_not_cached_by_default(monkeypatch: MonkeyPatch):
+    setup()
+    core = FakeCore(monkeypatch, 2)
+
+    await call_api(USERS_LIST_GET_API)
+    await call_api(USERS_LIST_GET_API)
+    assert core.get_users_calls == 2
+    reset_recipes()
+
+
+async def test_user_metadata_fetch_concurrency_is_validated():
+    with raises(ValueError):
+        setup(user_metadata_fetch_concurrency=0)
+    reset_recipes()
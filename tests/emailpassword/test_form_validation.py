@@ -0,0 +1,82 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from typing import List, Optional
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.emailpassword.api.utils import (
+    validate_form_or_throw_error,
+)
+from supertokens_python.recipe.emailpassword.exceptions import FieldError
+from supertokens_python.recipe.emailpassword.types import (
+    FormField,
+    NormalisedFormField,
+)
+from supertokens_python.recipe.emailpassword.utils import (
+    default_email_validator,
+    default_password_validator,
+)
+
+pytestmark = mark.asyncio
+
+
+async def test_validators_run_concurrently_and_errors_keep_the_field_order():
+    running: List[str] = []
+    max_running = 0
+
+    def create_validator(error: Optional[str]):
+        async def validate(value: str, tenant_id: str) -> Optional[str]:
+            nonlocal max_running
+            assert tenant_id == "public"
+            running.append(value)
+            max_running = max(max_running, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return error
+
+        return validate
+
+    config_form_fields = [
+        NormalisedFormField("username", create_validator("Username is taken"), False),
+        NormalisedFormField("company", create_validator(None), False),
+        NormalisedFormField("referrer", create_validator("Unknown referrer"), True),
+        NormalisedFormField("nickname", create_validator(None), False),
+    ]
+    inputs = [
+        FormField("referrer", "friend"),
+        FormField("company", "acme"),
+        FormField("username", "john"),
+        FormField("username", ""),
+    ]
+
+    with raises(FieldError) as e:
+        await validate_form_or_throw_error(inputs, config_form_fields, "public")
+
+    assert max_running == 3
+    assert e.value.get_json_form_fields() == [
+        {"id": "username", "error": "Username is taken"},
+        {"id": "referrer", "error": "Unknown referrer"},
+        {"id": "nickname", "error": "Field is not optional"},
+    ]
+
+
+async def test_default_validators():
+    assert await default_email_validator("john@example.com", "public") is None
+    assert await default_email_validator("john@example", "public") is not None
+    assert await default_email_validator(123, "public") is not None
+    assert await default_password_validator("password123", "public") is None
+    assert await default_password_validator("12345678", "public") is not None
+    assert await default_password_validator("password", "public") is not None
@@ -0,0 +1,230 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from typing import Any, Dict, List, Optional
+
+from pytest import MonkeyPatch, mark, raises
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init, instrumentation
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import emailpassword, emailverification, session
+from supertokens_python.recipe.emailpassword.asyncio import update_email_or_password
+from supertokens_python.recipe.emailverification import (
+    EmailVerificationClaim,
+    VerificationStatusCacheConfig,
+)
+from supertokens_python.recipe.emailverification.asyncio import (
+    unverify_email,
+    verify_email_using_token,
+)
+from supertokens_python.recipe.emailverification.interfaces import (
+    GetEmailForUserIdOkResult,
+)
+from tests.utils import reset
+
+
+class FakeCore:
+    def __init__(self, monkeypatch: MonkeyPatch):
+        self.verified = False
+        self.email = "john@example.com"
+        self.email_lookups = 0
+        self.requests: List[str] = []
+
+        async def send_get_request(
+            _: Querier, path: NormalisedURLPath, params: Dict[str, Any], *__: Any
+        ) -> Dict[str, Any]:
+            self.requests.append("GET " + path.get_as_string_dangerous())
+            assert params == {"userId": "user1", "email": self.email}
+            return {"status": "OK", "isVerified": self.verified}
+
+        async def send_post_request(
+            _: Querier, path: NormalisedURLPath, *__: Any, **___: Any
+        ) -> Dict[str, Any]:
+            self.requests.append("POST " + path.get_as_string_dangerous())
+            return {"status": "OK", "userId": "user1", "email": self.email}
+
+        async def send_put_request(
+            _: Querier, path: NormalisedURLPath, *__: Any, **___: Any
+        ) -> Dict[str, Any]:
+            self.requests.append("PUT " + path.get_as_string_dangerous())
+            return {"status": "OK"}
+
+        monkeypatch.setattr(Querier, "send_get_request", send_get_request)
+        monkeypatch.setattr(Querier, "send_post_request", send_post_request)
+        monkeypatch.setattr(Querier, "send_put_request", send_put_request)
+
+
+def init_recipes(
+    monkeypatch: MonkeyPatch,
+    verification_status_cache: Optional[VerificationStatusCacheConfig],
+) -> FakeCore:
+    reset(stop_core=False)
+
+    async def get_email_for_user_id(user_id: str, _: Dict[str, Any]):
+        core.email_lookups += 1
+        return GetEmailForUserIdOkResult(core.email)
+
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[
+            session.init(),
+            emailpassword.init(),
+            emailverification.init(
+                "REQUIRED",
+                get_email_for_user_id=get_email_for_user_id,
+                verification_status_cache=verification_status_cache,
+            ),
+        ],
+    )
+    core = FakeCore(monkeypatch)
+    return core
+
+
+@mark.asyncio
+async def test_verification_status_is_cached_and_updated_by_this_sdk(
+    monkeypatch: MonkeyPatch,
+):
+    core = init_recipes(monkeypatch, VerificationStatusCacheConfig())
+
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert core.requests == ["GET /recipe/user/email/verify"]
+
+    await verify_email_using_token("public", "token")
+    core.verified = True
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is True
+
+    await unverify_email("user1", "john@example.com")
+    core.verified = False
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert core.requests == [
+        "GET /recipe/user/email/verify",
+        "POST /public/recipe/user/email/verify",
+        "POST /recipe/user/email/verify/remove",
+    ]
+
+
+@mark.asyncio
+async def test_email_is_cached_and_forgotten_when_changed_by_this_sdk(
+    monkeypatch: MonkeyPatch,
+):
+    core = init_recipes(monkeypatch, VerificationStatusCacheConfig())
+
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert core.email_lookups == 1
+
+    await verify_email_using_token("public", "token")
+    await update_email_or_password("user1", email="jane@example.com")
+    core.email = "jane@example.com"
+    # The new email is not verified, even though the old one is
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    assert core.email_lookups == 2
+    assert core.requests == [
+        "GET /recipe/user/email/verify",
+        "POST /public/recipe/user/email/verify",
+        "PUT /recipe/user",
+        "GET /recipe/user/email/verify",
+    ]
+
+
+@mark.asyncio
+async def test_cache_hits_and_misses_are_recorded(monkeypatch: MonkeyPatch):
+    init_recipes(monkeypatch, VerificationStatusCacheConfig())
+    events: List[Dict[str, Any]] = []
+
+    class Listener(instrumentation.InstrumentationListener):
+        def on_event(self, name: str, attributes: Dict[str, Any]) -> None:
+            if name == "cache" and attributes["cache"] == "email_verification":
+                events.append(attributes)
+
+    listener = Listener()
+    instrumentation.add_listener(listener)
+    try:
+        await EmailVerificationClaim.fetch_value("user1", "public", {})
+        await EmailVerificationClaim.fetch_value("user1", "public", {})
+    finally:
+        instrumentation.remove_listener(listener)
+
+    assert [e["hit"] for e in events] == [False, True]
+
+
+@mark.asyncio
+async def test_read_started_before_a_change_does_not_cache_the_old_status(
+    monkeypatch: MonkeyPatch,
+):
+    core = init_recipes(monkeypatch, VerificationStatusCacheConfig())
+    send_get_request = Querier.send_get_request
+
+    async def send_get_request_racing_a_verification(*args: Any):
+        response = await send_get_request(*args)
+        await verify_email_using_token("public", "token")
+        core.verified = True
+        return response
+
+    monkeypatch.setattr(
+        Querier, "send_get_request", send_get_request_racing_a_verification
+    )
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    monkeypatch.setattr(Querier, "send_get_request", send_get_request)
+
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is True
+    assert core.requests == [
+        "GET /recipe/user/email/verify",
+        "POST /public/recipe/user/email/verify",
+    ]
+
+
+@mark.asyncio
+async def test_unverified_status_is_cached_for_negative_ttl(monkeypatch: MonkeyPatch):
+    core = init_recipes(monkeypatch, VerificationStatusCacheConfig(negative_ttl_sec=1))
+    timestamp = [1_000_000]
+    monkeypatch.setattr(
+        "supertokens_python.utils.get_timestamp_ms", lambda: timestamp[0]
+    )
+
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    core.verified = True
+    timestamp[0] += 999
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is False
+    timestamp[0] += 1
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is True
+    timestamp[0] += 59_999
+    assert await EmailVerificationClaim.fetch_value("user1", "public", {}) is True
+    assert len(core.requests) == 2
+
+
+@mark.asyncio
+async def test_verification_status_is_not_cached_by_default(monkeypatch: MonkeyPatch):
+    core = init_recipes(monkeypatch, None)
+
+    await EmailVerificationClaim.fetch_value("user1", "public", {})
+    await EmailVerificationClaim.fetch_value("user1", "public", {})
+    assert len(core.requests) == 2
+
+
+def test_verification_status_cache_config_is_validated():
+    with raises(ValueError):
+        VerificationStatusCacheConfig(ttl_sec=0)
+    with raises(ValueError):
+        VerificationStatusCacheConfig(negative_ttl_sec=-1)
+    with raises(ValueError):
+        VerificationStatusCacheConfig(max_size=0)
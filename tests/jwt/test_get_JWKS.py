@@ -17,13 +17,22 @@ under the License.
 from _pytest.fixtures import fixture
 from fastapi import FastAPI
 from typing import Optional, Dict, Any
-from pytest import mark
+from pytest import MonkeyPatch, mark
 from starlette.requests import Request
 from starlette.testclient import TestClient
 from supertokens_python import InputAppInfo, SupertokensConfig, init
 from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.framework.response import BaseResponse
 from supertokens_python.recipe import jwt
-from supertokens_python.recipe.jwt.interfaces import APIInterface, RecipeInterface
+from supertokens_python.recipe.jwt.interfaces import (
+    APIInterface,
+    GetJWKSResult,
+    JsonWebKey,
+    RecipeInterface,
+)
+from supertokens_python.recipe.jwt.recipe_implementation import (
+    RecipeImplementation as JWTRecipeImplementation,
+)
 from supertokens_python.recipe.session.asyncio import create_new_session
 from tests.utils import clean_st, reset, setup_st, start_st
 
@@ -140,3 +149,126 @@ async def test_that_default_getJWKS_works_fine(driver_config_client: TestClient)
     assert len(data["keys"]) > 0
 
     assert "cache-control" not in response.headers
+
+
+async def test_that_getJWKS_api_supports_etag(driver_config_client: TestClient):
+    get_jwks_calls = 0
+
+    def func_override(oi: RecipeInterface):
+        async def get_jwks(_: Dict[str, Any]):
+            nonlocal get_jwks_calls
+            get_jwks_calls += 1
+            return GetJWKSResult(
+                [JsonWebKey("RSA", "kid-1", "n-value", "AQAB", "RS256", "sig")], 60
+            )
+
+        oi.get_jwks = get_jwks
+        return oi
+
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.supertokens.io",
+            website_domain="supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[jwt.init(override=jwt.OverrideConfig(functions=func_override))],
+    )
+
+    response = driver_config_client.get(url="/auth/jwt/jwks.json")
+    assert response.status_code == 200
+    assert response.json()["keys"][0]["kid"] == "kid-1"
+    etag = response.headers["etag"]
+
+    response = driver_config_client.get(
+        url="/auth/jwt/jwks.json", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "max-age=60, must-revalidate"
+
+    response = driver_config_client.get(
+        url="/auth/jwt/jwks.json", headers={"If-None-Match": '"other-etag"'}
+    )
+    assert response.status_code == 200
+    assert response.json()["keys"][0]["kid"] == "kid-1"
+    assert get_jwks_calls == 3
+
+
+async def test_that_get_jwks_is_cached_for_validity_window(monkeypatch: MonkeyPatch):
+    timestamp = [1_000_000]
+    monkeypatch.setattr(
+        "supertokens_python.recipe.jwt.recipe_implementation.get_timestamp_ms",
+        lambda: timestamp[0],
+    )
+
+    class QuerierMock:
+        calls = 0
+
+        async def send_get_request(self, *_: Any, **__: Any) -> Dict[str, Any]:
+            QuerierMock.calls += 1
+            return {
+                "keys": [
+                    {
+                        "kty": "RSA",
+                        "kid": "kid-1",
+                        "n": "n-value",
+                        "e": "AQAB",
+                        "alg": "RS256",
+                        "use": "sig",
+                    }
+                ],
+                "_headers": {"Cache-Control": "max-age=60, must-revalidate"},
+            }
+
+    recipe_implementation = JWTRecipeImplementation(
+        QuerierMock(), None, None  # type: ignore
+    )
+
+    first = await recipe_implementation.get_jwks({})
+    first.validity_in_secs = 1
+    timestamp[0] += 20_500
+    second = await recipe_implementation.get_jwks({})
+
+    assert QuerierMock.calls == 1
+    # Only the time left of the validity window is returned
+    assert second.validity_in_secs == 39
+    assert [key.kid for key in second.keys] == ["kid-1"]
+
+    timestamp[0] += 39_500
+    await recipe_implementation.get_jwks({})
+    assert QuerierMock.calls == 2
+
+
+def test_that_responses_without_raw_json_support_get_the_parsed_body():
+    # A response class of a framework integration written before set_raw_json_content
+    class CustomResponse(BaseResponse):
+        def __init__(self):
+            super().__init__({})
+
+        def set_cookie(self, *_: Any, **__: Any):
+            pass
+
+        def set_header(self, key: str, value: str) -> None:
+            pass
+
+        def get_header(self, key: str) -> Optional[str]:
+            return None
+
+        def remove_header(self, key: str) -> None:
+            pass
+
+        def set_status_code(self, status_code: int):
+            pass
+
+        def set_json_content(self, content: Dict[str, Any]):
+            self.content = content
+
+        def set_html_content(self, content: str):
+            pass
+
+    response = CustomResponse()
+    response.set_raw_json_content(b'{"keys":[]}')
+    assert response.content == {"keys": []}
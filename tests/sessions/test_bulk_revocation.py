@@ -0,0 +1,138 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from typing import Any, Dict, Iterator, List
+
+from pytest import MonkeyPatch, fixture, mark
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.session.asyncio import (
+    revoke_all_sessions_for_users,
+    revoke_sessions_in_batches,
+)
+from supertokens_python.recipe.session.syncio import (
+    revoke_all_sessions_for_users as sync_revoke_all_sessions_for_users,
+)
+from tests.utils import reset
+
+
+class CoreCalls:
+    def __init__(self):
+        self.calls: List[Any] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call(self, args: Any):
+        self.calls.append(args)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+
+@fixture
+def core(monkeypatch: MonkeyPatch) -> Iterator[CoreCalls]:
+    reset(stop_core=False)
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    core_calls = CoreCalls()
+
+    async def revoke_all_sessions_for_user(
+        user_id: str, tenant_id: str, revoke_across_all_tenants: bool, _: Any
+    ) -> List[str]:
+        await core_calls.call((user_id, tenant_id, revoke_across_all_tenants))
+        if user_id == "bad-user":
+            raise Exception("Core is down")
+        return [f"{user_id}-handle1", f"{user_id}-handle2"]
+
+    async def revoke_multiple_sessions(
+        session_handles: List[str], _: Dict[str, Any]
+    ) -> List[str]:
+        await core_calls.call(session_handles)
+        if "bad-handle" in session_handles:
+            raise Exception("Core is down")
+        return [h for h in session_handles if h != "unknown-handle"]
+
+    monkeypatch.setattr(
+        recipe_implementation,
+        "revoke_all_sessions_for_user",
+        revoke_all_sessions_for_user,
+    )
+    monkeypatch.setattr(
+        recipe_implementation, "revoke_multiple_sessions", revoke_multiple_sessions
+    )
+    yield core_calls
+    reset(stop_core=False)
+
+
+@mark.asyncio
+async def test_revoke_all_sessions_for_users(core: CoreCalls):
+    progress: List[int] = []
+    user_ids = (f"user{i}" if i != 3 else "bad-user" for i in range(20))
+
+    results = await revoke_all_sessions_for_users(
+        user_ids, concurrency=4, on_progress=progress.append
+    )
+
+    assert [r.user_id for r in results][:4] == ["user0", "user1", "user2", "bad-user"]
+    assert results[0].session_handles_revoked == ["user0-handle1", "user0-handle2"]
+    assert results[0].error is None
+    assert results[3].session_handles_revoked == []
+    assert str(results[3].error) == "Core is down"
+    assert progress == list(range(1, 21))
+    assert core.max_in_flight == 4
+    # Across all tenants, since no tenant id was given
+    assert core.calls[0] == ("user0", "public", True)
+
+
+@mark.asyncio
+async def test_revoke_all_sessions_for_users_of_a_tenant(core: CoreCalls):
+    await revoke_all_sessions_for_users(["user0"], tenant_id="tenant1")
+    assert core.calls == [("user0", "tenant1", False)]
+
+
+@mark.asyncio
+async def test_revoke_sessions_in_batches(core: CoreCalls):
+    handles = [f"handle{i}" for i in range(25)] + ["unknown-handle", "bad-handle"]
+    progress: List[int] = []
+
+    result = await revoke_sessions_in_batches(
+        iter(handles), batch_size=10, concurrency=2, on_progress=progress.append
+    )
+
+    assert [len(batch) for batch in core.calls] == [10, 10, 7]
+    assert core.max_in_flight == 2
+    assert sorted(result.session_handles_revoked) == sorted(handles[:20])
+    assert result.failed_session_handles == handles[20:]
+    assert sorted(progress) == [10, 20, 27]
+
+
+def test_syncio_revoke_all_sessions_for_users(core: CoreCalls):
+    results = sync_revoke_all_sessions_for_users(["user0", "user1"])
+    assert [r.session_handles_revoked for r in results] == [
+        ["user0-handle1", "user0-handle2"],
+        ["user1-handle1", "user1-handle2"],
+    ]
@@ -0,0 +1,56 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from typing import List, Tuple
+
+from starlette.requests import Request
+
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.recipe.session.cookie_and_header import (
+    has_multiple_cookies_for_token_type,
+)
+
+
+def get_request(headers: List[Tuple[bytes, bytes]]) -> FastApiRequest:
+    return FastApiRequest(Request({"type": "http", "headers": headers}))
+
+
+def test_cookie_header_is_parsed_once_per_request():
+    request = get_request(
+        [(b"cookie", b"sAccessToken=a; sAccessToken=b; sRefreshToken=c%3Dd; other")]
+    )
+    header_reads = 0
+    get_header = request.get_header
+
+    def counting_get_header(key: str):
+        nonlocal header_reads
+        header_reads += 1
+        return get_header(key)
+
+    request.get_header = counting_get_header
+
+    assert has_multiple_cookies_for_token_type(request, "access")
+    assert not has_multiple_cookies_for_token_type(request, "refresh")
+    assert request.get_cookies_allow_duplicates() == {
+        "sAccessToken": ["a", "b"],
+        "sRefreshToken": ["c=d"],
+    }
+    assert header_reads == 1
+
+
+def test_request_without_cookie_header_has_no_cookies():
+    request = get_request([])
+
+    assert request.get_cookies_allow_duplicates() == {}
+    assert not has_multiple_cookies_for_token_type(request, "access")
@@ -0,0 +1,241 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from pytest import MonkeyPatch, mark, raises
+
+from supertokens_python.recipe.session import session_functions
+from supertokens_python.recipe.session.exceptions import UnauthorisedError
+from supertokens_python.recipe.session.jwt import ParsedJWTInfo
+from supertokens_python.utils import TTLCache
+
+pytestmark = mark.asyncio
+
+
+class QuerierMock:
+    def __init__(self, response: Dict[str, Any]):
+        self.response = response
+        self.requests: List[Dict[str, Any]] = []
+
+    async def send_post_request(self, path: Any, data: Dict[str, Any], **__: Any):
+        if path.get_as_string_dangerous() == "/recipe/session/remove":
+            return {"sessionHandlesRevoked": data.get("sessionHandles", ["handle"])}
+        self.requests.append(data)
+        await asyncio.sleep(0.05)
+        return self.response
+
+
+def get_refresh_response(access_token: str) -> Dict[str, Any]:
+    return {
+        "status": "OK",
+        "session": {
+            "handle": "handle",
+            "userId": "userId",
+            "userDataInJWT": {},
+            "tenantId": "public",
+        },
+        "accessToken": {"token": access_token, "expiry": 0, "createdTime": 0},
+        "refreshToken": {"token": "new-refresh", "expiry": 0, "createdTime": 0},
+    }
+
+
+def get_recipe_implementation(
+    querier: QuerierMock, check_database_cache: Any = None, **config: Any
+) -> Any:
+    return SimpleNamespace(
+        querier=querier,
+        config=SimpleNamespace(
+            anti_csrf_function_or_string="NONE",
+            use_dynamic_access_token_signing_key=True,
+            **config,
+        ),
+        check_database_cache=check_database_cache,
+        check_database_cache_version=0,
+    )
+
+
+async def refresh(recipe_implementation: Any, refresh_token: str):
+    return await session_functions.refresh_session(
+        recipe_implementation, refresh_token, None, False, True, {}
+    )
+
+
+async def test_concurrent_refreshes_are_coalesced():
+    querier = QuerierMock(get_refresh_response("new-access"))
+    recipe_implementation = get_recipe_implementation(
+        querier, coalesce_refresh_requests=True
+    )
+
+    results = await asyncio.gather(
+        refresh(recipe_implementation, "refresh-1"),
+        refresh(recipe_implementation, "refresh-1"),
+        refresh(recipe_implementation, "refresh-2"),
+    )
+
+    assert len(querier.requests) == 2
+    assert results[0] is results[1]
+    assert results[0].accessToken.token == "new-access"
+    assert session_functions.in_flight_refreshes == {}
+
+    # once the call is done, a new refresh goes to the core again
+    await refresh(recipe_implementation, "refresh-1")
+    assert len(querier.requests) == 3
+
+
+async def test_concurrent_refreshes_are_not_coalesced_by_default():
+    querier = QuerierMock(get_refresh_response("new-access"))
+    recipe_implementation = get_recipe_implementation(
+        querier, coalesce_refresh_requests=False
+    )
+
+    await asyncio.gather(
+        refresh(recipe_implementation, "refresh-1"),
+        refresh(recipe_implementation, "refresh-1"),
+    )
+
+    assert len(querier.requests) == 2
+
+
+async def test_coalesced_refresh_errors_are_raised_for_all_callers():
+    querier = QuerierMock({"status": "UNAUTHORISED", "message": "invalid"})
+    recipe_implementation = get_recipe_implementation(
+        querier, coalesce_refresh_requests=True
+    )
+
+    results = await asyncio.gather(
+        refresh(recipe_implementation, "refresh-1"),
+        refresh(recipe_implementation, "refresh-1"),
+        return_exceptions=True,
+    )
+
+    assert len(querier.requests) == 1
+    assert all(isinstance(result, UnauthorisedError) for result in results)
+    with raises(UnauthorisedError):
+        await refresh(recipe_implementation, "refresh-1")
+
+
+async def test_check_database_verification_is_cached_till_revoked(
+    monkeypatch: MonkeyPatch,
+):
+    def get_info_from_access_token(*_: Any) -> Dict[str, Any]:
+        return {
+            "sessionHandle": "handle",
+            "userId": "userId",
+            "userData": {},
+            "expiryTime": 1,
+            "tenantId": "public",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+        }
+
+    monkeypatch.setattr(
+        session_functions, "get_info_from_access_token", get_info_from_access_token
+    )
+    querier = QuerierMock(
+        {
+            "status": "OK",
+            "session": {
+                "handle": "handle",
+                "userId": "userId",
+                "userDataInJWT": {},
+                "tenantId": "public",
+            },
+        }
+    )
+    recipe_implementation = get_recipe_implementation(
+        querier, check_database_cache=TTLCache(5000, 10)
+    )
+
+    async def get_session(token: str):
+        return await session_functions.get_session(
+            recipe_implementation,
+            ParsedJWTInfo(3, token, "payload", "header", {}, "signature", "d-kid"),
+            None,
+            False,
+            True,
+            {},
+        )
+
+    first = await get_session("token-1")
+    second = await get_session("token-1")
+    assert len(querier.requests) == 1
+    assert first.session.handle == second.session.handle == "handle"
+
+    # a different access token for the same session is verified with the core
+    await get_session("token-2")
+    assert len(querier.requests) == 2
+
+    await session_functions.revoke_session(recipe_implementation, "handle", {})
+    await get_session("token-2")
+    assert len(querier.requests) == 3
+
+    await session_functions.revoke_all_sessions_for_user(
+        recipe_implementation, "userId", None, True, {}
+    )
+    await get_session("token-2")
+    assert len(querier.requests) == 4
+
+
+async def test_check_database_verification_racing_a_revocation_is_not_cached(
+    monkeypatch: MonkeyPatch,
+):
+    def get_info_from_access_token(*_: Any) -> Dict[str, Any]:
+        return {
+            "sessionHandle": "handle",
+            "userId": "userId",
+            "userData": {},
+            "expiryTime": 1,
+            "tenantId": "public",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+        }
+
+    monkeypatch.setattr(
+        session_functions, "get_info_from_access_token", get_info_from_access_token
+    )
+    querier = QuerierMock(
+        {
+            "status": "OK",
+            "session": {
+                "handle": "handle",
+                "userId": "userId",
+                "userDataInJWT": {},
+                "tenantId": "public",
+            },
+        }
+    )
+    check_database_cache: Any = TTLCache(5000, 10)
+    recipe_implementation = get_recipe_implementation(
+        querier, check_database_cache=check_database_cache
+    )
+
+    # The session is revoked while the core is verifying it
+    verification = asyncio.ensure_future(
+        session_functions.get_session(
+            recipe_implementation,
+            ParsedJWTInfo(3, "token-1", "payload", "header", {}, "signature", "d-kid"),
+            None,
+            False,
+            True,
+            {},
+        )
+    )
+    await asyncio.sleep(0.01)
+    await session_functions.revoke_session(recipe_implementation, "handle", {})
+    await verification
+
+    assert check_database_cache.get("handle") is None
@@ -0,0 +1,140 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+import httpx
+import pytest
+from pytest import MonkeyPatch
+
+from supertokens_python.async_to_sync_wrapper import (
+    get_background_event_loop,
+    is_using_sync_http_client,
+    sync,
+)
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.supertokens import Host
+
+request_id: ContextVar[str] = ContextVar("request_id")
+
+
+async def get_running_loop_and_request_id():
+    return asyncio.get_running_loop(), request_id.get(None)
+
+
+def call_from_thread(thread_request_id: str):
+    request_id.set(thread_request_id)
+    return sync(get_running_loop_and_request_id())
+
+
+def test_sync_uses_one_background_event_loop_for_all_threads(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(call_from_thread, ["a", "b", "c", "d"]))
+
+    assert {loop for loop, _ in results} == {get_background_event_loop()}
+    # The context of the calling thread is visible to the coroutine
+    assert [rid for _, rid in results] == ["a", "b", "c", "d"]
+
+
+def test_sync_from_the_background_event_loop_raises(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+
+    async def call_sync_from_loop():
+        sync(get_running_loop_and_request_id())
+
+    with pytest.raises(Exception) as e:
+        sync(call_sync_from_loop())
+
+    assert "Cannot call a syncio function" in str(e.value)
+
+
+def test_sync_http_client_is_used_by_the_coroutine_but_not_its_tasks(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_SYNC_HTTP_CLIENT", "1")
+    monkeypatch.setattr(Querier, "api_version", "5.1")
+    monkeypatch.setattr(Querier, "_Querier__last_tried_index", 0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/recipe/session"
+        return httpx.Response(
+            200, json={"status": "OK", "handle": request.url.params["x"]}
+        )
+
+    monkeypatch.setattr(
+        Querier, "sync_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    async def send_request_and_start_task():
+        async def in_task():
+            return is_using_sync_http_client()
+
+        response = await querier.send_get_request(
+            NormalisedURLPath("/recipe/session"), {"x": "y"}, {}
+        )
+        return response, is_using_sync_http_client(), await asyncio.ensure_future(
+            in_task()
+        )
+
+    querier = Querier(
+        [Host(NormalisedURLDomain("http://core.example"), NormalisedURLPath(""))]
+    )
+    response, used_by_coroutine, used_by_task = sync(send_request_and_start_task())
+
+    assert response["status"] == "OK"
+    assert response["handle"] == "y"
+    assert used_by_coroutine
+    assert not used_by_task
+    assert not is_using_sync_http_client()
+
+
+def test_sync_http_client_runs_coroutines_waiting_on_the_event_loop(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_SYNC_HTTP_CLIENT", "1")
+
+    async def override_using_asyncio():
+        await asyncio.sleep(0.001)
+        async with asyncio.Lock():
+            return "done"
+
+    assert sync(override_using_asyncio()) == "done"
+
+
+def test_sync_client_is_created_once_for_all_threads(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(Querier, "sync_client", None)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: Querier.get_sync_client(), range(8)))
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_sync_http_client_cannot_be_used_with_the_background_event_loop(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_SYNC_HTTP_CLIENT", "1")
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+
+    with pytest.raises(Exception) as e:
+        sync(get_running_loop_and_request_id())
+
+    assert "cannot both be set" in str(e.value)
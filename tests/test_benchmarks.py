@@ -0,0 +1,29 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import sys
+from subprocess import run
+
+
+def test_hot_path_benchmarks_run():
+    # In a new interpreter, since the benchmarks call init and stub the Querier. The
+    # timings are compared with the baselines by `make benchmark`, not here, since they
+    # depend on the machine.
+    result = run(
+        [sys.executable, "-m", "tests.benchmarks.bench_hot_paths", "--quick"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
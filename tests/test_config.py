@@ -952,3 +952,36 @@ async def test_that_init_chooses_origin_over_website_domain():
         .get_as_string_dangerous()
         == "https://supertokens.io"
     )
+
+
+@mark.asyncio
+async def test_same_site_is_resolved_per_origin_when_using_origin_function():
+    def get_origin(_: Optional[BaseRequest], user_context: Dict[str, Any]) -> str:
+        return user_context.get("input", "https://app.example.com")
+
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="https://api.example.com",
+            origin=get_origin,
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    config = SessionRecipe.get_instance().config
+
+    for _ in range(2):
+        assert config.get_cookie_same_site(None, {}) == "lax"
+        assert config.get_cookie_same_site(None, {"input": "https://other.com"}) == (
+            "none"
+        )
+        assert config.get_cookie_same_site(None, {"input": "http://app.example.com"}) == (
+            "none"
+        )
+    assert callable(config.anti_csrf_function_or_string)
+    assert config.anti_csrf_function_or_string(None, {}) == "NONE"
+    assert (
+        config.anti_csrf_function_or_string(None, {"input": "https://other.com"})
+        == "VIA_CUSTOM_HEADER"
+    )
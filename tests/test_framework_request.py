@@ -0,0 +1,214 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from flask import Flask, Request
+from pytest import MonkeyPatch, mark, raises
+from starlette.requests import Request as StarletteRequest
+
+from supertokens_python.constants import DEFAULT_MAX_REQUEST_BODY_SIZE
+from supertokens_python.exceptions import RequestBodyTooLargeError
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.flask.flask_request import FlaskRequest
+from supertokens_python.json_codec import get_json_codec
+
+pytestmark = mark.asyncio
+
+
+def get_fastapi_request(chunks: List[bytes], headers: Dict[str, str]) -> Any:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    received: List[Dict[str, Any]] = []
+
+    async def receive():
+        message = messages[len(received)]
+        received.append(message)
+        return message
+
+    request = StarletteRequest(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [
+                (k.lower().encode(), v.encode()) for k, v in headers.items()
+            ],
+        },
+        receive=receive,
+    )
+    return FastApiRequest(request), received
+
+
+async def test_fastapi_json_body_is_parsed_once():
+    request, received = get_fastapi_request(
+        [b'{"formFields"', b": []}"], {"content-length": "18"}
+    )
+
+    body = await request.json()
+    assert body == {"formFields": []}
+    assert await request.json() is body
+    assert len(received) == 2
+    # the raw body is still readable from the starlette request
+    assert await request.request.body() == b'{"formFields": []}'
+
+
+async def test_fastapi_null_json_body_is_parsed_once(monkeypatch: MonkeyPatch):
+    request, _ = get_fastapi_request([b"null"], {})
+    loads = Mock(wraps=get_json_codec().loads)
+    monkeypatch.setattr(get_json_codec(), "loads", loads)
+
+    assert await request.json() is None
+    assert await request.json() is None
+    assert loads.call_count == 1
+
+
+async def test_fastapi_invalid_json_body_returns_empty_dict():
+    request, _ = get_fastapi_request([b"not json"], {})
+    assert await request.json() == {}
+
+
+async def test_fastapi_form_data_is_parsed_once():
+    request, _ = get_fastapi_request([b"code=abc&state=xyz"], {})
+
+    form = await request.form_data()
+    assert form == {"code": "abc", "state": "xyz"}
+    assert await request.form_data() is form
+
+
+async def test_fastapi_oversized_body_is_rejected_using_content_length():
+    request, received = get_fastapi_request(
+        [b"{}"], {"content-length": str(DEFAULT_MAX_REQUEST_BODY_SIZE + 1)}
+    )
+
+    with raises(RequestBodyTooLargeError):
+        await request.json()
+    assert len(received) == 0
+
+
+async def test_fastapi_oversized_body_is_rejected_while_streaming():
+    chunk = b" " * (DEFAULT_MAX_REQUEST_BODY_SIZE // 2 + 1)
+    request, received = get_fastapi_request([chunk, chunk, chunk], {})
+
+    with raises(RequestBodyTooLargeError):
+        await request.json()
+    assert len(received) == 2
+
+
+async def test_flask_json_body_is_parsed_once_and_size_checked():
+    app = Flask(__name__)
+
+    with app.test_request_context(
+        "/", method="POST", data=json.dumps({"a": 1}), content_type="application/json"
+    ):
+        from flask import request as flask_request
+
+        request = FlaskRequest(flask_request)
+        body = await request.json()
+        assert body == {"a": 1}
+        assert await request.json() is body
+
+    with app.test_request_context(
+        "/",
+        method="POST",
+        data=b" " * (DEFAULT_MAX_REQUEST_BODY_SIZE + 1),
+        content_type="application/json",
+    ):
+        from flask import request as flask_request
+
+        with raises(RequestBodyTooLargeError):
+            await FlaskRequest(flask_request).json()
+
+
+class CountingStream(BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+async def test_flask_oversized_chunked_body_is_rejected_without_reading_it_all():
+    stream = CountingStream(b" " * (DEFAULT_MAX_REQUEST_BODY_SIZE * 3))
+    request = Request(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "application/json",
+            "wsgi.input": stream,
+            "wsgi.input_terminated": True,
+        }
+    )
+
+    with raises(RequestBodyTooLargeError):
+        await FlaskRequest(request).json()
+    assert stream.bytes_read <= DEFAULT_MAX_REQUEST_BODY_SIZE + 1
+
+
+async def test_flask_chunked_form_data_is_parsed():
+    request = Request(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "application/x-www-form-urlencoded",
+            "wsgi.input": BytesIO(b"code=abc&state=xyz"),
+            "wsgi.input_terminated": True,
+        }
+    )
+
+    form = await FlaskRequest(request).form_data()
+    assert form == {"code": "abc", "state": "xyz"}
+
+
+MULTIPART_BODY = (
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="code"\r\n\r\n'
+    b"abc\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+    b"Content-Type: application/octet-stream\r\n\r\n"
+    b"\xff\xfe\x00\x01\r\n"
+    b"--boundary--\r\n"
+)
+
+
+async def test_flask_multipart_form_data_is_parsed():
+    app = Flask(__name__)
+    with app.test_request_context(
+        "/",
+        method="POST",
+        data=MULTIPART_BODY,
+        content_type="multipart/form-data; boundary=boundary",
+    ):
+        from flask import request as flask_request
+
+        request = FlaskRequest(flask_request)
+        assert await request.form_data() == {"code": "abc"}
+        # The body is still available to the app
+        assert flask_request.get_data() == MULTIPART_BODY
+
+    request = Request(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "multipart/form-data; boundary=boundary",
+            "wsgi.input": BytesIO(MULTIPART_BODY),
+            "wsgi.input_terminated": True,
+        }
+    )
+    assert await FlaskRequest(request).form_data() == {"code": "abc"}
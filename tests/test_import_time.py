@@ -0,0 +1,128 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Import time (cold start) budget of the SDK. Run `python -m tests.test_import_time` to print
+the current import time of the SDK.
+"""
+
+import re
+import sys
+from os import environ
+from subprocess import run
+from typing import List
+
+IMPORT_ALL_RECIPES = """
+import supertokens_python
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    jwt,
+    multitenancy,
+    openid,
+    passwordless,
+    session,
+    thirdparty,
+    usermetadata,
+    userroles,
+)
+"""
+
+# Modules which are only needed by some apps, or only once a specific feature is used, and
+# so must not be imported by `IMPORT_ALL_RECIPES`
+LAZILY_IMPORTED_MODULES = [
+    "aiosmtplib",
+    "django",
+    "fastapi",
+    "flask",
+    "phonenumbers",
+    "requests",
+    "starlette",
+    "tldextract",
+    "twilio",
+    "supertokens_python.framework.django",
+    "supertokens_python.framework.fastapi",
+    "supertokens_python.framework.flask",
+    "supertokens_python.recipe.emailpassword.emaildelivery.services.smtp.password_reset_email",
+    "supertokens_python.recipe.emailverification.emaildelivery.services.smtp.email_verify_email",
+    "supertokens_python.recipe.passwordless.emaildelivery.services.smtp.pless_login_email",
+    "supertokens_python.recipe.thirdparty.providers.google",
+]
+
+# Generous enough to not be flaky on slow machines, while still catching an eagerly
+# imported heavy dependency. Can be overridden using SUPERTOKENS_IMPORT_TIME_BUDGET_MS.
+DEFAULT_IMPORT_TIME_BUDGET_MS = 1000
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+
+def get_import_time_ms(code: str) -> float:
+    """
+    Runs `code` in a new interpreter with `-X importtime` and returns the total (cumulative)
+    time taken by the top level imports done by it, excluding the interpreter's startup.
+    """
+    result = run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    startup_done = False
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_us, name = match.groups()
+        if startup_done:
+            total_us += int(cumulative_us)
+        elif name == "site":
+            startup_done = True
+
+    return total_us / 1000
+
+
+def get_imported_modules(code: str) -> List[str]:
+    result = run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
+
+
+def test_optional_dependencies_are_not_imported_eagerly():
+    imported_modules = get_imported_modules(IMPORT_ALL_RECIPES)
+
+    assert [m for m in LAZILY_IMPORTED_MODULES if m in imported_modules] == []
+
+
+def test_import_time_is_within_budget():
+    budget_ms = float(
+        environ.get(
+            "SUPERTOKENS_IMPORT_TIME_BUDGET_MS", str(DEFAULT_IMPORT_TIME_BUDGET_MS)
+        )
+    )
+
+    # The best of a few runs, to reduce noise from the machine
+    import_time_ms = min(get_import_time_ms(IMPORT_ALL_RECIPES) for _ in range(3))
+
+    assert import_time_ms <= budget_ms
+
+
+if __name__ == "__main__":
+    times = sorted(get_import_time_ms(IMPORT_ALL_RECIPES) for _ in range(5))
+    print(f"Import time of all recipes: best {times[0]:.1f}ms, median {times[2]:.1f}ms")
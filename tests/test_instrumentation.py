@@ -0,0 +1,184 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pytest import MonkeyPatch, fixture, mark
+
+from supertokens_python import instrumentation
+from supertokens_python import querier as querier_module
+from supertokens_python.ingredients.emaildelivery import EmailDeliveryIngredient
+from supertokens_python.ingredients.emaildelivery.types import (
+    EmailDeliveryConfigWithService,
+    EmailDeliveryInterface,
+)
+from supertokens_python.instrumentation import (
+    NOOP_SPAN,
+    InstrumentationListener,
+    Span,
+    add_listener,
+    remove_listener,
+    start_span,
+)
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.supertokens import Host
+
+pytestmark = mark.asyncio
+
+
+class RecordingListener(InstrumentationListener):
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def on_span_end(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def on_event(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.events.append((name, attributes))
+
+
+@fixture
+def listener() -> Iterator[RecordingListener]:
+    recording_listener = RecordingListener()
+    add_listener(recording_listener)
+    yield recording_listener
+    remove_listener(recording_listener)
+
+
+@fixture
+def querier(monkeypatch: MonkeyPatch) -> Iterator[Tuple[Querier, List[int]]]:
+    status_codes: List[int] = []
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        status_code = status_codes.pop(0) if status_codes else 200
+        return httpx.Response(status_code, json={"status": "OK"})
+
+    def create_client(**kwargs: Any) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(querier_module, "AsyncClient", create_client)
+    monkeypatch.setattr(Querier, "api_version", "5.1")
+    monkeypatch.setattr(Querier, "_Querier__last_tried_index", 0)
+    q = Querier(
+        [Host(NormalisedURLDomain("http://core.example"), NormalisedURLPath(""))]
+    )
+    yield q, status_codes
+
+
+def test_start_span_without_listeners_returns_noop_span():
+    assert start_span("core_request", {}) is NOOP_SPAN
+
+
+async def test_core_requests_and_core_call_cache_are_reported(
+    listener: RecordingListener, querier: Tuple[Querier, List[int]]
+):
+    q, status_codes = querier
+    status_codes.append(429)
+    user_context: Dict[str, Any] = {}
+
+    for _ in range(2):
+        await q.send_get_request(NormalisedURLPath("/recipe/session"), {}, user_context)
+
+    assert [(s.name, s.attributes) for s in listener.spans] == [
+        (
+            "core_request",
+            {
+                "method": "GET",
+                "url": "http://core.example/recipe/session",
+                "status_code": status_code,
+            },
+        )
+        for status_code in (429, 200)
+    ]
+    assert all(s.duration_ms is not None for s in listener.spans)
+    assert [name for name, _ in listener.events] == [
+        "cache",
+        "core_request_rate_limited",
+        "cache",
+        "cache",
+    ]
+    assert [a["hit"] for name, a in listener.events if name == "cache"] == [
+        False,
+        False,
+        True,
+    ]
+
+
+async def test_email_delivery_is_reported_and_listener_errors_are_ignored(
+    listener: RecordingListener,
+):
+    class FailingListener(InstrumentationListener):
+        def on_span_start(self, span: Span) -> None:
+            raise Exception("listener error")
+
+    class Service(EmailDeliveryInterface[str]):
+        def __init__(self):
+            self.sent: List[str] = []
+
+        async def send_email(self, template_vars: str, user_context: Dict[str, Any]):
+            self.sent.append(template_vars)
+
+    service = Service()
+    ingredient = EmailDeliveryIngredient(EmailDeliveryConfigWithService(service))
+
+    failing_listener = FailingListener()
+    add_listener(failing_listener)
+    try:
+        await ingredient.ingredient_interface_impl.send_email("hello", {})
+    finally:
+        remove_listener(failing_listener)
+
+    assert service.sent == ["hello"]
+    assert [(s.name, s.attributes, s.error) for s in listener.spans] == [
+        ("email_delivery", {"template": "str"}, None)
+    ]
+
+
+def test_opentelemetry_listener_reports_spans_and_events():
+    pytest.importorskip("opentelemetry")
+    from supertokens_python.instrumentation.opentelemetry import (
+        OpenTelemetryListener,
+    )
+
+    tracer_provider = MagicMock()
+    meter_provider = MagicMock()
+    otel_listener = OpenTelemetryListener(tracer_provider, meter_provider)
+    tracer = tracer_provider.get_tracer.return_value
+    meter = meter_provider.get_meter.return_value
+
+    add_listener(otel_listener)
+    try:
+        with pytest.raises(ValueError):
+            with start_span("claim_fetch", {"claim": "st-ev"}):
+                raise ValueError("fetch failed")
+        instrumentation.record_event("cache", {"cache": "jwks", "hit": True})
+    finally:
+        remove_listener(otel_listener)
+
+    tracer.start_span.assert_called_once_with(
+        "supertokens.claim_fetch", attributes={"supertokens.claim": "st-ev"}
+    )
+    otel_span = tracer.start_span.return_value
+    otel_span.record_exception.assert_called_once()
+    otel_span.end.assert_called_once()
+    meter.create_histogram.return_value.record.assert_called_once()
+    meter.create_counter.assert_called_once_with("supertokens.cache")
+    meter.create_counter.return_value.add.assert_called_once_with(
+        1, {"supertokens.cache": "jwks", "supertokens.hit": True}
+    )
@@ -0,0 +1,182 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python import asyncio as st_asyncio
+from supertokens_python import syncio as st_syncio
+from supertokens_python.recipe import session
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.types import User, UsersResponse
+
+USER_COUNT = 25
+
+
+class FakeUsers:
+    """
+    Serves pages of USER_COUNT users, recording the order in which pages are requested
+    and consumed.
+    """
+
+    def __init__(self):
+        self.events: List[str] = []
+        self.requests: List[Tuple[Any, ...]] = []
+        self.contexts: List[Optional[Dict[str, Any]]] = []
+        self.lock = threading.Lock()
+
+    def get_page(
+        self, time_joined_order: str, limit: int, pagination_token: Optional[str]
+    ) -> UsersResponse:
+        start = int(pagination_token or 0)
+        end = min(start + limit, USER_COUNT)
+        with self.lock:
+            self.events.append(f"fetched {start}")
+        ids = list(range(USER_COUNT))
+        if time_joined_order == "DESC":
+            ids.reverse()
+        users = [
+            User("emailpassword", f"user{i}", i, None, None, None, ["public"])
+            for i in ids[start:end]
+        ]
+        return UsersResponse(users, str(end) if end < USER_COUNT else None)
+
+    def consumed(self, user: User):
+        with self.lock:
+            self.events.append(f"consumed {user.user_id}")
+
+
+@fixture
+def fake_users(monkeypatch: MonkeyPatch) -> Iterator[FakeUsers]:
+    Supertokens.reset()
+    SessionRecipe.reset()
+    MultitenancyRecipe.reset()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init()],
+    )
+    users = FakeUsers()
+
+    async def get_users(
+        _: Supertokens,
+        tenant_id: str,
+        time_joined_order: str,
+        limit: int,
+        pagination_token: Optional[str],
+        include_recipe_ids: Optional[List[str]],
+        query: Optional[Dict[str, str]],
+        user_context: Optional[Dict[str, Any]],
+    ) -> UsersResponse:
+        users.requests.append((tenant_id, include_recipe_ids, query))
+        users.contexts.append(user_context)
+        await asyncio.sleep(0.01)
+        return users.get_page(time_joined_order, limit, pagination_token)
+
+    monkeypatch.setattr(Supertokens, "get_users", get_users)
+    yield users
+    Supertokens.reset()
+    SessionRecipe.reset()
+    MultitenancyRecipe.reset()
+
+
+@mark.asyncio
+async def test_iterate_users_yields_all_pages(fake_users: FakeUsers):
+    user_ids: List[str] = []
+    async for user in st_asyncio.iterate_users(
+        "public", "DESC", page_size=10, include_recipe_ids=["emailpassword"]
+    ):
+        user_ids.append(user.user_id)
+
+    assert user_ids == [f"user{i}" for i in reversed(range(USER_COUNT))]
+    assert fake_users.requests == [("public", ["emailpassword"], None)] * 3
+
+
+@mark.asyncio
+async def test_iterate_users_prefetches_the_next_page(fake_users: FakeUsers):
+    async for user in st_asyncio.iterate_users("public", page_size=10):
+        fake_users.consumed(user)
+        await asyncio.sleep(0.002)
+
+    # The second page is fetched while the first one is being consumed
+    assert fake_users.events.index("fetched 10") < fake_users.events.index(
+        "consumed user9"
+    )
+    assert fake_users.events.count("fetched 10") == 1
+
+
+@mark.asyncio
+async def test_iterate_users_can_be_stopped_early(fake_users: FakeUsers):
+    users = st_asyncio.iterate_users("public", page_size=10)
+    async for user in users:
+        if user.user_id == "user0":
+            break
+    await users.aclose()  # type: ignore
+
+    await asyncio.sleep(0.05)
+    assert "fetched 20" not in fake_users.events
+
+
+@mark.asyncio
+async def test_iterate_users_validates_page_size(fake_users: FakeUsers):
+    with raises(ValueError):
+        async for _ in st_asyncio.iterate_users("public", page_size=0):
+            pass
+
+
+def test_syncio_iterate_users_yields_all_pages(fake_users: FakeUsers):
+    user_context: Dict[str, Any] = {"key": "value"}
+    user_ids = [
+        user.user_id
+        for user in st_syncio.iterate_users(
+            "public", page_size=10, user_context=user_context
+        )
+    ]
+
+    assert user_ids == [f"user{i}" for i in range(USER_COUNT)]
+    assert fake_users.contexts == [user_context] * 3
+    # Each page is fetched with its own copy of the user context
+    assert all(context is not user_context for context in fake_users.contexts)
+
+
+def test_syncio_iterate_users_can_be_stopped_early(fake_users: FakeUsers):
+    users = st_syncio.iterate_users("public", page_size=10)
+    next(users)
+    users.close()
+
+    # The prefetch of the second page was cancelled before it finished
+    assert fake_users.events == ["fetched 0"]
+    assert len(fake_users.requests) == 2
+
+
+def test_syncio_iterate_users_does_not_start_threads(fake_users: FakeUsers):
+    thread_count = threading.active_count()
+
+    for _ in range(3):
+        users = st_syncio.iterate_users("public", page_size=10)
+        next(users)
+        users.close()
+    assert len(list(st_syncio.iterate_users("public", page_size=10))) == USER_COUNT
+
+    # Not even the background event loop, which is only used if it is enabled
+    assert threading.active_count() == thread_count
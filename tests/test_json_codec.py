@@ -0,0 +1,111 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+from base64 import b64decode
+from typing import Any, Dict, Iterator, List
+
+from pytest import fixture, importorskip, mark, raises
+
+from supertokens_python import json_codec
+from supertokens_python.json_codec import (
+    JSONCodec,
+    OrjsonJSONCodec,
+    StdlibJSONCodec,
+    get_json_codec,
+    set_json_codec,
+)
+from supertokens_python.recipe.session.cookie_and_header import build_front_token
+
+PAYLOAD: Dict[str, Any] = {
+    "sub": "user1",
+    "b": [1, 2.5, None, True, {"z": "é", "a": "😀"}],
+    "a": {"2": 3, "1": "x"},
+}
+
+
+def get_codecs() -> List[JSONCodec]:
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonJSONCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+@fixture
+def restore_codec() -> Iterator[None]:
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+@mark.parametrize("codec", get_codecs(), ids=lambda c: type(c).__name__)
+def test_codecs_match_the_standard_library(codec: JSONCodec):
+    for sort_keys in [False, True]:
+        expected = json.dumps(
+            PAYLOAD, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+        )
+        assert codec.dumps(PAYLOAD, sort_keys) == expected.encode("utf-8")
+
+    assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+    assert codec.loads(codec.dumps(PAYLOAD).decode("utf-8")) == PAYLOAD
+    with raises(ValueError):
+        codec.loads(b"<html>Bad gateway</html>")
+
+
+@mark.parametrize("codec", get_codecs(), ids=lambda c: type(c).__name__)
+def test_codecs_reject_non_finite_floats(codec: JSONCodec):
+    for value in [float("nan"), float("inf"), float("-inf")]:
+        with raises(ValueError):
+            codec.dumps({"a": [None, {"b": value}]})
+    assert codec.dumps({"a": [None, 1.5]}) == b'{"a":[null,1.5]}'
+
+
+def test_orjson_codec_falls_back_for_unsupported_values():
+    importorskip("orjson")
+    codec = OrjsonJSONCodec()
+    assert (
+        codec.dumps({"n": 2**70, 1: "int key"})
+        == b'{"n":1180591620717411303424,"1":"int key"}'
+    )
+
+
+def test_orjson_is_the_default_if_installed():
+    importorskip("orjson")
+    assert isinstance(json_codec.get_default_json_codec(), OrjsonJSONCodec)
+
+
+def test_front_token_is_ascii(restore_codec: None):
+    for codec in get_codecs():
+        set_json_codec(codec)
+        front_token = build_front_token("user1", 1000, {"name": "Jöhn"})
+        assert json.loads(b64decode(front_token)) == {
+            "uid": "user1",
+            "ate": 1000,
+            "up": {"name": "Jöhn"},
+        }
+        assert b64decode(front_token).decode("ascii").count("\\u00f6") == 1
+
+
+def test_custom_codec_can_be_set(restore_codec: None):
+    calls: List[Any] = []
+
+    class RecordingCodec(StdlibJSONCodec):
+        def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+            calls.append(obj)
+            return super().dumps(obj, sort_keys)
+
+    set_json_codec(RecordingCodec())
+    build_front_token("user1", 1000, {})
+    assert calls == [{"uid": "user1", "ate": 1000, "up": {}}]
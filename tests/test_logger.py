@@ -16,6 +16,7 @@ from supertokens_python.logger import (
     streamFormatter,
     NAMESPACE,
     enable_debug_logging,
+    is_debug_enabled,
 )
 from supertokens_python.recipe import session
 
@@ -55,7 +56,7 @@ class LoggerTests(TestCase):
             "t": "2000-01-01T00:00Z",
             "sdkVer": VERSION,
             "message": "API replied with status 200",
-            "file": "../tests/test_logger.py:49",
+            "file": "../tests/test_logger.py:50",
         }
 
     @staticmethod
@@ -150,3 +151,13 @@ class LoggerTests(TestCase):
         del os.environ["SUPERTOKENS_DEBUG"]
 
         assert logMsg in self._caplog.text
+
+    @staticmethod
+    def test_7_is_debug_enabled_follows_the_log_level():
+        assert not is_debug_enabled()
+
+        enable_debug_logging()
+        assert is_debug_enabled()
+
+        logging.getLogger(NAMESPACE).setLevel(logging.ERROR)
+        assert not is_debug_enabled()
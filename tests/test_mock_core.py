@@ -0,0 +1,121 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Iterator
+
+import httpx
+from jwt import PyJWK
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python import querier as querier_module
+from supertokens_python.recipe import session, usermetadata, userroles
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.session import SessionRecipe, jwks
+from supertokens_python.recipe.session.asyncio import (
+    create_new_session_without_request_response,
+    get_session_without_request_response,
+    refresh_session_without_request_response,
+)
+from supertokens_python.recipe.session.exceptions import UnauthorisedError
+from supertokens_python.recipe.usermetadata import UserMetadataRecipe
+from supertokens_python.recipe.usermetadata.asyncio import (
+    get_user_metadata,
+    update_user_metadata,
+)
+from supertokens_python.recipe.userroles import UserRolesRecipe
+from supertokens_python.recipe.userroles.asyncio import (
+    add_role_to_user,
+    create_new_role_or_add_permissions,
+)
+from tests.benchmarks.mock_core import MockCore
+
+pytestmark = mark.asyncio
+
+
+def reset_recipes():
+    Supertokens.reset()
+    SessionRecipe.reset()
+    UserMetadataRecipe.reset()
+    UserRolesRecipe.reset()
+    MultitenancyRecipe.reset()
+    jwks.reset_jwks_cache()
+
+
+@fixture
+def mock_core(monkeypatch: MonkeyPatch) -> Iterator[MockCore]:
+    core = MockCore()
+
+    def create_client(**kwargs: Any) -> httpx.AsyncClient:
+        transport = httpx.ASGITransport(app=core)  # type: ignore
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    monkeypatch.setattr(querier_module, "AsyncClient", create_client)
+    reset_recipes()
+    init(
+        supertokens_config=SupertokensConfig("http://mock-core"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(), usermetadata.init(), userroles.init()],
+    )
+    # The JWKS is fetched using requests, which can't be routed to the ASGI app
+    jwks.cached_keys = jwks.CachedKeys([PyJWK(k) for k in core.jwks["keys"]], 60)
+
+    yield core
+
+    reset_recipes()
+
+
+async def test_sessions_can_be_created_verified_and_refreshed(mock_core: MockCore):
+    await create_new_role_or_add_permissions("admin", ["write"])
+    await add_role_to_user("public", "user1", "admin")
+    await update_user_metadata("user1", {"name": "John"})
+
+    created = await create_new_session_without_request_response("public", "user1")
+    assert created.get_access_token_payload()["st-role"]["v"] == ["admin"]
+    assert created.get_access_token_payload()["st-perm"]["v"] == ["write"]
+
+    verified = await get_session_without_request_response(
+        created.get_access_token(), check_database=True
+    )
+    assert verified is not None
+    assert verified.get_handle() == created.get_handle()
+
+    tokens = created.get_all_session_tokens_dangerously()
+    refreshed = await refresh_session_without_request_response(
+        tokens["refreshToken"], disable_anti_csrf=True
+    )
+    assert refreshed.get_handle() == created.get_handle()
+    assert (await get_user_metadata("user1")).metadata == {"name": "John"}
+
+    await refreshed.revoke_session()
+    with raises(UnauthorisedError):
+        await get_session_without_request_response(
+            refreshed.get_access_token(), check_database=True
+        )
+
+    assert mock_core.request_counts["POST /recipe/session/verify"] == 2
+
+
+async def test_errors_can_be_injected(mock_core: MockCore):
+    mock_core.config.error_rate = 1
+    mock_core.config.error_status = 500
+
+    with raises(Exception) as e:
+        await get_user_metadata("user1")
+
+    assert "500" in str(e.value)
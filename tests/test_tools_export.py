@@ -0,0 +1,279 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import csv
+import json
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import Supertokens
+from supertokens_python.interfaces import (
+    GetUserIdMappingOkResult,
+    UnknownMappingError,
+)
+from supertokens_python.recipe.usermetadata.interfaces import MetadataResult
+from supertokens_python.recipe.userroles.interfaces import GetRolesForUserOkResult
+from supertokens_python.tools import __main__ as tools_main
+from supertokens_python.tools import export
+from supertokens_python.types import ThirdPartyInfo, User, UsersResponse
+from tests.utils import reset
+
+USER_COUNT = 25
+
+
+class FakeCore:
+    def __init__(self):
+        self.pages_fetched = 0
+        self.fail_on_page: Optional[int] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def lookup(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+    def get_user(self, i: int) -> User:
+        if i % 2 == 0:
+            return User(
+                "emailpassword",
+                f"user{i}",
+                i,
+                f"user{i}@example.com",
+                None,
+                None,
+                ["public"],
+            )
+        return User(
+            "thirdparty",
+            f"user{i}",
+            i,
+            f"user{i}@example.com",
+            None,
+            ThirdPartyInfo(f"google-{i}", "google"),
+            ["public"],
+        )
+
+
+@fixture
+def fake_core(monkeypatch: MonkeyPatch) -> Iterator[FakeCore]:
+    core = FakeCore()
+
+    async def get_users(
+        _: Supertokens,
+        tenant_id: str,
+        time_joined_order: str,
+        limit: int,
+        pagination_token: Optional[str],
+        *__: Any,
+    ) -> UsersResponse:
+        start = int(pagination_token or 0)
+        if core.fail_on_page == start // limit:
+            raise Exception("Core is down")
+        core.pages_fetched += 1
+        end = min(start + limit, USER_COUNT)
+        users = [core.get_user(i) for i in range(start, end)]
+        return UsersResponse(users, str(end) if end < USER_COUNT else None)
+
+    async def get_user_metadata(user_id: str, _: Dict[str, Any]) -> MetadataResult:
+        await core.lookup()
+        return MetadataResult({"name": user_id.upper()})
+
+    async def get_roles_for_user(
+        _: str, user_id: str, __: Dict[str, Any]
+    ) -> GetRolesForUserOkResult:
+        await core.lookup()
+        return GetRolesForUserOkResult(["admin"] if user_id == "user0" else [])
+
+    async def get_user_id_mapping(
+        _: Supertokens, user_id: str, *__: Any
+    ) -> Union[GetUserIdMappingOkResult, UnknownMappingError]:
+        await core.lookup()
+        if user_id == "user1":
+            return GetUserIdMappingOkResult(user_id, "external-1")
+        return UnknownMappingError()
+
+    monkeypatch.setattr(Supertokens, "get_users", get_users)
+    monkeypatch.setattr(Supertokens, "get_user_id_mapping", get_user_id_mapping)
+    monkeypatch.setattr(export, "get_user_metadata", get_user_metadata)
+    monkeypatch.setattr(export, "get_roles_for_user", get_roles_for_user)
+    reset(stop_core=False)
+    tools_main.init_supertokens(
+        Namespace(connection_uri="http://localhost:3567", api_key=None)
+    )
+    yield core
+    reset(stop_core=False)
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@mark.asyncio
+async def test_export_to_jsonl(fake_core: FakeCore, tmp_path: Path):
+    output = tmp_path / "users.jsonl"
+    progress: List[int] = []
+
+    result = await export.export_users(
+        str(output),
+        page_size=10,
+        include_user_id_mapping=True,
+        concurrency=4,
+        on_progress=progress.append,
+    )
+
+    assert (result.exported_users, result.completed) == (USER_COUNT, True)
+    assert progress == [10, 20, 25]
+    assert fake_core.max_in_flight == 4
+    rows = read_jsonl(output)
+    assert [r["user"]["id"] for r in rows] == [f"user{i}" for i in range(USER_COUNT)]
+    assert rows[0] == {
+        "recipeId": "emailpassword",
+        "user": {
+            "id": "user0",
+            "timeJoined": 0,
+            "tenantIds": ["public"],
+            "email": "user0@example.com",
+        },
+        "metadata": {"name": "USER0"},
+        "roles": ["admin"],
+        "externalUserId": None,
+    }
+    assert rows[1]["user"]["thirdParty"] == {"user_id": "google-1", "id": "google"}
+    assert rows[1]["externalUserId"] == "external-1"
+
+
+@mark.asyncio
+async def test_export_to_csv(fake_core: FakeCore, tmp_path: Path):
+    output = tmp_path / "users.csv"
+
+    await export.export_users(str(output), output_format="csv", include_roles=False)
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == USER_COUNT
+    assert rows[1] == {
+        "id": "user1",
+        "recipeId": "thirdparty",
+        "timeJoined": "1",
+        "email": "user1@example.com",
+        "phoneNumber": "",
+        "thirdPartyId": "google",
+        "thirdPartyUserId": "google-1",
+        "tenantIds": '["public"]',
+        "metadata": '{"name": "USER1"}',
+    }
+
+
+@mark.asyncio
+async def test_export_is_resumed_from_the_checkpoint(
+    fake_core: FakeCore, tmp_path: Path
+):
+    output = tmp_path / "users.csv"
+    checkpoint = tmp_path / "checkpoint.json"
+
+    fake_core.fail_on_page = 2
+    with raises(Exception, match="Core is down"):
+        await export.export_users(
+            str(output),
+            output_format="csv",
+            page_size=10,
+            checkpoint_path=str(checkpoint),
+        )
+    # Simulates a row written after the checkpoint was saved
+    with open(output, "a") as f:
+        f.write("partial,row\n")
+
+    fake_core.fail_on_page = None
+    fake_core.pages_fetched = 0
+    result = await export.export_users(
+        str(output),
+        output_format="csv",
+        page_size=10,
+        checkpoint_path=str(checkpoint),
+    )
+
+    assert (result.exported_users, result.completed) == (USER_COUNT, True)
+    assert fake_core.pages_fetched == 1
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["id"] for r in rows] == [f"user{i}" for i in range(USER_COUNT)]
+
+    # Running it again after it's completed doesn't export anything
+    result = await export.export_users(
+        str(output), page_size=10, checkpoint_path=str(checkpoint)
+    )
+    assert (result.exported_users, result.completed) == (USER_COUNT, True)
+    assert fake_core.pages_fetched == 1
+
+
+@mark.asyncio
+async def test_export_starts_over_if_the_output_was_removed(
+    fake_core: FakeCore, tmp_path: Path
+):
+    output = tmp_path / "users.jsonl"
+    checkpoint = tmp_path / "checkpoint.json"
+    await export.export_users(
+        str(output), page_size=10, max_pages=1, checkpoint_path=str(checkpoint)
+    )
+
+    output.unlink()
+    fake_core.pages_fetched = 0
+    result = await export.export_users(
+        str(output), page_size=10, checkpoint_path=str(checkpoint)
+    )
+
+    assert (result.exported_users, result.completed) == (USER_COUNT, True)
+    assert fake_core.pages_fetched == 3
+    rows = read_jsonl(output)
+    assert [r["user"]["id"] for r in rows] == [f"user{i}" for i in range(USER_COUNT)]
+
+
+@mark.asyncio
+async def test_export_can_be_limited_to_some_pages(fake_core: FakeCore, tmp_path: Path):
+    output = tmp_path / "users.jsonl"
+    checkpoint = tmp_path / "checkpoint.json"
+
+    result = await export.export_users(
+        str(output), page_size=10, max_pages=1, checkpoint_path=str(checkpoint)
+    )
+    assert (result.exported_users, result.completed) == (10, False)
+    assert fake_core.pages_fetched == 1
+
+    result = await export.export_users(
+        str(output), page_size=10, checkpoint_path=str(checkpoint)
+    )
+    assert (result.exported_users, result.completed) == (USER_COUNT, True)
+    assert len(read_jsonl(output)) == USER_COUNT
+
+
+def test_export_command(
+    fake_core: FakeCore, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    output = tmp_path / "users.csv"
+    # The command initialises the SDK itself
+    reset(stop_core=False)
+    monkeypatch.setenv("SUPERTOKENS_CONNECTION_URI", "http://localhost:3567")
+
+    tools_main.main(["export", "--output", str(output), "--no-metadata"])
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == USER_COUNT
+    assert "metadata" not in rows[0]
+    assert rows[0]["roles"] == '["admin"]'
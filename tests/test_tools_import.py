@@ -0,0 +1,343 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+import time
+from argparse import Namespace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import Supertokens
+from supertokens_python.interfaces import (
+    CreateUserIdMappingOkResult,
+    UserIdMappingAlreadyExistsError,
+)
+from supertokens_python.recipe.emailpassword.interfaces import (
+    SignUpEmailAlreadyExistsError,
+)
+from supertokens_python.recipe.userroles.interfaces import (
+    AddRoleToUserOkResult,
+    UnknownRoleError,
+)
+from supertokens_python.tools import __main__ as tools_main
+from supertokens_python.tools import import_users
+from tests.utils import reset
+
+pytestmark = mark.asyncio
+
+
+class FakeCore:
+    def __init__(self):
+        self.users_by_email: Dict[str, str] = {}
+        self.mappings: Dict[str, str] = {}
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.roles: Set[str] = {"admin"}
+        self.user_roles: Dict[str, List[str]] = {}
+        self.calls: Dict[str, int] = {}
+        # The number of times the next calls fail with a 503
+        self.failures_left = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            raise Exception(
+                "SuperTokens core threw an error for a POST request to path: "
+                f"'/{name}' with status code: 503 and message: unavailable"
+            )
+
+    def create_user(self, email: str) -> SimpleNamespace:
+        user_id = self.users_by_email.setdefault(
+            email, f"st-{len(self.users_by_email)}"
+        )
+        # Like the core, the external user id is returned if there is a mapping
+        return SimpleNamespace(user_id=self.mappings.get(user_id, user_id))
+
+
+@fixture
+def fake_core(monkeypatch: MonkeyPatch) -> Iterator[FakeCore]:
+    core = FakeCore()
+
+    async def sign_up(_: str, email: str, __: str, ___: Dict[str, Any]):
+        await core.call("sign_up")
+        if email in core.users_by_email:
+            return SignUpEmailAlreadyExistsError()
+        return SimpleNamespace(user=core.create_user(email))
+
+    async def get_user_by_email(_: str, email: str, __: Dict[str, Any]):
+        await core.call("get_user_by_email")
+        return core.create_user(email)
+
+    async def manually_create_or_update_user(
+        _: str, __: str, ___: str, email: str, ____: Dict[str, Any]
+    ):
+        await core.call("manually_create_or_update_user")
+        return SimpleNamespace(user=core.create_user(email))
+
+    async def signinup(
+        _: str, email: Optional[str], phone_number: Optional[str], __: Dict[str, Any]
+    ):
+        await core.call("signinup")
+        return SimpleNamespace(user=core.create_user(email or phone_number or ""))
+
+    async def create_user_id_mapping(
+        _: Supertokens, user_id: str, external_user_id: str, *__: Any
+    ):
+        await core.call("create_user_id_mapping")
+        if external_user_id in core.mappings.values():
+            return UserIdMappingAlreadyExistsError(False, True)
+        core.mappings[user_id] = external_user_id
+        return CreateUserIdMappingOkResult()
+
+    async def update_user_metadata(
+        user_id: str, metadata: Dict[str, Any], _: Dict[str, Any]
+    ):
+        await core.call("update_user_metadata")
+        core.metadata[user_id] = metadata
+
+    async def add_role_to_user(_: str, user_id: str, role: str, __: Dict[str, Any]):
+        await core.call("add_role_to_user")
+        if role not in core.roles:
+            return UnknownRoleError()
+        core.user_roles.setdefault(user_id, []).append(role)
+        return AddRoleToUserOkResult(False)
+
+    async def create_new_role_or_add_permissions(
+        role: str, _: List[str], __: Dict[str, Any]
+    ):
+        await core.call("create_new_role_or_add_permissions")
+        core.roles.add(role)
+
+    for name, func in [
+        ("sign_up", sign_up),
+        ("get_user_by_email", get_user_by_email),
+        ("manually_create_or_update_user", manually_create_or_update_user),
+        ("signinup", signinup),
+        ("update_user_metadata", update_user_metadata),
+        ("add_role_to_user", add_role_to_user),
+        ("create_new_role_or_add_permissions", create_new_role_or_add_permissions),
+    ]:
+        monkeypatch.setattr(import_users, name, func)
+    monkeypatch.setattr(Supertokens, "create_user_id_mapping", create_user_id_mapping)
+
+    reset(stop_core=False)
+    tools_main.init_supertokens(
+        Namespace(connection_uri="http://localhost:3567", api_key=None)
+    )
+    yield core
+    reset(stop_core=False)
+
+
+def write_rows(path: Path, rows: List[Dict[str, Any]]):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def emailpassword_row(i: int) -> Dict[str, Any]:
+    return {
+        "recipeId": "emailpassword",
+        "user": {"id": f"old-{i}", "email": f"user{i}@example.com"},
+        "password": "password123",
+    }
+
+
+async def test_import_users(fake_core: FakeCore, tmp_path: Path):
+    input_path = tmp_path / "users.jsonl"
+    errors_path = tmp_path / "errors.jsonl"
+    write_rows(
+        input_path,
+        [
+            {
+                **emailpassword_row(0),
+                "metadata": {"name": "Zero"},
+                "roles": ["admin", "editor"],
+                "externalUserId": "external-0",
+            },
+            {
+                "recipeId": "thirdparty",
+                "user": {
+                    "id": "old-1",
+                    "email": "user1@example.com",
+                    "thirdParty": {"id": "google", "user_id": "google-1"},
+                },
+                "metadata": {},
+                "roles": [],
+            },
+            {"recipeId": "passwordless", "user": {"phoneNumber": "+14155552671"}},
+            {"recipeId": "emailpassword", "user": {"email": "user3@example.com"}},
+            {"recipeId": "unknown", "user": {}},
+        ],
+    )
+
+    result = await import_users.import_users(
+        str(input_path), map_source_user_ids=True, errors_path=str(errors_path)
+    )
+
+    assert (result.imported_users, result.failed_users) == (3, 2)
+    # The passwordless user has no id in the input, so it isn't mapped
+    assert fake_core.mappings == {"st-0": "external-0", "st-1": "old-1"}
+    assert fake_core.metadata == {"external-0": {"name": "Zero"}}
+    assert fake_core.user_roles == {"external-0": ["admin", "editor"]}
+    errors = [json.loads(line) for line in errors_path.read_text().splitlines()]
+    assert [e["line"] for e in errors] == [4, 5]
+    assert "password" in errors[0]["error"]
+    assert errors[1]["error"] == "Unsupported recipeId: unknown"
+
+
+async def test_importing_a_row_again_is_safe(fake_core: FakeCore, tmp_path: Path):
+    input_path = tmp_path / "users.jsonl"
+    write_rows(
+        input_path,
+        [{**emailpassword_row(0), "externalUserId": "external-0", "roles": ["a"]}],
+    )
+
+    for _ in range(2):
+        result = await import_users.import_users(str(input_path))
+        assert (result.imported_users, result.failed_users) == (1, 0)
+
+    assert fake_core.mappings == {"st-0": "external-0"}
+    assert fake_core.calls["create_user_id_mapping"] == 1
+    assert fake_core.user_roles == {"external-0": ["a", "a"]}
+
+
+async def test_import_retries_transient_errors(fake_core: FakeCore, tmp_path: Path):
+    input_path = tmp_path / "users.jsonl"
+    write_rows(input_path, [emailpassword_row(0)])
+
+    fake_core.failures_left = 2
+    result = await import_users.import_users(str(input_path), retry_delay_sec=0.001)
+    assert (result.imported_users, result.failed_users) == (1, 0)
+    assert fake_core.calls["sign_up"] == 3
+
+    write_rows(input_path, [emailpassword_row(1)])
+    fake_core.failures_left = 5
+    result = await import_users.import_users(
+        str(input_path), max_retries=1, retry_delay_sec=0.001
+    )
+    assert (result.imported_users, result.failed_users) == (0, 1)
+
+
+async def test_import_concurrency_is_bounded(fake_core: FakeCore, tmp_path: Path):
+    input_path = tmp_path / "users.jsonl"
+    write_rows(input_path, [emailpassword_row(i) for i in range(50)])
+
+    result = await import_users.import_users(str(input_path), concurrency=5)
+
+    assert result.imported_users == 50
+    assert fake_core.max_in_flight == 5
+
+
+async def test_import_is_resumed_from_the_checkpoint(
+    fake_core: FakeCore, tmp_path: Path
+):
+    input_path = tmp_path / "users.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    rows = [emailpassword_row(i) for i in range(30)]
+    rows[5] = {"recipeId": "unknown"}
+    write_rows(input_path, rows)
+
+    class StopImport(Exception):
+        pass
+
+    def stop(processed_rows: int):
+        if processed_rows < 30:
+            raise StopImport()
+
+    with raises(StopImport):
+        await import_users.import_users(
+            str(input_path),
+            concurrency=1,
+            checkpoint_path=str(checkpoint_path),
+            checkpoint_every=10,
+            on_progress=stop,
+        )
+    assert json.loads(checkpoint_path.read_text())["processedRows"] == 10
+
+    result = await import_users.import_users(
+        str(input_path), checkpoint_path=str(checkpoint_path)
+    )
+
+    assert (result.imported_users, result.failed_users) == (29, 1)
+    assert len(fake_core.users_by_email) == 29
+    # The 9 users before the checkpoint were imported only once
+    assert fake_core.calls["sign_up"] == 29
+
+
+async def test_rows_finished_after_the_checkpoint_are_not_counted_twice(
+    fake_core: FakeCore, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    input_path = tmp_path / "users.jsonl"
+    errors_path = tmp_path / "errors.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    rows = [emailpassword_row(i) for i in range(20)]
+    rows[9] = {**rows[9], "user": {**rows[9]["user"], "email": "slow@example.com"}}
+    rows[11] = {
+        **rows[11],
+        "user": {**rows[11]["user"], "email": "slower@example.com"},
+    }
+    rows[12] = {"recipeId": "unknown"}
+    write_rows(input_path, rows)
+    sign_up = import_users.sign_up
+
+    async def slow_sign_up(tenant_id: str, email: str, *args: Any):
+        delays = {"slow@example.com": 0.05, "slower@example.com": 0.2}
+        await asyncio.sleep(delays.get(email, 0))
+        return await sign_up(tenant_id, email, *args)
+
+    monkeypatch.setattr(import_users, "sign_up", slow_sign_up)
+
+    class StopImport(Exception):
+        pass
+
+    def stop(_: int):
+        raise StopImport()
+
+    # Row 12 fails while row 11 is still being imported, after the checkpoint
+    with raises(StopImport):
+        await import_users.import_users(
+            str(input_path),
+            concurrency=5,
+            errors_path=str(errors_path),
+            checkpoint_path=str(checkpoint_path),
+            checkpoint_every=10,
+            on_progress=stop,
+        )
+    assert json.loads(checkpoint_path.read_text())["processedRows"] == 11
+
+    result = await import_users.import_users(
+        str(input_path),
+        errors_path=str(errors_path),
+        checkpoint_path=str(checkpoint_path),
+    )
+
+    assert (result.imported_users, result.failed_users) == (19, 1)
+    errors = [json.loads(line) for line in errors_path.read_text().splitlines()]
+    assert [e["line"] for e in errors] == [13]
+
+
+async def test_rate_limiter():
+    limiter = import_users.RateLimiter(100)
+    start = time.monotonic()
+    for _ in range(120):
+        await limiter.acquire()
+    # The first 100 are let through right away, and the rest at 100 per second
+    assert 0.15 < time.monotonic() - start < 0.5
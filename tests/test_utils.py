@@ -1,14 +1,22 @@
-from typing import Union, List, Any, Dict
+from typing import Iterator, Union, List, Any, Dict
 
+import asyncio
 import pytest
 import threading
+import weakref
 
 from supertokens_python.utils import (
     humanize_time,
     is_version_gte,
     get_top_level_domain_for_same_site_resolution,
+    get_tld_extractor,
+)
+from supertokens_python.utils import (
+    RWMutex,
+    TTLCache,
+    for_each_with_concurrency,
+    map_with_concurrency,
 )
-from supertokens_python.utils import RWMutex
 
 from tests.utils import is_subset
 
@@ -197,3 +205,131 @@ def test_rw_mutex_writes():
 )
 def test_tld_for_same_site(url: str, res: str):
     assert get_top_level_domain_for_same_site_resolution(url) == res
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries():
+    cache: TTLCache[str, int] = TTLCache(ttl_ms=1000, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.set("a", 1, ttl_ms=-1)
+    assert cache.get("a") is None
+    assert cache.hits == 3
+    assert cache.misses == 2
+
+
+def test_tld_extractor_only_uses_bundled_suffix_list():
+    extractor = get_tld_extractor()
+    assert extractor is get_tld_extractor()
+    assert not extractor.suffix_list_urls
+    assert not extractor._cache.enabled  # pylint: disable=protected-access
+    assert extractor("api.example.co.uk").registered_domain == "example.co.uk"
+    assert extractor("foo.vercel.app").registered_domain == "foo.vercel.app"
+
+
+@pytest.mark.asyncio
+async def test_map_with_concurrency_reads_items_lazily_and_keeps_their_order():
+    read: List[int] = []
+    in_flight = 0
+
+    def items() -> Iterator[int]:
+        for i in range(10):
+            read.append(i)
+            yield i
+
+    async def double(i: int) -> int:
+        nonlocal in_flight
+        # Items are only read when there's room for them (plus one waiting for room)
+        assert len(read) - i <= 4
+        in_flight += 1
+        assert in_flight <= 3
+        await asyncio.sleep(0.01 if i % 2 else 0.001)
+        in_flight -= 1
+        return i * 2
+
+    assert await map_with_concurrency(double, items(), 3) == [
+        i * 2 for i in range(10)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_map_with_concurrency_stops_at_the_first_error():
+    read: List[int] = []
+
+    def items() -> Iterator[int]:
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    async def fail_on_five(i: int) -> int:
+        await asyncio.sleep(0.001)
+        if i == 5:
+            raise ValueError("five")
+        return i
+
+    with pytest.raises(ValueError, match="five"):
+        await map_with_concurrency(fail_on_five, items(), 3)
+    assert len(read) < 10
+
+
+@pytest.mark.asyncio
+async def test_for_each_with_concurrency_only_keeps_the_calls_in_flight():
+    class Result:
+        pass
+
+    read = 0
+    done = 0
+    results: "weakref.WeakSet[Result]" = weakref.WeakSet()
+    max_results = 0
+    max_tasks = 0
+
+    def items() -> Iterator[int]:
+        nonlocal read
+        for i in range(10000):
+            read += 1
+            yield i
+
+    async def count(i: int) -> Result:
+        nonlocal done, max_results, max_tasks
+        max_results = max(max_results, len(results))
+        max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+        # Items are only read when there's room for them (plus one waiting for room)
+        assert read - done <= 4
+        await asyncio.sleep(0 if i % 2 else 0.0001)
+        done += 1
+        result = Result()
+        results.add(result)
+        return result
+
+    await for_each_with_concurrency(count, items(), 3)
+
+    assert done == 10000
+    # The calls in flight, plus the test itself
+    assert max_tasks <= 4
+    # The finished calls (and their results) are dropped
+    assert max_results <= 3
+
+
+@pytest.mark.asyncio
+async def test_for_each_with_concurrency_stops_at_the_first_error():
+    read: List[int] = []
+
+    def items() -> Iterator[int]:
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    async def fail_on_five(i: int) -> None:
+        await asyncio.sleep(0.001)
+        if i == 5:
+            raise ValueError("five")
+
+    with pytest.raises(ValueError, match="five"):
+        await for_each_with_concurrency(fail_on_five, items(), 3)
+    assert len(read) < 10
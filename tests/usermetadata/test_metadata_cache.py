@@ -0,0 +1,157 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from typing import Any, Iterator, Optional
+
+import httpx
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import querier as querier_module
+from supertokens_python.recipe import usermetadata
+from supertokens_python.recipe.usermetadata import MetadataCacheConfig
+from supertokens_python.recipe.usermetadata.asyncio import (
+    clear_user_metadata,
+    get_user_metadata,
+    update_user_metadata,
+)
+from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
+from supertokens_python.recipe.usermetadata.recipe_implementation import (
+    RecipeImplementation,
+)
+from tests.benchmarks.mock_core import MockCore
+from tests.utils import reset
+
+
+@fixture
+def mock_core(monkeypatch: MonkeyPatch) -> Iterator[MockCore]:
+    core = MockCore()
+
+    def create_client(**kwargs: Any) -> httpx.AsyncClient:
+        transport = httpx.ASGITransport(app=core)  # type: ignore
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    monkeypatch.setattr(querier_module, "AsyncClient", create_client)
+    yield core
+    reset(stop_core=False)
+
+
+def init_usermetadata(metadata_cache: Optional[MetadataCacheConfig]):
+    reset(stop_core=False)
+    init(
+        supertokens_config=SupertokensConfig("http://mock-core"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[usermetadata.init(metadata_cache=metadata_cache)],
+    )
+
+
+def get_recipe_implementation() -> RecipeImplementation:
+    recipe_implementation = UserMetadataRecipe.get_instance().recipe_implementation
+    assert isinstance(recipe_implementation, RecipeImplementation)
+    return recipe_implementation
+
+
+@mark.asyncio
+async def test_metadata_is_cached_and_updated_by_writes(mock_core: MockCore):
+    init_usermetadata(MetadataCacheConfig())
+
+    assert (await get_user_metadata("user1")).metadata == {}
+    metadata = (await get_user_metadata("user1")).metadata
+    # Changes to the result are not cached
+    metadata["name"] = "Jane"
+
+    await update_user_metadata("user1", {"name": "John", "age": 30})
+    assert (await get_user_metadata("user1")).metadata == {"name": "John", "age": 30}
+    await update_user_metadata("user1", {"age": None})
+    assert (await get_user_metadata("user1")).metadata == {"name": "John"}
+
+    await clear_user_metadata("user1")
+    assert (await get_user_metadata("user1")).metadata == {}
+    assert (await get_user_metadata("user1")).metadata == {}
+
+    assert mock_core.request_counts["GET /recipe/user/metadata"] == 2
+    metadata_cache = get_recipe_implementation().metadata_cache
+    assert metadata_cache is not None
+    assert (metadata_cache.hits, metadata_cache.misses) == (4, 2)
+
+
+@mark.asyncio
+async def test_read_started_before_an_update_does_not_cache_old_metadata(
+    mock_core: MockCore, monkeypatch: MonkeyPatch
+):
+    init_usermetadata(MetadataCacheConfig())
+    querier = get_recipe_implementation().querier
+    send_get_request = querier.send_get_request
+
+    async def send_get_request_racing_an_update(*args: Any, **kwargs: Any):
+        response = await send_get_request(*args, **kwargs)
+        await update_user_metadata("user1", {"name": "Jane"})
+        return response
+
+    monkeypatch.setattr(querier, "send_get_request", send_get_request_racing_an_update)
+    assert (await get_user_metadata("user1")).metadata == {}
+    monkeypatch.setattr(querier, "send_get_request", send_get_request)
+
+    assert (await get_user_metadata("user1")).metadata == {"name": "Jane"}
+    assert mock_core.request_counts["GET /recipe/user/metadata"] == 1
+
+
+@mark.asyncio
+async def test_concurrent_reads_of_different_users_are_all_cached(
+    mock_core: MockCore, monkeypatch: MonkeyPatch
+):
+    init_usermetadata(MetadataCacheConfig())
+    querier = get_recipe_implementation().querier
+    send_get_request = querier.send_get_request
+    reads_started = 0
+    both_reads_started = asyncio.Event()
+
+    async def send_get_request_concurrently(*args: Any, **kwargs: Any):
+        nonlocal reads_started
+        reads_started += 1
+        if reads_started == 2:
+            both_reads_started.set()
+        await both_reads_started.wait()
+        return await send_get_request(*args, **kwargs)
+
+    monkeypatch.setattr(querier, "send_get_request", send_get_request_concurrently)
+    await asyncio.gather(get_user_metadata("user1"), get_user_metadata("user2"))
+    await get_user_metadata("user1")
+    await get_user_metadata("user2")
+
+    assert mock_core.request_counts["GET /recipe/user/metadata"] == 2
+
+
+@mark.asyncio
+async def test_metadata_is_not_cached_by_default(mock_core: MockCore):
+    init_usermetadata(None)
+
+    await get_user_metadata("user1")
+    await get_user_metadata("user1")
+
+    assert mock_core.request_counts["GET /recipe/user/metadata"] == 2
+    assert get_recipe_implementation().metadata_cache is None
+
+
+def test_metadata_cache_config_is_validated():
+    with raises(ValueError):
+        MetadataCacheConfig(ttl_sec=0)
+    with raises(ValueError):
+        MetadataCacheConfig(max_size=-1)
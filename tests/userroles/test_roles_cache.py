@@ -0,0 +1,131 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from typing import Any, Iterator, Optional
+
+import httpx
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import querier as querier_module
+from supertokens_python.recipe import session, userroles
+from supertokens_python.recipe.userroles import (
+    PermissionClaim,
+    RolesCacheConfig,
+    UserRoleClaim,
+)
+from supertokens_python.recipe.userroles.asyncio import (
+    add_role_to_user,
+    create_new_role_or_add_permissions,
+    delete_role,
+    get_roles_for_user,
+    remove_user_role,
+)
+from supertokens_python.recipe.userroles.recipe import UserRolesRecipe
+from supertokens_python.recipe.userroles.recipe_implementation import (
+    RecipeImplementation,
+)
+from tests.benchmarks.mock_core import MockCore
+from tests.utils import reset
+
+
+@fixture
+def mock_core(monkeypatch: MonkeyPatch) -> Iterator[MockCore]:
+    core = MockCore()
+
+    def create_client(**kwargs: Any) -> httpx.AsyncClient:
+        transport = httpx.ASGITransport(app=core)  # type: ignore
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    monkeypatch.setattr(querier_module, "AsyncClient", create_client)
+    yield core
+    reset(stop_core=False)
+
+
+def init_userroles(roles_cache: Optional[RolesCacheConfig]):
+    reset(stop_core=False)
+    init(
+        supertokens_config=SupertokensConfig("http://mock-core"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="http://api.example.com",
+            website_domain="http://example.com",
+        ),
+        framework="fastapi",
+        recipe_list=[session.init(), userroles.init(roles_cache=roles_cache)],
+    )
+
+
+def get_recipe_implementation() -> RecipeImplementation:
+    recipe_implementation = UserRolesRecipe.get_instance().recipe_implementation
+    assert isinstance(recipe_implementation, RecipeImplementation)
+    return recipe_implementation
+
+
+@mark.asyncio
+async def test_roles_are_cached_for_both_claims(mock_core: MockCore):
+    init_userroles(RolesCacheConfig())
+    await create_new_role_or_add_permissions("admin", ["write"])
+    await add_role_to_user("public", "user1", "admin")
+
+    assert await UserRoleClaim.fetch_value("user1", "public", {}) == ["admin"]
+    assert await PermissionClaim.fetch_value("user1", "public", {}) == ["write"]
+    assert await UserRoleClaim.fetch_value("user1", "public", {}) == ["admin"]
+    # The roles are cached per tenant
+    assert await UserRoleClaim.fetch_value("user1", "tenant1", {}) == []
+
+    assert mock_core.request_counts["GET /recipe/user/roles"] == 2
+    roles_cache = get_recipe_implementation().roles_cache
+    assert roles_cache is not None
+    assert (roles_cache.hits, roles_cache.misses) == (2, 2)
+
+
+@mark.asyncio
+async def test_roles_cache_is_invalidated_by_role_changes(mock_core: MockCore):
+    init_userroles(RolesCacheConfig())
+    await create_new_role_or_add_permissions("admin", [])
+    await create_new_role_or_add_permissions("editor", [])
+
+    assert (await get_roles_for_user("public", "user1")).roles == []
+    await add_role_to_user("public", "user1", "admin")
+    assert (await get_roles_for_user("public", "user1")).roles == ["admin"]
+
+    await add_role_to_user("public", "user1", "editor")
+    await remove_user_role("public", "user1", "admin")
+    assert (await get_roles_for_user("public", "user1")).roles == ["editor"]
+
+    # Any user may have had the deleted role
+    assert (await get_roles_for_user("public", "user2")).roles == []
+    await delete_role("editor")
+    assert (await get_roles_for_user("public", "user1")).roles == []
+
+    assert mock_core.request_counts["GET /recipe/user/roles"] == 5
+
+
+@mark.asyncio
+async def test_roles_are_not_cached_by_default(mock_core: MockCore):
+    init_userroles(None)
+
+    await get_roles_for_user("public", "user1")
+    await get_roles_for_user("public", "user1")
+
+    assert mock_core.request_counts["GET /recipe/user/roles"] == 2
+    assert get_recipe_implementation().roles_cache is None
+
+
+def test_roles_cache_config_is_validated():
+    with raises(ValueError):
+        RolesCacheConfig(ttl_sec=0)
+    with raises(ValueError):
+        RolesCacheConfig(max_size=0)